@@ -8,17 +8,150 @@ Architecture:
 """
 
 import asyncio
+import base64
+import copy
+import functools
+import io
+import re
 import time
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set, Tuple, Callable
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from PIL import Image
 import aiohttp
+import orjson
+
+# OpenCV links libjpeg-turbo (NEON on the Pi) and encodes several times
+# faster than stock Pillow; fall back to Pillow when it isn't installed.
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+JPEG_QUALITY = 80
+
+# Frames within this many dHash bits of the last analyzed frame reuse the
+# previous scene instead of paying for another VLM call.
+DHASH_SKIP_DISTANCE = 5
+
+# Recent personality responses kept for identical (input, scene) requests
+RESPONSE_CACHE_SIZE = 64
+
+# Parsed VLM replies memoized by exact text (repeated replies for a static
+# scene skip JSON parsing)
+SCENE_PARSE_CACHE_SIZE = 256
+
+# Personality requests arriving within this window are sent together so the
+# server (vLLM continuous batching) sees them in flight at the same time.
+LLM_BATCH_MAX = 8
+LLM_BATCH_WINDOW = 0.025  # seconds
+
+# Personality calls are interactive, so they get a tighter deadline than the
+# session-wide timeout that bounds VLM calls.
+LLM_TIMEOUT = 5.0  # seconds
+
+# Structured prompt for VLM
+SCENE_PROMPT = """Analyze this image from a robot's perspective and respond with JSON:
+{
+  "objects": [{"name": "...", "position": "left/center/right", "distance": "near/far", "confidence": 0.0-1.0}],
+  "scene_type": "indoor/outdoor/kitchen/living_room/...",
+  "obstacles": ["obstacle1", "obstacle2"],
+  "people_count": 0,
+  "safe_directions": ["left", "forward", "right"],
+  "description": "Brief description of scene",
+  "confidence": 0.0-1.0
+}
+
+Be concise and focus on navigation-relevant information."""
+
+# Models sometimes wrap their JSON in a markdown code fence
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
+# Placeholder for the image URL in the VLM payload; the serialized body is
+# split on it and the base64 bytes are spliced in between.
+_IMAGE_URL_SENTINEL = "\x00image_url\x00"
+_IMAGE_URL_SENTINEL_JSON = orjson.dumps(_IMAGE_URL_SENTINEL)
+
+# Per-request headers for JSON bodies. Content-Type is not a session default
+# because multipart uploads need their own boundary header.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Structured-output schemas mirroring SceneUnderstanding / PersonalityResponse.
+# OpenAI-compatible servers (vLLM, LiteLLM) then return raw JSON with no
+# Markdown fences to strip.
+SCENE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "scene_understanding",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "objects": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "position": {"type": "string", "enum": ["left", "center", "right"]},
+                            "distance": {"type": "string", "enum": ["near", "far"]},
+                            "confidence": {"type": "number"}
+                        },
+                        "required": ["name", "position", "distance", "confidence"]
+                    }
+                },
+                "scene_type": {"type": "string"},
+                "obstacles": {"type": "array", "items": {"type": "string"}},
+                "people_count": {"type": "integer"},
+                "safe_directions": {"type": "array", "items": {"type": "string"}},
+                "description": {"type": "string"},
+                "confidence": {"type": "number"}
+            },
+            "required": [
+                "objects", "scene_type", "obstacles", "people_count",
+                "safe_directions", "description", "confidence"
+            ]
+        }
+    }
+}
+
+PERSONALITY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "personality_response",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "text": {"type": "string"},
+                "emotion": {"type": "string"},
+                "action_suggested": {"type": ["string", "null"]}
+            },
+            "required": ["text", "emotion"]
+        }
+    }
+}
+
+
+def _dhash(frame) -> int:
+    """Compute a 64-bit difference hash of an RGB frame."""
+    if isinstance(frame, np.ndarray):
+        if cv2 is not None:
+            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+            small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        else:
+            small = np.asarray(Image.fromarray(frame).convert('L').resize((9, 8)))
+    else:
+        small = np.asarray(frame.convert('L').resize((9, 8)))
+
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
 
 
 @dataclass
@@ -53,7 +186,13 @@ class AsyncRobotBrain:
         llm_model: str,
         api_key: str,
         personality: str = "friendly",
-        vlm_interval: float = 3.0
+        vlm_interval: float = 3.0,
+        vlm_input_w: int = 512,
+        vlm_input_h: int = 512,
+        vlm_supports_multipart: bool = False,
+        vlm_multipart_url: Optional[str] = None,
+        llm_batch_max: int = LLM_BATCH_MAX,
+        llm_batch_window: float = LLM_BATCH_WINDOW
     ):
         """
         Initialize async robot brain.
@@ -66,6 +205,13 @@ class AsyncRobotBrain:
             api_key: API key for both
             personality: Robot personality type
             vlm_interval: Seconds between VLM calls
+            vlm_input_w: Width frames are downscaled to before upload
+            vlm_input_h: Height frames are downscaled to before upload
+            vlm_supports_multipart: Upload raw JPEG as multipart/form-data
+                instead of base64 JSON (server must accept it)
+            vlm_multipart_url: Multipart endpoint (default: the chat completions URL)
+            llm_batch_max: Max personality requests per micro-batch (1 = no batching)
+            llm_batch_window: Seconds to wait for more requests to join a batch
         """
         self.vlm_url = vlm_url
         self.vlm_model = vlm_model
@@ -74,24 +220,53 @@ class AsyncRobotBrain:
         self.api_key = api_key
         self.personality = personality
         self.vlm_interval = vlm_interval
+        self.vlm_input_w = vlm_input_w
+        self.vlm_input_h = vlm_input_h
+        self.vlm_supports_multipart = vlm_supports_multipart
+        self.vlm_multipart_url = vlm_multipart_url or f"{vlm_url}/chat/completions"
+        self.llm_batch_max = llm_batch_max
+        self.llm_batch_window = llm_batch_window
+
+        # VLM request body around the image URL, serialized once
+        self._vlm_body_prefix, self._vlm_body_suffix = self._vlm_body_template()
 
         # State
         self.running = False
         self.current_frame: Optional[np.ndarray] = None
+        # Double-buffered frame slabs: update_frame copies into the idle one
+        # and swaps the reference, so readers never see a half-written frame
+        self._frame_slabs: List[np.ndarray] = []
+        self._frame_slab_idx = 0
         self.latest_scene: Optional[SceneUnderstanding] = None
+        self.scene_callback: Optional[Callable[[SceneUnderstanding], None]] = None
+        self._scene_event = threading.Event()  # set on each new scene
+        self._last_frame_hash: Optional[int] = None
 
         # Async components
         self.session: Optional[aiohttp.ClientSession] = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.thread: Optional[threading.Thread] = None
+        self._main_task: Optional[asyncio.Task] = None
+        self._ready = threading.Event()  # loop running and session open
+        self._stop_event: Optional[asyncio.Event] = None  # created on the loop
+        self._encode_pool: Optional[ThreadPoolExecutor] = None
+        self._jpeg_local = threading.local()  # per-worker reusable BytesIO
 
         # Queues
         self.scene_queue = queue.Queue(maxsize=5)
         self.response_queue = queue.Queue(maxsize=10)
 
+        # Personality response cache + in-flight requests, keyed by
+        # (normalized input, scene timestamp). Only touched on the loop thread.
+        self._resp_cache: "OrderedDict[Tuple, PersonalityResponse]" = OrderedDict()
+        self._resp_pending: Dict[Tuple, asyncio.Future] = {}
+        self._llm_batch_queue: Optional[asyncio.Queue] = None
+        self._llm_batch_runs: Set[asyncio.Task] = set()  # dispatched, not yet resolved
+
         # Stats
         self.vlm_calls = 0
         self.llm_calls = 0
+        self.vlm_skipped = 0
 
     def start(self):
         """Start async processing."""
@@ -100,12 +275,58 @@ class AsyncRobotBrain:
 
         self.running = True
 
-        # Start event loop in background thread
+        # JPEG encoding runs off the event loop (PIL releases the GIL)
+        self._encode_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Start event loop in background thread, and return once it can
+        # take requests
+        self._ready.clear()
         self.thread = threading.Thread(target=self._run_event_loop, daemon=True)
         self.thread.start()
+        self._ready.wait(timeout=5.0)
 
         print("[AsyncBrain] Started with async API calls")
 
+    async def start_async(self):
+        """
+        Start async processing on the caller's event loop.
+
+        Async callers should use this with get_personality_response_async()
+        to skip the background thread and the cross-thread handoff per call.
+        """
+        if self.running:
+            return
+
+        self.running = True
+        self.loop = asyncio.get_running_loop()
+        self._encode_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Open the session before returning so requests can go out immediately
+        self.session = self._make_session()
+        self._main_task = asyncio.create_task(self._async_main(self.session))
+
+        print("[AsyncBrain] Started on caller's event loop")
+
+    async def stop_async(self):
+        """Stop processing started with start_async()."""
+        if not self.running:
+            return
+
+        self.running = False
+        if self._stop_event:
+            self._stop_event.set()
+
+        if self._main_task:
+            await self._main_task
+            self._main_task = None
+
+        if self._encode_pool:
+            self._encode_pool.shutdown(wait=False)
+            self._encode_pool = None
+
+        self.loop = None
+        print("[AsyncBrain] Stopped")
+
     def stop(self):
         """Stop async processing."""
         if not self.running:
@@ -114,11 +335,18 @@ class AsyncRobotBrain:
         self.running = False
 
         if self.loop:
-            asyncio.run_coroutine_threadsafe(self._cleanup(), self.loop)
+            # _async_main drains in-flight work, then its async with
+            # closes the session before the loop exits
+            if self._stop_event:
+                self.loop.call_soon_threadsafe(self._stop_event.set)
 
         if self.thread:
             self.thread.join(timeout=5.0)
 
+        if self._encode_pool:
+            self._encode_pool.shutdown(wait=False)
+            self._encode_pool = None
+
         print("[AsyncBrain] Stopped")
 
     def _run_event_loop(self):
@@ -129,20 +357,71 @@ class AsyncRobotBrain:
         # Run main coroutine
         self.loop.run_until_complete(self._async_main())
 
-    async def _async_main(self):
-        """Main async coroutine."""
-        async with aiohttp.ClientSession() as session:
+    def _make_session(self) -> aiohttp.ClientSession:
+        """Create the pooled HTTP session (must run on the target loop)."""
+        # One pooled session for the lifetime of the brain, tuned for the
+        # two hosts we talk to (VLM + LLM) so keep-alive connections are
+        # reused instead of paying a TCP/TLS handshake per call.
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            # Set once here rather than building a ClientTimeout per request
+            timeout=aiohttp.ClientTimeout(total=10, connect=2, sock_read=8),
+            headers=headers
+        )
+
+    async def _async_main(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Main async coroutine.
+
+        Args:
+            session: Already-open session to use (created here if None)
+        """
+        async with session or self._make_session() as session:
             self.session = session
+            self._ready.set()
 
-            # Start periodic vision processing
+            # Start periodic vision processing and the LLM batcher
+            batch_task = None
+            if self.llm_batch_max > 1:
+                self._llm_batch_queue = asyncio.Queue()
+                batch_task = asyncio.create_task(self._llm_batch_worker())
             vision_task = asyncio.create_task(self._vision_loop())
 
-            # Wait until stopped
-            while self.running:
-                await asyncio.sleep(0.1)
+            # Wait until stopped (stop() may have run before the event existed)
+            self._stop_event = asyncio.Event()
+            if not self.running:
+                self._stop_event.set()
+            await self._stop_event.wait()
+            self._stop_event = None
 
             # Cancel tasks
             vision_task.cancel()
+            if batch_task:
+                batch_task.cancel()
+                try:
+                    await batch_task
+                except asyncio.CancelledError:
+                    pass
+
+                # Requests still queued were never collected into a batch
+                queued = []
+                while not self._llm_batch_queue.empty():
+                    queued.append(self._llm_batch_queue.get_nowait())
+                self._fail_llm_batch(queued)
+            self._llm_batch_queue = None
+
+            # Batches already dispatched still need the session
+            if self._llm_batch_runs:
+                await asyncio.gather(*self._llm_batch_runs, return_exceptions=True)
 
     async def _vision_loop(self):
         """Periodic vision processing with VLM."""
@@ -150,17 +429,38 @@ class AsyncRobotBrain:
 
         while self.running:
             try:
-                if self.current_frame is not None:
+                frame = self.current_frame
+                if frame is not None:
+                    # The camera thread keeps rewriting the slabs; snapshot
+                    # once here so the hash and the (queued) JPEG encode see
+                    # one frame
+                    if isinstance(frame, np.ndarray):
+                        frame = frame.copy()
+
+                    # Skip the VLM when the scene hasn't visibly changed
+                    frame_hash = _dhash(frame)
+                    if (self.latest_scene is not None and
+                            self._last_frame_hash is not None and
+                            bin(frame_hash ^ self._last_frame_hash).count('1') < DHASH_SKIP_DISTANCE):
+                        self.vlm_skipped += 1
+                        await asyncio.sleep(self.vlm_interval)
+                        continue
+
                     # Call VLM asynchronously
-                    scene = await self._analyze_scene_async(self.current_frame)
+                    scene = await self._analyze_scene_async(frame)
 
                     if scene:
+                        self._last_frame_hash = frame_hash
                         self.latest_scene = scene
+                        self._scene_event.set()
                         try:
                             self.scene_queue.put_nowait(scene)
                         except queue.Full:
                             pass  # Drop old scene data
 
+                        if self.scene_callback:
+                            self.scene_callback(scene)
+
                         print(f"[AsyncBrain] Scene: {scene.scene_type}, "
                               f"objects: {len(scene.objects)}, "
                               f"people: {scene.people_count}")
@@ -187,67 +487,27 @@ class AsyncRobotBrain:
             Structured scene understanding
         """
         try:
-            # Convert frame to base64
-            if isinstance(frame, np.ndarray):
-                img = Image.fromarray(frame)
+            if self.vlm_supports_multipart:
+                # Raw JPEG part: no base64 inflation or JSON escaping
+                jpeg = await self.loop.run_in_executor(
+                    self._encode_pool,
+                    functools.partial(self._encode_frame_jpeg, frame, raw=True)
+                )
+                data = aiohttp.FormData()
+                data.add_field('image', jpeg, content_type='image/jpeg', filename='frame.jpg')
+                data.add_field('prompt', SCENE_PROMPT)
+                data.add_field('model', self.vlm_model)
+                url = self.vlm_multipart_url
+                headers = None
             else:
-                img = frame
-
-            import io
-            import base64
-            buffer = io.BytesIO()
-            img.save(buffer, format='JPEG')
-            img_b64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-
-            # Structured prompt for VLM
-            prompt = """Analyze this image from a robot's perspective and respond with JSON:
-{
-  "objects": [{"name": "...", "position": "left/center/right", "distance": "near/far", "confidence": 0.0-1.0}],
-  "scene_type": "indoor/outdoor/kitchen/living_room/...",
-  "obstacles": ["obstacle1", "obstacle2"],
-  "people_count": 0,
-  "safe_directions": ["left", "forward", "right"],
-  "description": "Brief description of scene",
-  "confidence": 0.0-1.0
-}
+                data = await self._build_vlm_body(frame)
+                url = f"{self.vlm_url}/chat/completions"
+                headers = _JSON_HEADERS
 
-Be concise and focus on navigation-relevant information."""
-
-            # API payload
-            payload = {
-                "model": self.vlm_model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/jpeg;base64,{img_b64}"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                "max_tokens": 500,
-                "temperature": 0.3  # Low temp for structured output
-            }
-
-            # Async API call
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-
-            async with self.session.post(
-                f"{self.vlm_url}/chat/completions",
-                json=payload,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
+            # Async API call (auth headers are set on the session)
+            async with self.session.post(url, data=data, headers=headers) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = orjson.loads(await response.read())
                     content = result['choices'][0]['message']['content']
 
                     # Parse JSON response
@@ -263,29 +523,161 @@ Be concise and focus on navigation-relevant information."""
             print(f"[AsyncBrain] Scene analysis error: {e}")
             return None
 
-    def _parse_scene_json(self, content: str) -> SceneUnderstanding:
-        """Parse VLM JSON response into structured data."""
-        try:
-            # Extract JSON from markdown code blocks if present
-            if '```json' in content:
-                content = content.split('```json')[1].split('```')[0].strip()
-            elif '```' in content:
-                content = content.split('```')[1].split('```')[0].strip()
+    async def _build_vlm_body(self, frame) -> bytes:
+        """
+        Build the chat-completions JSON body for a frame.
 
-            data = json.loads(content)
+        Args:
+            frame: Camera frame
 
-            return SceneUnderstanding(
-                timestamp=time.time(),
-                objects=data.get('objects', []),
-                scene_type=data.get('scene_type', 'unknown'),
-                obstacles=data.get('obstacles', []),
-                people_count=data.get('people_count', 0),
-                safe_directions=data.get('safe_directions', []),
-                description=data.get('description', ''),
-                confidence=data.get('confidence', 0.5)
+        Returns:
+            Serialized request body
+        """
+        # Encode frame to base64 JPEG bytes in the worker pool
+        img_b64 = await self.loop.run_in_executor(
+            self._encode_pool, self._encode_frame_jpeg, frame
+        )
+
+        # Only the image varies per call; the rest of the body is pre-serialized
+        return b''.join((self._vlm_body_prefix, img_b64, self._vlm_body_suffix))
+
+    def _vlm_body_template(self) -> Tuple[bytes, bytes]:
+        """
+        Serialize the VLM payload once, split around the image URL.
+
+        Returns:
+            (prefix, suffix) bytes; the base64 image goes between them
+        """
+        # API payload
+        payload = {
+            "model": self.vlm_model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": SCENE_PROMPT},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": _IMAGE_URL_SENTINEL
+                            }
+                        }
+                    ]
+                }
+            ],
+            "max_tokens": 500,
+            "temperature": 0.3,  # Low temp for structured output
+            "response_format": SCENE_RESPONSE_FORMAT
+        }
+
+        prefix, suffix = orjson.dumps(payload).split(_IMAGE_URL_SENTINEL_JSON)
+        return prefix + b'"data:image/jpeg;base64,', b'"' + suffix
+
+    def _downscale_frame(self, frame):
+        """
+        Shrink a frame to the VLM input size.
+
+        VLMs resize internally to ~336-448px, so anything larger is wasted
+        JPEG work, base64 expansion and Wi-Fi bandwidth.
+        """
+        size = (self.vlm_input_w, self.vlm_input_h)
+
+        if isinstance(frame, np.ndarray):
+            h, w = frame.shape[:2]
+            if w <= size[0] and h <= size[1]:
+                return frame
+            if cv2 is not None:
+                return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            frame = Image.fromarray(frame)
+
+        if frame.width <= size[0] and frame.height <= size[1]:
+            return frame
+        return frame.resize(size, Image.BILINEAR)
+
+    def _encode_frame_jpeg(self, frame, raw: bool = False) -> bytes:
+        """
+        Encode a camera frame as base64 JPEG (ASCII bytes).
+
+        Runs in the encode thread pool, not on the event loop.
+
+        Args:
+            frame: Camera frame (numpy array or PIL Image)
+            raw: Return the JPEG bytes themselves instead of base64
+
+        Returns:
+            Base64 encoded JPEG (or raw JPEG bytes)
+        """
+        frame = self._downscale_frame(frame)
+
+        if cv2 is not None and isinstance(frame, np.ndarray):
+            # Frames are RGB, OpenCV expects BGR. Encoding straight from the
+            # ndarray skips building a PIL Image per frame.
+            bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+            ok, jpeg = cv2.imencode(
+                '.jpg', bgr, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY]
             )
+            if ok:
+                return jpeg.tobytes() if raw else base64.b64encode(jpeg)
+
+        # Fallback: no OpenCV, or the caller handed us a PIL Image
+        if isinstance(frame, np.ndarray):
+            img = Image.fromarray(frame)
+        else:
+            img = frame
+
+        # Reuse one BytesIO per encode worker instead of allocating per frame
+        buffer = getattr(self._jpeg_local, 'buf', None)
+        if buffer is None:
+            buffer = self._jpeg_local.buf = io.BytesIO()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+        img.save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=False)
+        # Zero-copy view; released before the next truncate
+        with buffer.getbuffer() as view:
+            return bytes(view) if raw else base64.b64encode(view)
+
+    @staticmethod
+    def _loads_model_json(content: str) -> Any:
+        """Parse model output as JSON, unwrapping a markdown fence if needed."""
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            match = _FENCE_RE.search(content)
+            if match is None:
+                raise
+            return orjson.loads(match.group(1))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=SCENE_PARSE_CACHE_SIZE)
+    def _scene_fields(content: str) -> Dict[str, Any]:
+        """Scene fields parsed from a VLM reply (memoized, treat as read-only)."""
+        data = AsyncRobotBrain._loads_model_json(content)
+        return {
+            'objects': data.get('objects', []),
+            'scene_type': data.get('scene_type', 'unknown'),
+            'obstacles': data.get('obstacles', []),
+            'people_count': data.get('people_count', 0),
+            'safe_directions': data.get('safe_directions', []),
+            'description': data.get('description', ''),
+            'confidence': data.get('confidence', 0.5)
+        }
 
-        except json.JSONDecodeError as e:
+    def clear_parse_cache(self):
+        """Drop memoized scene parses (e.g. to measure cold parse time)."""
+        self._scene_fields.cache_clear()
+
+    def _parse_scene_json(self, content: str) -> SceneUnderstanding:
+        """Parse VLM JSON response into structured data."""
+        try:
+            # Parsing is memoized; the timestamp is always fresh, and each
+            # scene gets its own lists so callers can't mutate the cache
+            fields = dict(self._scene_fields(content))
+            for name in ('objects', 'obstacles', 'safe_directions'):
+                fields[name] = copy.deepcopy(fields[name])
+            return SceneUnderstanding(timestamp=time.time(), **fields)
+
+        except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
             print(f"[AsyncBrain] JSON parse error: {e}")
             # Fallback: use raw text as description
             return SceneUnderstanding(
@@ -314,22 +706,176 @@ Be concise and focus on navigation-relevant information."""
         Returns:
             Personality response with emotion and suggested action
         """
+        key = (
+            user_input.strip().lower(),
+            None if scene_context is None else int(scene_context.timestamp)
+        )
+
+        # No await between lookup and insert, so this is atomic on the loop
+        cached = self._resp_cache.get(key)
+        if cached is not None:
+            self._resp_cache.move_to_end(key)
+            return cached
+
+        # Coalesce with an identical request that is already in flight
+        pending = self._resp_pending.get(key)
+        if pending is None:
+            pending = self._submit_personality_request(user_input, scene_context)
+            pending.add_done_callback(
+                functools.partial(self._cache_personality_response, key)
+            )
+            self._resp_pending[key] = pending
+
         try:
-            # Build context
-            context_parts = [
-                f"You are a {self.personality} robot assistant.",
-                f"Current scene: {scene_context.description if scene_context else 'Unknown'}",
-            ]
+            response_data = await asyncio.shield(pending)
+        except Exception as e:
+            print(f"[AsyncBrain] Personality response error: {e}")
+            return PersonalityResponse(
+                text="Sorry, I encountered an error.",
+                emotion="concerned"
+            )
+
+        if response_data is None:
+            return PersonalityResponse(
+                text="I'm having trouble thinking right now.",
+                emotion="confused"
+            )
+
+        return response_data
+
+    async def get_personality_responses_batch_async(
+        self,
+        user_inputs: List[str],
+        scene_context: Optional[SceneUnderstanding] = None
+    ) -> List[PersonalityResponse]:
+        """
+        Get personality responses for several inputs concurrently.
+
+        Args:
+            user_inputs: User commands/questions
+            scene_context: Current scene understanding (shared by all)
+
+        Returns:
+            Responses in the same order as user_inputs
+        """
+        return list(await asyncio.gather(
+            *[self.get_personality_response_async(user_input, scene_context)
+              for user_input in user_inputs]
+        ))
+
+    def _submit_personality_request(
+        self,
+        user_input: str,
+        scene_context: Optional[SceneUnderstanding]
+    ) -> asyncio.Future:
+        """Hand a personality request to the batcher (or run it directly)."""
+        if self._llm_batch_queue is None:
+            return asyncio.ensure_future(
+                self._request_personality_response(user_input, scene_context)
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self._llm_batch_queue.put_nowait((user_input, scene_context, future))
+        return future
+
+    async def _llm_batch_worker(self):
+        """Collect bursts of personality requests and send them concurrently."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._llm_batch_queue.get()]
+            deadline = loop.time() + self.llm_batch_window
+
+            try:
+                while len(batch) < self.llm_batch_max:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._llm_batch_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                self._fail_llm_batch(batch)
+                raise
+
+            # Don't block collection of the next batch on this one; keep a
+            # reference so the task isn't garbage-collected mid-flight
+            task = asyncio.create_task(self._run_llm_batch(batch))
+            self._llm_batch_runs.add(task)
+            task.add_done_callback(self._llm_batch_runs.discard)
+
+    async def _run_llm_batch(self, batch: List[Tuple]):
+        """Issue a batch of personality requests over the shared session."""
+        results = await asyncio.gather(
+            *[self._request_personality_response(user_input, scene_context)
+              for user_input, scene_context, _ in batch],
+            return_exceptions=True
+        )
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _fail_llm_batch(batch: List[Tuple]):
+        """Fail personality requests that will never be sent."""
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("AsyncBrain stopped before the request was sent"))
+
+    def _cache_personality_response(self, key: Tuple, future: asyncio.Future):
+        """Move a finished request from in-flight into the LRU cache."""
+        self._resp_pending.pop(key, None)
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        response_data = future.result()
+        if response_data is None:
+            return
+
+        self._resp_cache[key] = response_data
+        self._resp_cache.move_to_end(key)
+        if len(self._resp_cache) > RESPONSE_CACHE_SIZE:
+            self._resp_cache.popitem(last=False)
 
-            if scene_context:
-                context_parts.append(f"Objects visible: {[obj['name'] for obj in scene_context.objects]}")
-                context_parts.append(f"People present: {scene_context.people_count}")
-                context_parts.append(f"Obstacles: {scene_context.obstacles}")
+    async def _request_personality_response(
+        self,
+        user_input: str,
+        scene_context: Optional[SceneUnderstanding],
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> Optional[PersonalityResponse]:
+        """
+        Call the personality LLM.
 
-            system_prompt = " ".join(context_parts)
+        Args:
+            user_input: User's command or question
+            scene_context: Current scene understanding
+            session: Session to send on (default: the brain's)
 
-            # User prompt with structured response request
-            user_prompt = f"""{user_input}
+        Returns:
+            Parsed response, or None if the API returned an error status
+        """
+        # Build context
+        context_parts = [
+            f"You are a {self.personality} robot assistant.",
+            f"Current scene: {scene_context.description if scene_context else 'Unknown'}",
+        ]
+
+        if scene_context:
+            context_parts.append(f"Objects visible: {[obj['name'] for obj in scene_context.objects]}")
+            context_parts.append(f"People present: {scene_context.people_count}")
+            context_parts.append(f"Obstacles: {scene_context.obstacles}")
+
+        system_prompt = " ".join(context_parts)
+
+        # User prompt with structured response request
+        user_prompt = f"""{user_input}
 
 Respond with JSON:
 {{
@@ -338,62 +884,51 @@ Respond with JSON:
   "action_suggested": "move_forward/turn_left/stop/none"
 }}"""
 
-            # API payload
-            payload = {
-                "model": self.llm_model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                "max_tokens": 200,
-                "temperature": 0.8  # Higher temp for personality
-            }
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-
-            # Async API call
-            async with self.session.post(
-                f"{self.llm_url}/chat/completions",
-                json=payload,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=5)
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    content = result['choices'][0]['message']['content']
+        # API payload
+        payload = {
+            "model": self.llm_model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "max_tokens": 200,
+            "temperature": 0.8,  # Higher temp for personality
+            "response_format": PERSONALITY_RESPONSE_FORMAT
+        }
 
-                    # Parse response
-                    response_data = self._parse_personality_json(content)
-                    self.llm_calls += 1
-                    return response_data
+        return await asyncio.wait_for(
+            self._post_personality(orjson.dumps(payload), session or self.session), LLM_TIMEOUT
+        )
 
-                else:
-                    print(f"[AsyncBrain] LLM API error: {response.status}")
-                    return PersonalityResponse(
-                        text="I'm having trouble thinking right now.",
-                        emotion="confused"
-                    )
+    async def _post_personality(
+        self,
+        body: bytes,
+        session: aiohttp.ClientSession
+    ) -> Optional[PersonalityResponse]:
+        """POST a serialized personality request and parse the reply."""
+        # Async API call (auth headers are set on the session)
+        async with session.post(
+            f"{self.llm_url}/chat/completions",
+            data=body,
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                content = result['choices'][0]['message']['content']
+
+                # Parse response
+                response_data = self._parse_personality_json(content)
+                self.llm_calls += 1
+                return response_data
 
-        except Exception as e:
-            print(f"[AsyncBrain] Personality response error: {e}")
-            return PersonalityResponse(
-                text="Sorry, I encountered an error.",
-                emotion="concerned"
-            )
+            else:
+                print(f"[AsyncBrain] LLM API error: {response.status}")
+                return None
 
     def _parse_personality_json(self, content: str) -> PersonalityResponse:
         """Parse personality LLM JSON response."""
         try:
-            # Extract JSON
-            if '```json' in content:
-                content = content.split('```json')[1].split('```')[0].strip()
-            elif '```' in content:
-                content = content.split('```')[1].split('```')[0].strip()
-
-            data = json.loads(content)
+            data = self._loads_model_json(content)
 
             return PersonalityResponse(
                 text=data.get('text', content),
@@ -401,7 +936,7 @@ Respond with JSON:
                 action_suggested=data.get('action_suggested')
             )
 
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, orjson.JSONDecodeError):
             # Fallback: use raw text
             return PersonalityResponse(
                 text=content,
@@ -409,8 +944,25 @@ Respond with JSON:
             )
 
     def update_frame(self, frame: np.ndarray):
-        """Update current camera frame (non-blocking)."""
-        self.current_frame = frame
+        """
+        Update current camera frame (non-blocking).
+
+        The frame is copied into a persistent slab, so callers may reuse
+        their capture buffer. current_frame is only stable until the update
+        after next; readers that hold it longer (the vision loop) copy it.
+        """
+        if not isinstance(frame, np.ndarray):
+            self.current_frame = frame
+            return
+
+        if (not self._frame_slabs or self._frame_slabs[0].shape != frame.shape
+                or self._frame_slabs[0].dtype != frame.dtype):
+            self._frame_slabs = [np.empty_like(frame), np.empty_like(frame)]
+
+        self._frame_slab_idx ^= 1
+        slab = self._frame_slabs[self._frame_slab_idx]
+        np.copyto(slab, frame)
+        self.current_frame = slab  # atomic reference swap
 
     def get_personality_response(
         self,
@@ -428,7 +980,24 @@ Respond with JSON:
             Personality response
         """
         if not self.loop:
-            return PersonalityResponse(text="System not ready", emotion="confused")
+            # Not started: run a one-shot request on a private loop
+            try:
+                return asyncio.run(asyncio.wait_for(
+                    self._personality_once([user_input], scene_context), 5.0
+                ))[0]
+            except Exception as e:
+                print(f"[AsyncBrain] Sync wrapper error: {e}")
+                return PersonalityResponse(text="Error processing request", emotion="confused")
+
+        try:
+            asyncio.get_running_loop()
+            on_loop_thread = True
+        except RuntimeError:
+            on_loop_thread = False
+        if on_loop_thread:
+            # Blocking here would deadlock the loop the brain runs on
+            print("[AsyncBrain] Use get_personality_response_async() from async code")
+            return PersonalityResponse(text="Error processing request", emotion="confused")
 
         # Run coroutine in event loop
         future = asyncio.run_coroutine_threadsafe(
@@ -442,25 +1011,119 @@ Respond with JSON:
             print(f"[AsyncBrain] Sync wrapper error: {e}")
             return PersonalityResponse(text="Error processing request", emotion="confused")
 
+    def get_personality_responses_batch(
+        self,
+        user_inputs: List[str],
+        scene_context: Optional[SceneUnderstanding] = None
+    ) -> List[PersonalityResponse]:
+        """
+        Synchronous wrapper for concurrent personality responses.
+
+        Args:
+            user_inputs: User commands/questions
+            scene_context: Current scene
+
+        Returns:
+            Responses in the same order as user_inputs
+        """
+        error = PersonalityResponse(text="Error processing request", emotion="confused")
+
+        if not self.loop:
+            # Not started: run the batch on a private loop
+            try:
+                return asyncio.run(asyncio.wait_for(
+                    self._personality_once(user_inputs, scene_context), 5.0
+                ))
+            except Exception as e:
+                print(f"[AsyncBrain] Sync wrapper error: {e}")
+                return [error] * len(user_inputs)
+
+        try:
+            asyncio.get_running_loop()
+            print("[AsyncBrain] Use get_personality_responses_batch_async() from async code")
+            return [error] * len(user_inputs)
+        except RuntimeError:
+            pass
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.get_personality_responses_batch_async(user_inputs, scene_context),
+            self.loop
+        )
+
+        try:
+            return future.result(timeout=5.0)
+        except Exception as e:
+            print(f"[AsyncBrain] Sync wrapper error: {e}")
+            return [error] * len(user_inputs)
+
+    async def _personality_once(
+        self,
+        user_inputs: List[str],
+        scene_context: Optional[SceneUnderstanding]
+    ) -> List[PersonalityResponse]:
+        """
+        Personality responses on a private loop, with a short-lived session.
+
+        The brain's session, response cache and batcher belong to its own
+        loop (which may be starting up concurrently), so none are touched.
+
+        Args:
+            user_inputs: User commands/questions
+            scene_context: Current scene understanding
+
+        Returns:
+            Responses in the same order as user_inputs
+        """
+        async with self._make_session() as session:
+            results = await asyncio.gather(
+                *[self._request_personality_response(user_input, scene_context, session)
+                  for user_input in user_inputs],
+                return_exceptions=True
+            )
+
+        responses = []
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"[AsyncBrain] Personality response error: {result}")
+                result = PersonalityResponse(text="Sorry, I encountered an error.", emotion="concerned")
+            elif result is None:
+                result = PersonalityResponse(text="I'm having trouble thinking right now.", emotion="confused")
+            responses.append(result)
+        return responses
+
+    def set_scene_callback(self, callback: Optional[Callable[[SceneUnderstanding], None]]):
+        """Set callback for new scenes (called on the brain's event loop)."""
+        self.scene_callback = callback
+
     def get_latest_scene(self) -> Optional[SceneUnderstanding]:
         """Get most recent scene understanding."""
         return self.latest_scene
 
+    def wait_for_scene(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a new scene arrives (since the last wait).
+
+        Args:
+            timeout: Max seconds to wait (None = forever)
+
+        Returns:
+            True if a new scene is available via get_latest_scene()
+        """
+        ready = self._scene_event.wait(timeout)
+        self._scene_event.clear()
+        return ready
+
     def get_stats(self) -> Dict[str, Any]:
         """Get system statistics."""
         return {
             "running": self.running,
             "vlm_calls": self.vlm_calls,
             "llm_calls": self.llm_calls,
+            "vlm_skipped": self.vlm_skipped,
             "latest_scene_age": time.time() - self.latest_scene.timestamp if self.latest_scene else None,
             "scene_queue_size": self.scene_queue.qsize()
         }
 
-    async def _cleanup(self):
-        """Cleanup async resources."""
-        if self.session:
-            await self.session.close()
-
     def __enter__(self):
         """Context manager entry."""
         self.start()
@@ -469,3 +1132,12 @@ Respond with JSON:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.stop()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop_async()
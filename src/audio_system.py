@@ -12,10 +12,46 @@ from dataclasses import dataclass
 from enum import Enum
 import wave
 import json
+import re
 
 import numpy as np
 
 
+# RMS level above which a chunk counts as voice (adjust for environment)
+VAD_THRESHOLD = 500
+
+# Longest utterance the preallocated capture buffer holds
+MAX_UTT_SEC = 10
+
+# Intent keywords in priority order (earlier entries win when several match)
+INTENT_KEYWORDS = (
+    # Movement intents
+    ('move_forward', ('forward', 'ahead', 'go')),
+    ('move_backward', ('back', 'backward', 'reverse')),
+    ('turn_left', ('left',)),
+    ('turn_right', ('right',)),
+    ('stop', ('stop', 'halt', 'freeze')),
+    # Vision intents
+    ('describe_scene', ('what do you see', 'describe', 'look')),
+    ('find_object', ('find', 'where is')),
+    # Navigation intents
+    ('follow_person', ('follow',)),
+    ('navigate_to', ('navigate', 'go to')),
+    # Status intents
+    ('check_battery', ('battery', 'power')),
+    ('report_status', ('status',)),
+)
+
+# One pass over the text finds every keyword occurrence: each alternative
+# sits inside a zero-width lookahead so overlapping hits are all reported,
+# and m.lastgroup names the intent that matched.
+_INTENT_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{intent}>{'|'.join(re.escape(w) for w in words)})"
+    for intent, words in INTENT_KEYWORDS
+) + ')')
+_INTENT_RANK = {intent: i for i, (intent, _) in enumerate(INTENT_KEYWORDS)}
+
+
 class AudioMode(Enum):
     """Audio processing modes."""
     LISTENING = "listening"  # Actively listening for commands
@@ -72,6 +108,10 @@ class AudioSystem:
         self.audio_queue = queue.Queue(maxsize=100)
         self.command_queue = queue.Queue(maxsize=10)
 
+        # Preallocated utterance buffer (filled in place, no per-utterance concat)
+        self._utt_buf = np.empty(self.sample_rate * MAX_UTT_SEC, dtype=np.int16)
+        self._utt_len = 0
+
         # Callbacks
         self.command_callback: Optional[Callable] = None
 
@@ -79,6 +119,7 @@ class AudioSystem:
         self.listen_thread: Optional[threading.Thread] = None
         self.process_thread: Optional[threading.Thread] = None
         self.lock = threading.Lock()
+        self._listen_stop = threading.Event()
 
         # Stats
         self.commands_processed = 0
@@ -94,6 +135,7 @@ class AudioSystem:
             import pyaudio
 
             self.pyaudio = pyaudio.PyAudio()
+            self._pa_continue = pyaudio.paContinue
 
             # Find WM8960 device
             self._find_audio_device()
@@ -131,6 +173,7 @@ class AudioSystem:
             return
 
         self.running = True
+        self._listen_stop.clear()
         self.mode = AudioMode.LISTENING if not self.use_wake_word else AudioMode.IDLE
 
         # Start listening thread
@@ -149,6 +192,7 @@ class AudioSystem:
             return
 
         self.running = False
+        self._listen_stop.set()
 
         if self.listen_thread:
             self.listen_thread.join(timeout=2.0)
@@ -167,35 +211,25 @@ class AudioSystem:
 
         if not self.pyaudio:
             # Simulation mode
-            while self.running:
-                time.sleep(1.0)
+            self._listen_stop.wait()
             return
 
         try:
+            # Callback mode: PortAudio pushes each period into _pa_callback,
+            # so this thread only has to wait for stop()
             stream = self.pyaudio.open(
                 format=self.pyaudio.get_format_from_width(2),
                 channels=self.channels,
                 rate=self.sample_rate,
                 input=True,
                 input_device_index=self.input_device,
-                frames_per_buffer=self.chunk_size
+                frames_per_buffer=self.chunk_size,
+                stream_callback=self._pa_callback,
+                start=False
             )
+            stream.start_stream()
 
-            while self.running:
-                if self.mode in (AudioMode.LISTENING, AudioMode.IDLE):
-                    data = stream.read(self.chunk_size, exception_on_overflow=False)
-
-                    # Convert to numpy array
-                    audio_data = np.frombuffer(data, dtype=np.int16)
-
-                    # Check for voice activity
-                    if self._detect_voice_activity(audio_data):
-                        try:
-                            self.audio_queue.put_nowait(audio_data)
-                        except queue.Full:
-                            pass  # Drop frame if queue full
-
-                time.sleep(0.01)
+            self._listen_stop.wait()
 
             stream.stop_stream()
             stream.close()
@@ -205,11 +239,37 @@ class AudioSystem:
 
         print("[Audio] Listening loop ended")
 
+    def _pa_callback(self, in_data, frame_count, time_info, status):
+        """
+        PyAudio stream callback, called on the PortAudio thread per period.
+
+        Args:
+            in_data: Raw int16 PCM bytes
+            frame_count: Number of frames in in_data
+            time_info: PortAudio timing info (unused)
+            status: PortAudio status flags (unused)
+
+        Returns:
+            (None, paContinue) to keep the stream running
+        """
+        if self.mode in (AudioMode.LISTENING, AudioMode.IDLE):
+            # Convert to numpy array
+            audio_data = np.frombuffer(in_data, dtype=np.int16)
+
+            # Check for voice activity
+            if self._detect_voice_activity(audio_data):
+                try:
+                    self.audio_queue.put_nowait(audio_data)
+                except queue.Full:
+                    pass  # Drop frame if queue full
+
+        return (None, self._pa_continue)
+
     def _process_loop(self):
         """Audio processing and speech recognition loop."""
         print("[Audio] Processing loop started")
 
-        buffer = []
+        chunks = 0
         silence_frames = 0
         max_silence_frames = 30  # ~0.5s of silence
 
@@ -218,7 +278,15 @@ class AudioSystem:
                 # Get audio data with timeout
                 audio_data = self.audio_queue.get(timeout=1.0)
 
-                buffer.append(audio_data)
+                # Append into the utterance buffer, flushing early if full
+                n = len(audio_data)
+                if self._utt_len + n > len(self._utt_buf):
+                    self._process_speech(self._utt_buf[:self._utt_len])
+                    self._utt_len = 0
+                    chunks = 0
+                self._utt_buf[self._utt_len:self._utt_len + n] = audio_data
+                self._utt_len += n
+                chunks += 1
 
                 # Check if still speaking
                 if self._detect_voice_activity(audio_data):
@@ -226,10 +294,11 @@ class AudioSystem:
                 else:
                     silence_frames += 1
 
-                # Process complete utterance
-                if silence_frames >= max_silence_frames and len(buffer) > 10:
-                    self._process_speech(np.concatenate(buffer))
-                    buffer = []
+                # Process complete utterance (contiguous view, no copy)
+                if silence_frames >= max_silence_frames and chunks > 10:
+                    self._process_speech(self._utt_buf[:self._utt_len])
+                    self._utt_len = 0
+                    chunks = 0
                     silence_frames = 0
 
             except queue.Empty:
@@ -249,12 +318,12 @@ class AudioSystem:
         Returns:
             True if voice detected
         """
-        # Calculate RMS energy
-        rms = np.sqrt(np.mean(audio_data.astype(float) ** 2))
-
-        # Simple threshold-based VAD
-        threshold = 500  # Adjust based on environment
-        return rms > threshold
+        # Compare energy against threshold² · N in integer math instead of
+        # computing RMS (no float copy, no sqrt). int64 avoids overflow:
+        # 1024 samples of full-scale int16 is ~1.1e12.
+        samples = audio_data.astype(np.int64)
+        energy = int(np.dot(samples, samples))
+        return energy > VAD_THRESHOLD * VAD_THRESHOLD * samples.size
 
     def _process_speech(self, audio_data: np.ndarray):
         """
@@ -313,39 +382,20 @@ class AudioSystem:
             Intent classification
         """
         text_lower = text.lower()
-
-        # Movement intents
-        if any(word in text_lower for word in ['forward', 'ahead', 'go']):
-            return 'move_forward'
-        elif any(word in text_lower for word in ['back', 'backward', 'reverse']):
-            return 'move_backward'
-        elif 'left' in text_lower:
-            return 'turn_left'
-        elif 'right' in text_lower:
-            return 'turn_right'
-        elif any(word in text_lower for word in ['stop', 'halt', 'freeze']):
-            return 'stop'
-
-        # Vision intents
-        elif any(word in text_lower for word in ['what do you see', 'describe', 'look']):
-            return 'describe_scene'
-        elif 'find' in text_lower or 'where is' in text_lower:
-            return 'find_object'
-
-        # Navigation intents
-        elif 'follow' in text_lower:
-            return 'follow_person'
-        elif 'navigate' in text_lower or 'go to' in text_lower:
-            return 'navigate_to'
-
-        # Status intents
-        elif 'battery' in text_lower or 'power' in text_lower:
-            return 'check_battery'
-        elif 'status' in text_lower:
-            return 'report_status'
-
-        else:
+        best = len(INTENT_KEYWORDS)
+
+        # Keywords match inside words too ("going", "backwards", ...); the
+        # highest-priority hit wins, so stop once the top intent is found
+        for m in _INTENT_RE.finditer(text_lower):
+            rank = _INTENT_RANK[m.lastgroup]
+            if rank < best:
+                best = rank
+                if rank == 0:
+                    break
+
+        if best == len(INTENT_KEYWORDS):
             return 'unknown'
+        return INTENT_KEYWORDS[best][0]
 
     def speak(self, text: str, wait: bool = False):
         """
@@ -5,17 +5,117 @@ Like a Roomba, but with vision, personality, and questionable decision-making.
 
 import time
 import random
-from typing import Optional, Dict, Any, List
+import heapq
+import itertools
+from functools import cached_property
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import threading
+from collections import deque, OrderedDict
 
 import numpy as np
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from async_brain import AsyncRobotBrain, SceneUnderstanding
 from hailo_vision import NavigationData
 
 
+# Fallback exploration directions and weights per exploration_bias
+_BIAS_TABLES = {
+    "left": (("FORWARD", "LEFT", "RIGHT"), (1, 2, 1)),
+    "right": (("FORWARD", "RIGHT", "LEFT"), (1, 2, 1)),
+    "random": (("FORWARD", "LEFT", "RIGHT", "BACKWARD"), (2, 1, 1, 1)),
+}
+
+# Scene safe direction -> movement direction (a "backward" safe direction
+# is never chosen from the scene; only the random fallback backs up)
+_SAFE_MAP = {
+    "forward": "FORWARD",
+    "left": "LEFT",
+    "right": "RIGHT",
+}
+
+# Exploration direction -> movement action builder
+_DIRECTION_ACTIONS = {
+    "FORWARD": lambda: {"command": "FORWARD", "duration": random.uniform(1.0, 3.0)},
+    "LEFT": lambda: {"command": "TURN_LEFT", "angle": random.uniform(30, 90)},
+    "RIGHT": lambda: {"command": "TURN_RIGHT", "angle": random.uniform(30, 90)},
+    "BACKWARD": lambda: {"command": "BACKWARD", "duration": random.uniform(0.5, 1.5)},
+}
+
+# Objects that block the path when near and centered
+_BLOCKERS = frozenset({'chair', 'table', 'wall', 'person'})
+
+# Every direction a scene may report as safe
+_SAFE_ALL = frozenset(_SAFE_MAP)
+
+# Direction order used by the array-based chooser, and each bias table's
+# weights laid out in that order
+_DIRECTIONS = ("FORWARD", "LEFT", "RIGHT", "BACKWARD")
+_DIRECTION_IDX = {d.lower(): i for i, d in enumerate(_DIRECTIONS)}
+_BIAS_IDS = {"left": 0, "right": 1, "random": 2}
+_NO_SAFE_DIRS = np.zeros(len(_DIRECTIONS), dtype=np.uint8)
+_BIAS_WEIGHTS = np.array([
+    [1.0, 2.0, 1.0, 0.0],  # left
+    [1.0, 1.0, 2.0, 0.0],  # right
+    [2.0, 1.0, 1.0, 1.0],  # random
+])
+
+# Bounds on the agent's long-running memory
+VISITED_LOCATIONS_MAX = 256
+INTERESTING_OBJECTS_MAX = 128
+
+
+def _choose_dir(safe_mask: np.ndarray, bias_id: int) -> int:
+    """
+    Pick an exploration direction index (into _DIRECTIONS).
+
+    Same policy as AutonomousAgent._choose_exploration_direction, written
+    over arrays so numba can compile it.
+
+    Args:
+        safe_mask: uint8 flag per direction, 1 if the scene says it's safe
+        bias_id: Row of _BIAS_WEIGHTS for the fallback
+
+    Returns:
+        Direction index
+    """
+    n_safe = 0
+    for i in range(4):
+        n_safe += safe_mask[i]
+
+    if n_safe > 0:
+        # Prefer forward if safe, otherwise a random safe direction
+        if safe_mask[0] and np.random.random() < 0.6:
+            return 0
+        k = np.random.randint(n_safe)
+        for i in range(4):
+            if safe_mask[i]:
+                if k == 0:
+                    return i
+                k -= 1
+
+    # Fallback: Random with bias
+    weights = _BIAS_WEIGHTS[bias_id]
+    r = np.random.random() * weights.sum()
+    for i in range(4):
+        r -= weights[i]
+        if r < 0.0:
+            return i
+    return 0
+
+
+if numba is not None:
+    _choose_dir_jit = numba.njit(cache=True)(_choose_dir)
+else:
+    _choose_dir_jit = None
+
+
 class AgentMode(Enum):
     """Autonomous agent operational modes."""
     EXPLORING = "exploring"      # Random wandering
@@ -33,6 +133,145 @@ class AgentGoal:
     target: Optional[str] = None  # Object or person to interact with
     priority: int = 0  # 0-10
     created_at: float = 0.0
+    done: bool = False  # Completed/abandoned; popped lazily from the queue
+
+
+class SceneView:
+    """
+    Lazily derived, cached lookups over one SceneUnderstanding.
+
+    Object fields are unpacked once into parallel tuples (names, positions,
+    distances) so predicates are set/dict lookups instead of per-object
+    dict.get() loops.
+    """
+
+    def __init__(self, scene: SceneUnderstanding):
+        self.scene = scene
+
+    @cached_property
+    def names(self) -> tuple:
+        """Object names, in scene order."""
+        return tuple(obj['name'] for obj in self.scene.objects)
+
+    @cached_property
+    def positions(self) -> tuple:
+        """Object positions (left/center/right)."""
+        return tuple(obj.get('position') for obj in self.scene.objects)
+
+    @cached_property
+    def distances(self) -> tuple:
+        """Object distances (near/far)."""
+        return tuple(obj.get('distance') for obj in self.scene.objects)
+
+    @cached_property
+    def name_to_idx(self) -> Dict[str, int]:
+        """Index of the first object with each name."""
+        index: Dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            index.setdefault(name, i)
+        return index
+
+    @cached_property
+    def center_near_blocker_names(self) -> frozenset:
+        """Names of blocking objects that are near and dead ahead."""
+        return frozenset(
+            name for name, pos, dist in zip(self.names, self.positions, self.distances)
+            if pos == 'center' and dist == 'near'
+        ) & _BLOCKERS
+
+    @cached_property
+    def person(self) -> Optional[Dict]:
+        """First person in the scene, if any."""
+        return self.find('person')
+
+    @cached_property
+    def safe_set(self) -> frozenset:
+        """Safe directions as a set (unknown labels dropped)."""
+        return frozenset(self.scene.safe_directions) & _SAFE_ALL
+
+    @cached_property
+    def safe_mask(self) -> np.ndarray:
+        """Safe directions as a uint8 flag per _DIRECTIONS entry."""
+        mask = np.zeros(len(_DIRECTIONS), dtype=np.uint8)
+        for direction in self.safe_set:
+            mask[_DIRECTION_IDX[direction]] = 1
+        return mask
+
+    def find(self, name: str) -> Optional[Dict]:
+        """First object with the given name, if any."""
+        idx = self.name_to_idx.get(name)
+        return None if idx is None else self.scene.objects[idx]
+
+
+class NodeStatus(Enum):
+    """Behavior tree tick result."""
+    SUCCESS = "success"
+    FAILURE = "failure"
+    RUNNING = "running"
+
+
+@dataclass
+class Blackboard:
+    """Shared state passed down the behavior tree on each tick."""
+    scene: Optional[SceneUnderstanding] = None
+    action: Optional[Dict] = None  # Set by the Action leaf that ran
+
+
+class Node:
+    """Behavior tree node."""
+
+    def tick(self, bb: Blackboard) -> NodeStatus:
+        """Evaluate this node once."""
+        raise NotImplementedError
+
+
+class Selector(Node):
+    """Runs children in order until one does not fail (fallback)."""
+
+    def __init__(self, *children: Node):
+        self.children = children
+
+    def tick(self, bb: Blackboard) -> NodeStatus:
+        for child in self.children:
+            status = child.tick(bb)
+            if status is not NodeStatus.FAILURE:
+                return status
+        return NodeStatus.FAILURE
+
+
+class Sequence(Node):
+    """Runs children in order until one does not succeed."""
+
+    def __init__(self, *children: Node):
+        self.children = children
+
+    def tick(self, bb: Blackboard) -> NodeStatus:
+        for child in self.children:
+            status = child.tick(bb)
+            if status is not NodeStatus.SUCCESS:
+                return status
+        return NodeStatus.SUCCESS
+
+
+class Condition(Node):
+    """Leaf that succeeds when its predicate holds."""
+
+    def __init__(self, fn: Callable[[Blackboard], bool]):
+        self.fn = fn
+
+    def tick(self, bb: Blackboard) -> NodeStatus:
+        return NodeStatus.SUCCESS if self.fn(bb) else NodeStatus.FAILURE
+
+
+class Action(Node):
+    """Leaf that produces the movement action (may be None) for this tick."""
+
+    def __init__(self, fn: Callable[[Blackboard], Optional[Dict]]):
+        self.fn = fn
+
+    def tick(self, bb: Blackboard) -> NodeStatus:
+        bb.action = self.fn(bb)
+        return NodeStatus.SUCCESS
 
 
 class AutonomousAgent:
@@ -42,7 +281,8 @@ class AutonomousAgent:
         self,
         brain: AsyncRobotBrain,
         movement_callback,
-        personality: str = "curious"
+        personality: str = "curious",
+        use_jit: bool = False
     ):
         """
         Initialize autonomous agent.
@@ -51,19 +291,35 @@ class AutonomousAgent:
             brain: Robot brain instance
             movement_callback: Function to send movement commands
             personality: Agent personality (curious, cautious, chaotic)
+            use_jit: Pick exploration directions with the numba-compiled
+                chooser (only pays off at high decision rates)
         """
         self.brain = brain
         self.movement_callback = movement_callback
         self.personality = personality
 
+        # Optional JIT direction chooser, warmed up here so the first
+        # decision doesn't pay the compile
+        self._choose_dir = None
+        if use_jit:
+            if _choose_dir_jit is None:
+                print("[Agent] WARNING: numba not available, using Python direction chooser")
+            else:
+                _choose_dir_jit(np.zeros(len(_DIRECTIONS), dtype=np.uint8), _BIAS_IDS["random"])
+                self._choose_dir = _choose_dir_jit
+
         # State
         self.mode = AgentMode.EXPLORING
-        self.current_goal: Optional[AgentGoal] = None
+        # Goal queue: min-heap on (auto, -priority, seq), so goals set by the
+        # user outrank the agent's own; explore when empty
+        self._goals: List[Tuple[bool, int, int, AgentGoal]] = []
+        self._goal_seq = itertools.count()
+        self._default_goal = AgentGoal(type="explore", priority=5, created_at=time.time())
         self.running = False
 
         # Memory
-        self.visited_locations = []  # Track where we've been
-        self.interesting_objects = set()  # Objects we've seen
+        self.visited_locations: deque = deque(maxlen=VISITED_LOCATIONS_MAX)  # Track where we've been
+        self.interesting_objects: "OrderedDict[str, None]" = OrderedDict()  # Objects we've seen (LRU)
         self.stuck_counter = 0  # Times we've been stuck
         self.last_movement = None
         self.exploration_bias = "random"  # "left", "right", "random"
@@ -82,10 +338,23 @@ class AutonomousAgent:
         self.decisions_made = 0
         self.objects_investigated = 0
         self.close_calls = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # Threading
         self.agent_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()  # stop() or a new scene
+        self._prev_scene_callback: Optional[Callable[[SceneUnderstanding], None]] = None
+
+        # Derived scene lookups, rebuilt only when the scene changes
+        self._scene_view: Optional[SceneView] = None
+        self._scene_view_ts = -1.0
+        self._last_scene_ts = -1.0  # Scene the last decision was made on
+
+        # Decision tree, built once (personality is fixed at construction)
+        self.blackboard = Blackboard()
+        self._explore_tree = self._build_explore_tree()
+        self.root = self._build_tree()
 
     def start(self):
         """Start autonomous operation."""
@@ -94,13 +363,15 @@ class AutonomousAgent:
             return
 
         self.running = True
+        self._stop_event.clear()
+        self._wake_event.clear()
 
-        # Set initial goal
-        self.current_goal = AgentGoal(
-            type="explore",
-            priority=5,
-            created_at=time.time()
-        )
+        # Wake early on fresh scenes if the brain can tell us about them,
+        # still passing them on to whoever was listening before
+        set_scene_callback = getattr(self.brain, "set_scene_callback", None)
+        if set_scene_callback:
+            self._prev_scene_callback = getattr(self.brain, "scene_callback", None)
+            set_scene_callback(self._on_scene)
 
         # Start agent loop
         self.agent_thread = threading.Thread(target=self._agent_loop, daemon=True)
@@ -114,26 +385,70 @@ class AutonomousAgent:
             return
 
         self.running = False
+        self._stop_event.set()
+        self._wake_event.set()
+
+        # Hand the scene callback back, unless it was replaced meanwhile
+        if getattr(self.brain, "scene_callback", None) == self._on_scene:
+            self.brain.set_scene_callback(self._prev_scene_callback)
+        self._prev_scene_callback = None
 
         # Stop movement
         self._execute_movement("STOP")
 
+        # Goals don't carry over into the next run
+        self._goals.clear()
+
         if self.agent_thread:
             self.agent_thread.join(timeout=3.0)
 
         print("[Agent] Autonomous agent stopped")
 
+    @property
+    def current_goal(self) -> AgentGoal:
+        """Highest-priority unfinished goal (explore if none)."""
+        return self._peek_goal()
+
+    def _peek_goal(self) -> AgentGoal:
+        """Drop finished goals off the top of the queue and return the top."""
+        goals = self._goals
+        while goals and goals[0][-1].done:
+            heapq.heappop(goals)
+        return goals[0][-1] if goals else self._default_goal
+
+    def _push_goal(self, goal: AgentGoal, auto: bool = True):
+        """
+        Queue a goal; ties on priority go to the earlier goal.
+
+        Args:
+            goal: Goal to queue
+            auto: Chosen by the agent itself (user goals always rank first)
+        """
+        heapq.heappush(self._goals, (auto, -goal.priority, next(self._goal_seq), goal))
+
+    def notify(self, scene: Optional[SceneUnderstanding] = None):
+        """Wake the agent loop for an immediate decision (e.g. new scene)."""
+        self._wake_event.set()
+
+    def _on_scene(self, scene: SceneUnderstanding):
+        """Brain scene callback: wake the loop, then chain to the previous one."""
+        self.notify(scene)
+        if self._prev_scene_callback:
+            self._prev_scene_callback(scene)
+
     def _agent_loop(self):
         """Main autonomous decision-making loop."""
         print("[Agent] Agent loop started")
 
-        while self.running:
+        while not self._stop_event.is_set():
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
+                woken = self._wake_event.is_set()
+                self._wake_event.clear()
 
-                # Check if it's time for a new decision
-                if current_time - self.last_decision_time >= self.decision_interval:
-                    self._make_decision()
+                # Check if it's time for a new decision (or a new scene arrived)
+                if woken or current_time - self.last_decision_time >= self.decision_interval:
+                    self._make_decision(current_time)
                     self.last_decision_time = current_time
 
                 # Check if current action is complete
@@ -142,56 +457,107 @@ class AutonomousAgent:
                     self._execute_movement("STOP")
                     self.action_duration = 0
 
-                time.sleep(0.1)
+                # Sleep until the next decision or action deadline
+                next_deadline = self.last_decision_time + self.decision_interval
+                if self.action_duration > 0:
+                    next_deadline = min(next_deadline, self.action_start_time + self.action_duration)
+                self._wake_event.wait(max(0.0, next_deadline - time.monotonic()))
 
             except Exception as e:
                 print(f"[Agent] Error in agent loop: {e}")
-                time.sleep(1.0)
+                self._stop_event.wait(1.0)
 
         print("[Agent] Agent loop ended")
 
-    def _make_decision(self):
-        """Make an autonomous decision based on current state."""
+    def _make_decision(self, now: Optional[float] = None):
+        """
+        Make an autonomous decision based on current state.
+
+        Args:
+            now: time.monotonic() for this tick (queried if not given)
+        """
+        if now is None:
+            now = time.monotonic()
+
         # Get current sensor data
         scene = self.brain.get_latest_scene()
         # nav_data would come from Hailo (if integrated)
 
+        # Nothing new to react to while the previous action is still running
+        if scene is not None:
+            if scene.timestamp == self._last_scene_ts and self.action_duration > 0:
+                return
+            self._last_scene_ts = scene.timestamp
+
         # Decide what to do
-        action = self._decide_action(scene)
+        bb = self.blackboard
+        bb.scene = scene
+        bb.action = None
+        self.root.tick(bb)
+        action = bb.action
 
         # Execute action
         if action:
-            self._execute_action(action)
+            self._execute_action(action, now)
             self.decisions_made += 1
 
-    def _decide_action(self, scene: Optional[SceneUnderstanding]) -> Optional[Dict]:
+    def _build_tree(self) -> Node:
         """
-        Decide what action to take based on scene.
+        Build the decision tree.
 
-        Args:
-            scene: Current scene understanding
+        Safety first, then the current goal, then exploration as fallback.
 
         Returns:
-            Action dict or None
+            Root node
         """
-        # Safety first: Check for obstacles
-        if scene and scene.obstacles:
-            if self._is_path_blocked(scene):
-                return self._avoid_obstacle(scene)
+        def goal_is(goal_type: str) -> Condition:
+            return Condition(lambda bb: self._peek_goal().type == goal_type)
+
+        return Selector(
+            # Safety first: Check for obstacles
+            Sequence(
+                Condition(lambda bb: bool(bb.scene and bb.scene.obstacles)
+                          and self._is_path_blocked(bb.scene)),
+                Action(lambda bb: self._avoid_obstacle(bb.scene))
+            ),
+            # Current goal
+            Sequence(goal_is("explore"), self._explore_tree),
+            Sequence(goal_is("investigate"),
+                     Action(lambda bb: self._investigate_behavior(bb.scene))),
+            Sequence(goal_is("follow"),
+                     Action(lambda bb: self._follow_behavior(bb.scene))),
+            # Default: explore
+            self._explore_tree
+        )
 
-        # Check current goal
-        if self.current_goal:
-            if self.current_goal.type == "explore":
-                return self._explore_behavior(scene)
+    def _build_explore_tree(self) -> Node:
+        """
+        Build the exploration subtree for this agent's personality.
 
-            elif self.current_goal.type == "investigate":
-                return self._investigate_behavior(scene)
+        Returns:
+            Exploration node
+        """
+        random_walk = Action(self._random_walk)
+
+        # Personality -> (trigger, action) tried before the random walk
+        hooks = {
+            # Curious: Look for interesting things (30% chance to investigate)
+            "curious": (
+                lambda bb: bool(bb.scene and bb.scene.objects) and random.random() < 0.3,
+                self._start_investigation
+            ),
+            # Cautious: Move slowly, prefer known paths
+            "cautious": (lambda bb: self.stuck_counter > 2, self._rest_when_stuck),
+            # Chaotic: Random, unpredictable movements (10% chance)
+            "chaotic": (lambda bb: random.random() < 0.1, self._chaotic_spin),
+        }
 
-            elif self.current_goal.type == "follow":
-                return self._follow_behavior(scene)
+        hook = hooks.get(self.personality)
+        if hook is None:
+            return random_walk
 
-        # Default: explore
-        return self._explore_behavior(scene)
+        trigger, action = hook
+        return Selector(Sequence(Condition(trigger), Action(action)), random_walk)
 
     def _explore_behavior(self, scene: Optional[SceneUnderstanding]) -> Dict:
         """
@@ -203,46 +569,54 @@ class AutonomousAgent:
         Returns:
             Movement action
         """
-        if self.personality == "curious":
-            # Curious: Look for interesting things
-            if scene and scene.objects and random.random() < 0.3:
-                # 30% chance to investigate something
-                obj = random.choice(scene.objects)
-                print(f"[Agent] 🤔 Curious about {obj['name']}...")
-                self.current_goal = AgentGoal(
-                    type="investigate",
-                    target=obj['name'],
-                    priority=6,
-                    created_at=time.time()
-                )
-                return self._investigate_behavior(scene)
+        bb = Blackboard(scene=scene)
+        self._explore_tree.tick(bb)
+        return bb.action
+
+    def _start_investigation(self, bb: Blackboard) -> Dict:
+        """Pick a visible object and switch to investigating it."""
+        obj = random.choice(bb.scene.objects)
+        print(f"[Agent] 🤔 Curious about {obj['name']}...")
+        self._push_goal(AgentGoal(
+            type="investigate",
+            target=obj['name'],
+            priority=6,
+            created_at=time.time()
+        ))
+        return self._investigate_behavior(bb.scene)
 
-        elif self.personality == "cautious":
-            # Cautious: Move slowly, prefer known paths
-            if self.stuck_counter > 2:
-                print("[Agent] 😰 Too many obstacles, resting...")
-                return {"command": "STOP", "duration": 3.0}
+    def _rest_when_stuck(self, bb: Blackboard) -> Dict:
+        """Stop for a while after repeated obstacles."""
+        print("[Agent] 😰 Too many obstacles, resting...")
+        return {"command": "STOP", "duration": 3.0}
 
-        elif self.personality == "chaotic":
-            # Chaotic: Random, unpredictable movements
-            if random.random() < 0.1:  # 10% chance
-                spin_duration = random.uniform(0.5, 2.0)
-                print("[Agent] 🌀 Feeling spicy, spinning!")
-                return {"command": "SPIN", "duration": spin_duration}
+    def _chaotic_spin(self, bb: Blackboard) -> Dict:
+        """Spin in place for a random duration."""
+        spin_duration = random.uniform(0.5, 2.0)
+        print("[Agent] 🌀 Feeling spicy, spinning!")
+        return {"command": "SPIN", "duration": spin_duration}
 
-        # Default exploration: Random walk
-        direction = self._choose_exploration_direction(scene)
+    def _random_walk(self, bb: Blackboard) -> Dict:
+        """Default exploration: Random walk."""
+        direction = self._choose_exploration_direction(bb.scene)
 
         print(f"[Agent] 🚶 Exploring {direction}...")
 
-        if direction == "FORWARD":
-            return {"command": "FORWARD", "duration": random.uniform(1.0, 3.0)}
-        elif direction == "LEFT":
-            return {"command": "TURN_LEFT", "angle": random.uniform(30, 90)}
-        elif direction == "RIGHT":
-            return {"command": "TURN_RIGHT", "angle": random.uniform(30, 90)}
-        elif direction == "BACKWARD":
-            return {"command": "BACKWARD", "duration": random.uniform(0.5, 1.5)}
+        return _DIRECTION_ACTIONS[direction]()
+
+    def _remember(self, name: str):
+        """Record an investigated object, evicting the oldest past the cap."""
+        self.interesting_objects[name] = None
+        self.interesting_objects.move_to_end(name)
+        if len(self.interesting_objects) > INTERESTING_OBJECTS_MAX:
+            self.interesting_objects.popitem(last=False)
+
+    def _view(self, scene: SceneUnderstanding) -> SceneView:
+        """Get the cached SceneView for scene (keyed by scene timestamp)."""
+        if self._scene_view is None or scene.timestamp != self._scene_view_ts:
+            self._scene_view = SceneView(scene)
+            self._scene_view_ts = scene.timestamp
+        return self._scene_view
 
     def _investigate_behavior(self, scene: Optional[SceneUnderstanding]) -> Dict:
         """
@@ -254,21 +628,18 @@ class AutonomousAgent:
         Returns:
             Movement action
         """
-        if not scene or not self.current_goal:
+        goal = self._peek_goal()
+        if not scene or goal.type != "investigate":
             return self._explore_behavior(scene)
 
-        target = self.current_goal.target
+        target = goal.target
 
         # Find target object in scene
-        target_obj = None
-        for obj in scene.objects:
-            if obj['name'] == target:
-                target_obj = obj
-                break
+        target_obj = self._view(scene).find(target)
 
         if not target_obj:
             print(f"[Agent] 🤷 Lost sight of {target}, back to exploring")
-            self.current_goal = AgentGoal(type="explore", priority=5, created_at=time.time())
+            goal.done = True
             return self._explore_behavior(scene)
 
         # Move toward object based on position
@@ -284,7 +655,7 @@ class AutonomousAgent:
             # Close enough?
             if target_obj.get('distance') == 'near':
                 print(f"[Agent] ✅ Reached {target}! Marking as investigated.")
-                self.interesting_objects.add(target)
+                self._remember(target)
                 self.objects_investigated += 1
 
                 # Ask brain about it
@@ -294,8 +665,8 @@ class AutonomousAgent:
                 )
                 print(f"[Agent] 💭 {response.text}")
 
-                # Back to exploring
-                self.current_goal = AgentGoal(type="explore", priority=5, created_at=time.time())
+                # Done; fall back to the next goal (or exploring)
+                goal.done = True
                 return {"command": "STOP", "duration": 2.0}
             else:
                 return {"command": "FORWARD", "duration": 1.0}
@@ -312,15 +683,13 @@ class AutonomousAgent:
         """
         if not scene or scene.people_count == 0:
             print("[Agent] 😢 Lost the person, back to exploring")
-            self.current_goal = AgentGoal(type="explore", priority=5, created_at=time.time())
+            goal = self._peek_goal()
+            if goal.type == "follow":
+                goal.done = True
             return self._explore_behavior(scene)
 
         # Find person in objects
-        person = None
-        for obj in scene.objects:
-            if obj['name'] == 'person':
-                person = obj
-                break
+        person = self._view(scene).person
 
         if not person:
             return self._explore_behavior(scene)
@@ -344,42 +713,36 @@ class AutonomousAgent:
         scene: Optional[SceneUnderstanding]
     ) -> str:
         """Choose direction for exploration."""
+        if self._choose_dir is not None:
+            if scene and scene.safe_directions:
+                safe_mask = self._view(scene).safe_mask
+            else:
+                safe_mask = _NO_SAFE_DIRS
+            bias_id = _BIAS_IDS.get(self.exploration_bias, _BIAS_IDS["random"])
+            return _DIRECTIONS[self._choose_dir(safe_mask, bias_id)]
+
+        rand = random.random
+        choice = random.choice
+
         # Use scene safe directions if available
         if scene and scene.safe_directions:
-            safe_dirs = scene.safe_directions
-
             # Prefer forward if safe
-            if "forward" in safe_dirs and random.random() < 0.6:
+            if "forward" in self._view(scene).safe_set and rand() < 0.6:
                 return "FORWARD"
 
             # Otherwise pick random safe direction
-            if safe_dirs:
-                choice = random.choice(safe_dirs)
-                if choice == "left":
-                    return "LEFT"
-                elif choice == "right":
-                    return "RIGHT"
-                elif choice == "forward":
-                    return "FORWARD"
+            direction = _SAFE_MAP.get(choice(scene.safe_directions))
+            if direction:
+                return direction
 
         # Fallback: Random with bias
-        if self.exploration_bias == "left":
-            choices = ["FORWARD", "LEFT", "LEFT", "RIGHT"]
-        elif self.exploration_bias == "right":
-            choices = ["FORWARD", "RIGHT", "RIGHT", "LEFT"]
-        else:
-            choices = ["FORWARD", "FORWARD", "LEFT", "RIGHT", "BACKWARD"]
-
-        return random.choice(choices)
+        population, weights = _BIAS_TABLES.get(self.exploration_bias, _BIAS_TABLES["random"])
+        return random.choices(population, weights, k=1)[0]
 
     def _is_path_blocked(self, scene: SceneUnderstanding) -> bool:
         """Check if path is blocked."""
         # Check for obstacles in center
-        for obj in scene.objects:
-            if obj.get('position') == 'center' and obj.get('distance') == 'near':
-                if obj['name'] in ['chair', 'table', 'wall', 'person']:
-                    return True
-        return len(scene.obstacles) > 2
+        return bool(self._view(scene).center_near_blocker_names) or len(scene.obstacles) > 2
 
     def _avoid_obstacle(self, scene: SceneUnderstanding) -> Dict:
         """Avoid detected obstacle."""
@@ -396,23 +759,30 @@ class AutonomousAgent:
             return {"command": "STOP", "duration": 5.0}
 
         # Choose escape direction
-        if "left" in scene.safe_directions:
+        safe_set = self._view(scene).safe_set
+        if "left" in safe_set:
             return {"command": "TURN_LEFT", "angle": 45}
-        elif "right" in scene.safe_directions:
+        elif "right" in safe_set:
             return {"command": "TURN_RIGHT", "angle": 45}
         else:
             # No safe direction, back up
             return {"command": "BACKWARD", "duration": 1.0}
 
-    def _execute_action(self, action: Dict):
-        """Execute movement action."""
+    def _execute_action(self, action: Dict, now: float):
+        """
+        Execute movement action.
+
+        Args:
+            action: Action dict from the decision tree
+            now: time.monotonic() the action starts at
+        """
         command = action.get("command", "STOP")
         duration = action.get("duration", 0.0)
         angle = action.get("angle", 0)
 
         self._execute_movement(command, angle=angle)
 
-        self.action_start_time = time.time()
+        self.action_start_time = now
         self.action_duration = duration
         self.last_movement = command
 
@@ -436,17 +806,25 @@ class AutonomousAgent:
         """
         Set a new goal for the agent.
 
+        Goals set here take over from any goal the agent chose itself;
+        priority orders them among other user goals.
+
         Args:
             goal_type: Goal type (explore, investigate, follow, rest)
             target: Target object or person
             priority: Goal priority
         """
-        self.current_goal = AgentGoal(
-            type=goal_type,
-            target=target,
-            priority=priority,
-            created_at=time.time()
-        )
+        if goal_type == "explore":
+            # Exploring is the default; drop everything queued above it
+            for *_, goal in self._goals:
+                goal.done = True
+        else:
+            self._push_goal(AgentGoal(
+                type=goal_type,
+                target=target,
+                priority=priority,
+                created_at=time.time()
+            ), auto=False)
 
         print(f"[Agent] 🎯 New goal: {goal_type} {target if target else ''}")
 
@@ -461,7 +839,7 @@ class AutonomousAgent:
             "objects_investigated": self.objects_investigated,
             "close_calls": self.close_calls,
             "stuck_counter": self.stuck_counter,
-            "uptime": round(time.time() - self.start_time, 1),
+            "uptime": round(time.monotonic() - self.start_time, 1),
             "last_movement": self.last_movement
         }
 
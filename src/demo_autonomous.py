@@ -6,16 +6,86 @@ Roomba-style exploration with vision, personality, and chaos.
 
 import sys
 import time
+import random
+import dataclasses
+from functools import lru_cache
 from pathlib import Path
 import os
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from async_brain import AsyncRobotBrain
+from async_brain import AsyncRobotBrain, SceneUnderstanding, PersonalityResponse
 from autonomous_agent import AutonomousAgent
 from dotenv import load_dotenv
 
 
+def _mock_scene() -> SceneUnderstanding:
+    """Build one randomized simulated scene."""
+    objects = []
+    if random.random() < 0.7:
+        objects.append({
+            "name": random.choice(["chair", "table", "cup", "book"]),
+            "position": random.choice(["left", "center", "right"]),
+            "distance": random.choice(["near", "far"]),
+            "confidence": 0.8
+        })
+
+    return SceneUnderstanding(
+        timestamp=0.0,
+        objects=objects,
+        scene_type=random.choice(["indoor", "living_room", "kitchen"]),
+        obstacles=["chair"] if random.random() < 0.3 else [],
+        people_count=1 if random.random() < 0.2 else 0,
+        safe_directions=random.choice([
+            ["forward", "left"],
+            ["forward", "right"],
+            ["left", "right"],
+            ["backward"]
+        ]),
+        description="Simulated scene",
+        confidence=0.7
+    )
+
+
+# Pre-randomized scenes rotated by MockBrain (built once, not per decision)
+_MOCK_POOL = [_mock_scene() for _ in range(16)]
+
+_MOCK_RESPONSES = [
+    "Hmm, interesting!",
+    "I should probably investigate that.",
+    "This looks fun!",
+    "Better be careful here.",
+    "What's that over there?"
+]
+
+
+@lru_cache(maxsize=64)
+def _mock_personality_response(text: str, scene_ts: float) -> PersonalityResponse:
+    """Simulated personality reply, cached per (text, scene)."""
+    return PersonalityResponse(
+        text=random.choice(_MOCK_RESPONSES),
+        emotion=random.choice(["curious", "happy", "concerned"]),
+        action_suggested=random.choice(["move_forward", "turn_left", None])
+    )
+
+
+class MockBrain:
+    """Simulated brain for running the demo without API credentials."""
+
+    def __init__(self):
+        self._i = 0
+
+    def get_latest_scene(self) -> SceneUnderstanding:
+        # Simulate scene data
+        scene = _MOCK_POOL[self._i % len(_MOCK_POOL)]
+        self._i += 1
+        return dataclasses.replace(scene, timestamp=time.time())
+
+    def get_personality_response(self, text, scene_context=None):
+        scene_ts = scene_context.timestamp if scene_context else 0.0
+        return _mock_personality_response(text, scene_ts)
+
+
 def movement_callback(command: dict):
     """Handle movement commands from agent."""
     action = command.get('action', 'UNKNOWN')
@@ -38,56 +108,6 @@ def demo_autonomous_agent():
     if not all([base_url, api_key, vision_model]):
         print("\n⚠️  No API credentials, running in simulation mode\n")
 
-        # Create mock brain
-        class MockBrain:
-            def get_latest_scene(self):
-                # Simulate scene data
-                import random
-                from async_brain import SceneUnderstanding
-
-                objects = []
-                if random.random() < 0.7:
-                    objects.append({
-                        "name": random.choice(["chair", "table", "cup", "book"]),
-                        "position": random.choice(["left", "center", "right"]),
-                        "distance": random.choice(["near", "far"]),
-                        "confidence": 0.8
-                    })
-
-                return SceneUnderstanding(
-                    timestamp=time.time(),
-                    objects=objects,
-                    scene_type=random.choice(["indoor", "living_room", "kitchen"]),
-                    obstacles=["chair"] if random.random() < 0.3 else [],
-                    people_count=1 if random.random() < 0.2 else 0,
-                    safe_directions=random.choice([
-                        ["forward", "left"],
-                        ["forward", "right"],
-                        ["left", "right"],
-                        ["backward"]
-                    ]),
-                    description="Simulated scene",
-                    confidence=0.7
-                )
-
-            def get_personality_response(self, text, scene_context=None):
-                from async_brain import PersonalityResponse
-                import random
-
-                responses = [
-                    "Hmm, interesting!",
-                    "I should probably investigate that.",
-                    "This looks fun!",
-                    "Better be careful here.",
-                    "What's that over there?"
-                ]
-
-                return PersonalityResponse(
-                    text=random.choice(responses),
-                    emotion=random.choice(["curious", "happy", "concerned"]),
-                    action_suggested=random.choice(["move_forward", "turn_left", None])
-                )
-
         brain = MockBrain()
 
     else:
@@ -147,21 +167,33 @@ def demo_autonomous_agent():
         print("=" * 70 + "\n")
 
         # Run for demo duration
-        start_time = time.time()
+        start_time = time.monotonic()
         demo_duration = 60.0  # 1 minute demo
+        status_interval = 10.0
+        end = start_time + demo_duration
+        next_print = start_time + status_interval
+        get_status = agent.get_status
+
+        while True:
+            now = time.monotonic()
+            if now >= end:
+                break
 
-        while time.time() - start_time < demo_duration:
             # Print status every 10 seconds
-            if int(time.time() - start_time) % 10 == 0:
-                status = agent.get_status()
-                print(f"\n📊 Status after {int(time.time() - start_time)}s:")
-                print(f"   Mode: {status['mode']}")
-                print(f"   Goal: {status['current_goal']}")
-                print(f"   Decisions: {status['decisions_made']}")
-                print(f"   Investigated: {status['objects_investigated']}")
-                print(f"   Close calls: {status['close_calls']}\n")
-
-            time.sleep(1)
+            if now >= next_print:
+                status = get_status()
+                mode, goal = status['mode'], status['current_goal']
+                decisions, investigated = status['decisions_made'], status['objects_investigated']
+                close_calls = status['close_calls']
+                print(f"\n📊 Status after {int(now - start_time)}s:")
+                print(f"   Mode: {mode}")
+                print(f"   Goal: {goal}")
+                print(f"   Decisions: {decisions}")
+                print(f"   Investigated: {investigated}")
+                print(f"   Close calls: {close_calls}\n")
+                next_print += status_interval
+
+            time.sleep(min(1.0, max(0.0, min(next_print, end) - now)))
 
         print("\n" + "=" * 70)
         print(" DEMO COMPLETE")
@@ -6,14 +6,77 @@ Real-time object detection, depth estimation, and tracking using Hailo-8L.
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 import threading
-import queue
 
 import numpy as np
 
+import hailo_vision_kernels as kernels
+
+# Hailo app infrastructure lives in the hailo-rpi5-examples checkout; set up
+# the path and import once per process rather than per HailoVision instance
+_HAILO_PATH = str(Path.home() / "hailo-rpi5-examples")
+if _HAILO_PATH not in sys.path:
+    sys.path.insert(0, _HAILO_PATH)
+try:
+    from hailo_apps_infra.hailo_rpi_common import get_default_parser
+    _HAILO_AVAILABLE = True
+    _HAILO_IMPORT_ERROR = None
+except ImportError as e:
+    _HAILO_AVAILABLE = False
+    _HAILO_IMPORT_ERROR = e
+
+
+# Depth maps are stored quantized to uint8 bins over this range
+# (latest_depth_bins); analysis runs on the bins and converts back to cm
+# with one multiply-add. latest_depth_map stays in cm.
+DEPTH_MIN_CM = 0.0
+DEPTH_MAX_CM = 510.0
+DEPTH_BIN_CM = (DEPTH_MAX_CM - DEPTH_MIN_CM) / 255
+_DEPTH_EDGES = np.linspace(DEPTH_MIN_CM, DEPTH_MAX_CM, 256)[1:]
+
+# Depth zones, in the order zone distance arrays are laid out
+ZONE_DIRECTIONS = ("LEFT", "CENTER", "RIGHT")
+
+# Jump in depth (cm) between adjacent pixels on the center row that counts
+# as a possible edge/cliff
+CLIFF_DELTA_CM = 50.0
+_CLIFF_DELTA_BINS = CLIFF_DELTA_CM / DEPTH_BIN_CM
+
+# Frame processing time (ns) above which process_frame logs a warning
+FRAME_WARN_NS = 50_000_000
+
+# Minimum IoU between boxes in consecutive frames to keep a track ID
+TRACK_IOU_THRESHOLD = 0.3
+
+
+def quantize_depth(depth_cm: np.ndarray) -> np.ndarray:
+    """
+    Quantize a depth map in cm to uint8 bins.
+
+    Args:
+        depth_cm: Depth map (any float dtype)
+
+    Returns:
+        uint8 bin indices (0..255)
+    """
+    return np.digitize(depth_cm, _DEPTH_EDGES).astype(np.uint8)
+
+
+def dequantize_depth(depth_bins: np.ndarray) -> np.ndarray:
+    """
+    Convert uint8 depth bins back to cm.
+
+    Args:
+        depth_bins: Depth map from quantize_depth()
+
+    Returns:
+        float32 depth map in cm
+    """
+    return DEPTH_MIN_CM + depth_bins * np.float32(DEPTH_BIN_CM)
+
 
 class DetectionClass(Enum):
     """Detection priority classes for navigation."""
@@ -34,6 +97,121 @@ class Detection:
     track_id: Optional[int] = None
     depth: Optional[float] = None
     priority: DetectionClass = DetectionClass.NEUTRAL
+    label_id: int = -1  # index into LABELS, -1 if unknown
+
+
+# DetectionClass <-> int8 code used in DetectionBatch.priority
+PRIORITY_CODES = {
+    DetectionClass.CRITICAL: 0,
+    DetectionClass.WARNING: 1,
+    DetectionClass.TRACKABLE: 2,
+    DetectionClass.NEUTRAL: 3,
+}
+_PRIORITY_BY_CODE = tuple(PRIORITY_CODES)
+_CRITICAL = PRIORITY_CODES[DetectionClass.CRITICAL]
+_WARNING = PRIORITY_CODES[DetectionClass.WARNING]
+
+# Detector label set (COCO order, plus extra classes our models add);
+# the position in this tuple is the label id (stored as int8, keep < 128)
+LABELS = (
+    "person", "bicycle", "car", "motorcycle", "airplane", "bus", "train",
+    "truck", "boat", "traffic light", "fire hydrant", "stop sign",
+    "parking meter", "bench", "bird", "cat", "dog", "horse", "sheep", "cow",
+    "elephant", "bear", "zebra", "giraffe", "backpack", "umbrella", "handbag",
+    "tie", "suitcase", "frisbee", "skis", "snowboard", "sports ball", "kite",
+    "baseball bat", "baseball glove", "skateboard", "surfboard",
+    "tennis racket", "bottle", "wine glass", "cup", "fork", "knife", "spoon",
+    "bowl", "banana", "apple", "sandwich", "orange", "broccoli", "carrot",
+    "hot dog", "pizza", "donut", "cake", "chair", "couch", "potted plant",
+    "bed", "dining table", "toilet", "tv", "laptop", "mouse", "remote",
+    "keyboard", "cell phone", "microwave", "oven", "toaster", "sink",
+    "refrigerator", "book", "clock", "vase", "scissors", "teddy bear",
+    "hair drier", "toothbrush",
+    "stairs",
+)
+LABEL_IDS = {label: i for i, label in enumerate(LABELS)}
+_LABEL_ARR = np.array(LABELS, dtype=object)
+PERSON_ID = LABEL_IDS["person"]
+
+
+@dataclass
+class DetectionBatch:
+    """
+    Detections as parallel arrays (one row per detection).
+
+    Navigation checks run as array operations over the batch, comparing
+    integer label ids; label strings are only for display. Detection
+    objects are only built for the rows handed back to callers.
+    """
+
+    labels: np.ndarray      # (n,) object (str)
+    label_id: np.ndarray    # (n,) int8, index into LABELS, -1 if unknown
+    confidence: np.ndarray  # (n,) float32
+    bbox: np.ndarray        # (n, 4) int16, x1, y1, x2, y2
+    track_id: np.ndarray    # (n,) int32, -1 if untracked
+    depth: np.ndarray       # (n,) float32, NaN if unknown
+    priority: np.ndarray    # (n,) int8, see PRIORITY_CODES
+
+    @property
+    def n(self) -> int:
+        """Number of detections."""
+        return len(self.labels)
+
+    @classmethod
+    def empty(cls, n: int = 0) -> "DetectionBatch":
+        """Allocate a batch of n rows (untracked, unknown depth, neutral)."""
+        return cls(
+            labels=np.empty(n, dtype=object),
+            label_id=np.full(n, -1, dtype=np.int8),
+            confidence=np.zeros(n, dtype=np.float32),
+            bbox=np.zeros((n, 4), dtype=np.int16),
+            track_id=np.full(n, -1, dtype=np.int32),
+            depth=np.full(n, np.nan, dtype=np.float32),
+            priority=np.full(n, PRIORITY_CODES[DetectionClass.NEUTRAL], dtype=np.int8)
+        )
+
+    @classmethod
+    def from_detections(cls, detections: List[Detection]) -> "DetectionBatch":
+        """Pack a list of Detection objects."""
+        batch = cls.empty(len(detections))
+        for i, det in enumerate(detections):
+            batch.labels[i] = det.label
+            batch.label_id[i] = det.label_id if det.label_id >= 0 else LABEL_IDS.get(det.label, -1)
+            batch.confidence[i] = det.confidence
+            batch.bbox[i] = det.bbox
+            if det.track_id is not None:
+                batch.track_id[i] = det.track_id
+            if det.depth is not None:
+                batch.depth[i] = det.depth
+            batch.priority[i] = PRIORITY_CODES[det.priority]
+        return batch
+
+    def __getitem__(self, index) -> "DetectionBatch":
+        """Select rows (mask, slice or index array)."""
+        return DetectionBatch(
+            labels=self.labels[index],
+            label_id=self.label_id[index],
+            confidence=self.confidence[index],
+            bbox=self.bbox[index],
+            track_id=self.track_id[index],
+            depth=self.depth[index],
+            priority=self.priority[index]
+        )
+
+    def to_detections(self) -> List[Detection]:
+        """Materialize Detection objects for the public API."""
+        return [
+            Detection(
+                label=self.labels[i],
+                confidence=float(self.confidence[i]),
+                bbox=tuple(int(v) for v in self.bbox[i]),
+                track_id=int(self.track_id[i]) if self.track_id[i] >= 0 else None,
+                depth=None if np.isnan(self.depth[i]) else float(self.depth[i]),
+                priority=_PRIORITY_BY_CODE[self.priority[i]],
+                label_id=int(self.label_id[i])
+            )
+            for i in range(self.n)
+        ]
 
 
 @dataclass
@@ -45,6 +223,7 @@ class NavigationData:
     critical_alerts: List[str]
     depth_center: Optional[float] = None
     person_tracks: List[int] = None
+    zone_distances: Optional[np.ndarray] = None  # cm, in ZONE_DIRECTIONS order
 
 
 class HailoVision:
@@ -82,25 +261,37 @@ class HailoVision:
         self.running = False
 
         # Results
-        self.latest_detections = []
-        self.latest_depth_map = None
-        self.result_queue = queue.Queue(maxsize=10)
+        self.latest_batch = DetectionBatch.empty()
+        self.latest_depth_bins: Optional[np.ndarray] = None  # uint8, see DEPTH_BIN_CM
+        self._depth_cm: Optional[np.ndarray] = None  # latest_depth_map, built on access
+        self._depth_cm_source: Optional[np.ndarray] = None
+        self._zone_analyzer: Optional[Callable[[np.ndarray], np.ndarray]] = None
+        self._zone_analyzer_shape: Optional[Tuple[int, int]] = None
+        self._center_idx: Optional[Tuple[int, int]] = None
+        self._center_shape: Optional[Tuple[int, int]] = None
+        # Single-slot handoff: only the newest (detections, depth_map) matters
+        self._latest_result: Optional[Tuple[List[Detection], Optional[np.ndarray]]] = None
+        self._result_event = threading.Event()
+
+        # Tracking: IDs handed to detections that match nothing last frame
+        self._next_track_id = 1
 
         # Stats
         self.fps = 0.0
         self.frame_count = 0
-        self.last_fps_time = time.time()
+        self._last_fps_ns = time.monotonic_ns()
 
         # Initialize Hailo
         self._init_hailo()
 
     def _init_hailo(self):
         """Initialize Hailo pipelines."""
-        try:
-            # Import Hailo modules
-            sys.path.insert(0, str(Path.home() / "hailo-rpi5-examples"))
-            from hailo_apps_infra.hailo_rpi_common import get_default_parser
+        if not _HAILO_AVAILABLE:
+            print(f"[Hailo] WARNING: Hailo libraries not found: {_HAILO_IMPORT_ERROR}")
+            print("[Hailo] Running in simulation mode")
+            return
 
+        try:
             print("[Hailo] Initializing Hailo AI HAT+...")
 
             # TODO: Initialize detection pipeline
@@ -113,10 +304,6 @@ class HailoVision:
 
             print("[Hailo] Initialization complete")
 
-        except ImportError as e:
-            print(f"[Hailo] WARNING: Hailo libraries not found: {e}")
-            print("[Hailo] Running in simulation mode")
-
         except Exception as e:
             print(f"[Hailo] ERROR: Initialization failed: {e}")
             raise
@@ -158,6 +345,29 @@ class HailoVision:
         # if self.detection_pipeline:
         #     self.detection_pipeline.stop()
 
+    @property
+    def latest_depth_map(self) -> Optional[np.ndarray]:
+        """Latest depth map in cm (float32, read-only), from latest_depth_bins."""
+        bins = self.latest_depth_bins
+        if bins is None:
+            return None
+        if self._depth_cm_source is not bins:
+            self._depth_cm = dequantize_depth(bins)
+            self._depth_cm.flags.writeable = False
+            self._depth_cm_source = bins
+        return self._depth_cm
+
+    @latest_depth_map.setter
+    def latest_depth_map(self, depth_cm: Optional[np.ndarray]):
+        """
+        Store a depth map in cm, quantized into latest_depth_bins.
+
+        Maps must be calibrated to cm first: values outside DEPTH_MIN_CM to
+        DEPTH_MAX_CM clip to the end bins, so a relative (unitless) model
+        output would collapse into the first bin.
+        """
+        self.latest_depth_bins = None if depth_cm is None else quantize_depth(depth_cm)
+
     def process_frame(self, frame: np.ndarray) -> Tuple[List[Detection], Optional[np.ndarray]]:
         """
         Process a single frame through Hailo.
@@ -166,24 +376,75 @@ class HailoVision:
             frame: Input image (numpy array)
 
         Returns:
-            Tuple of (detections, depth_map)
+            Tuple of (detections, depth_map in cm)
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
-        # TODO: Implement actual Hailo inference
-        # For now, return empty results
-        detections = []
-        depth_map = None
+        # TODO: Implement actual Hailo inference (the base detect/depth
+        # methods return empty results until then)
+        self.detect_objects(frame)
+        depth_map = self.estimate_depth(frame)
+        batch = self._attach_depths(self.latest_batch, frame.shape)
+        detections = batch.to_detections()
 
-        # Update FPS
-        self._update_fps()
+        # Publish (replaces any result the consumer hasn't picked up yet)
+        self._latest_result = (detections, depth_map)
+        self._result_event.set()
 
-        processing_time = (time.time() - start_time) * 1000
-        if processing_time > 50:
-            print(f"[Hailo] WARNING: Frame processing took {processing_time:.1f}ms")
+        # Update FPS (integer ns bookkeeping, divide once per second)
+        self.frame_count += 1
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_fps_ns
+        if elapsed_ns >= 1_000_000_000:
+            self.fps = self.frame_count * 1e9 / elapsed_ns
+            self.frame_count = 0
+            self._last_fps_ns = now_ns
+
+        # Only format the message when it will actually be printed
+        processing_ns = now_ns - start_ns
+        if processing_ns > FRAME_WARN_NS:
+            print("[Hailo] WARNING: Frame processing took %.1fms" % (processing_ns * 1e-6))
 
         return detections, depth_map
 
+    def warmup(self, frame_shape: Tuple[int, int, int] = (480, 640, 3)):
+        """
+        Run one blank frame through process_frame so first-frame setup
+        (pipeline buffers, analyzers, compiled kernels) happens now, then
+        drop its results.
+
+        Args:
+            frame_shape: Shape of the camera frames to expect
+        """
+        try:
+            self.process_frame(np.zeros(frame_shape, dtype=np.uint8))
+            self.get_navigation_data()
+        except Exception as e:
+            print(f"[Hailo] Warmup failed (non-fatal): {e}")
+        finally:
+            self.get_latest_result()
+            self.latest_batch = DetectionBatch.empty()
+            self.latest_depth_bins = None
+
+    def get_latest_result(
+        self,
+        timeout: Optional[float] = None
+    ) -> Optional[Tuple[List[Detection], Optional[np.ndarray]]]:
+        """
+        Take the most recent process_frame() result.
+
+        Args:
+            timeout: Seconds to wait for a new result (None = don't wait)
+
+        Returns:
+            Tuple of (detections, depth_map in cm), or None if nothing new
+        """
+        if timeout is not None:
+            self._result_event.wait(timeout)
+        self._result_event.clear()
+        result, self._latest_result = self._latest_result, None
+        return result
+
     def detect_objects(self, frame: np.ndarray) -> List[Detection]:
         """
         Detect objects in frame.
@@ -206,7 +467,7 @@ class HailoVision:
             frame: Input image
 
         Returns:
-            Depth map (320x256) or None
+            Depth map in cm (320x256) or None
         """
         if not self.enable_depth:
             return None
@@ -222,111 +483,215 @@ class HailoVision:
         Returns:
             NavigationData with obstacles and safe directions
         """
-        obstacles = self._filter_obstacles()
-        safe_directions = self._analyze_depth_zones()
-        critical_alerts = self._check_critical_conditions()
-        person_tracks = self._get_person_tracks()
+        obstacles, critical_alerts, person_tracks = self._analyze_detections()
+        zone_distances = self._analyze_depth_zones()
+        safe_directions = dict(zip(ZONE_DIRECTIONS, zone_distances.tolist()))
+        if self._check_cliff():
+            critical_alerts.append("CRITICAL: Possible edge/cliff detected")
 
         # Get center depth
         depth_center = None
-        if self.latest_depth_map is not None:
-            h, w = self.latest_depth_map.shape
-            depth_center = float(self.latest_depth_map[h//2, w//2])
+        depth = self.latest_depth_bins
+        if depth is not None:
+            if depth.shape != self._center_shape:
+                h, w = depth.shape
+                self._center_idx = (h // 2, w // 2)
+                self._center_shape = depth.shape
+            depth_center = DEPTH_MIN_CM + depth.item(self._center_idx) * DEPTH_BIN_CM
 
         return NavigationData(
             obstacles=obstacles,
             safe_directions=safe_directions,
             critical_alerts=critical_alerts,
             depth_center=depth_center,
-            person_tracks=person_tracks
+            person_tracks=person_tracks,
+            zone_distances=zone_distances
         )
 
-    def _filter_obstacles(self) -> List[Detection]:
-        """Filter detections to navigation-relevant obstacles."""
-        obstacles = []
-        for det in self.latest_detections:
-            if det.priority in (DetectionClass.CRITICAL, DetectionClass.WARNING):
-                obstacles.append(det)
-        return obstacles
-
-    def _analyze_depth_zones(self) -> Dict[str, float]:
+    def _attach_depths(self, batch: DetectionBatch, frame_shape: Tuple[int, ...]) -> DetectionBatch:
         """
-        Analyze depth map to find safe movement directions.
+        Fill per-detection distances from the current depth map.
+
+        Each detection takes the depth under the bottom-center of its box
+        (where it meets the floor), scaled from frame to depth map
+        coordinates; all rows are looked up with one gather.
+
+        Args:
+            batch: Detections in frame coordinates
+            frame_shape: Shape of the frame the boxes refer to
 
         Returns:
-            Dict mapping direction (LEFT, CENTER, RIGHT) to distance in cm
+            The same batch, depth column updated in place (cm)
+        """
+        depth_map = self.latest_depth_bins
+        if depth_map is None or batch.n == 0:
+            return batch
+
+        fh, fw = frame_shape[:2]
+        dh, dw = depth_map.shape
+        bbox = batch.bbox.astype(np.int32)
+        cols = np.clip((bbox[:, 0] + bbox[:, 2]) // 2 * dw // fw, 0, dw - 1)
+        rows = np.clip(bbox[:, 3] * dh // fh, 0, dh - 1)
+        batch.depth[:] = DEPTH_MIN_CM + depth_map[rows, cols] * DEPTH_BIN_CM
+        return batch
+
+    def _assign_tracks(self, batch: DetectionBatch) -> DetectionBatch:
         """
-        if self.latest_depth_map is None:
-            return {"LEFT": 0.0, "CENTER": 0.0, "RIGHT": 0.0}
+        Carry track IDs over from the previous frame's detections.
 
-        h, w = self.latest_depth_map.shape
+        Boxes that overlap a previous box of the same label (IoU above
+        TRACK_IOU_THRESHOLD) keep its ID; the rest get fresh IDs.
 
-        # Divide into three zones
-        left_zone = self.latest_depth_map[:, :w//3]
-        center_zone = self.latest_depth_map[:, w//3:2*w//3]
-        right_zone = self.latest_depth_map[:, 2*w//3:]
+        Args:
+            batch: New detections (not yet published as latest_batch)
 
-        # Calculate average depth for each zone
-        # Note: depth values are relative, need calibration for real distances
-        return {
-            "LEFT": float(np.mean(left_zone)),
-            "CENTER": float(np.mean(center_zone)),
-            "RIGHT": float(np.mean(right_zone))
-        }
+        Returns:
+            The same batch, track_id updated in place
+        """
+        prev = self.latest_batch
+        if kernels.NUMBA_AVAILABLE:
+            assign = kernels.match_iou(prev.bbox, batch.bbox, TRACK_IOU_THRESHOLD)
+        else:
+            assign = self._match_iou(prev.bbox, batch.bbox, TRACK_IOU_THRESHOLD)
+
+        matched = assign >= 0
+        matched[matched] = prev.label_id[assign[matched]] == batch.label_id[matched]
+        batch.track_id[matched] = prev.track_id[assign[matched]]
+
+        new = np.flatnonzero(~matched)
+        batch.track_id[new] = np.arange(self._next_track_id, self._next_track_id + len(new))
+        self._next_track_id += len(new)
+        return batch
+
+    @staticmethod
+    def _match_iou(prev_bboxes: np.ndarray, curr_bboxes: np.ndarray, thresh: float) -> np.ndarray:
+        """NumPy version of kernels.match_iou (IoU matrix, greedy pick per row)."""
+        prev = prev_bboxes.astype(np.float32)
+        curr = curr_bboxes.astype(np.float32)
+        iw = np.minimum(curr[:, None, 2], prev[None, :, 2]) - np.maximum(curr[:, None, 0], prev[None, :, 0])
+        ih = np.minimum(curr[:, None, 3], prev[None, :, 3]) - np.maximum(curr[:, None, 1], prev[None, :, 1])
+        inter = np.clip(iw, 0, None) * np.clip(ih, 0, None)
+        area_c = (curr[:, 2] - curr[:, 0]) * (curr[:, 3] - curr[:, 1])
+        area_p = (prev[:, 2] - prev[:, 0]) * (prev[:, 3] - prev[:, 1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            iou = inter / (area_c[:, None] + area_p[None, :] - inter)
+        iou[inter <= 0] = 0.0
+
+        assign = np.full(len(curr), -1, dtype=np.int64)
+        for i in range(len(curr)):
+            if prev.shape[0] == 0:
+                break
+            j = int(iou[i].argmax())
+            if iou[i, j] > thresh:
+                assign[i] = j
+                iou[:, j] = 0.0
+        return assign
+
+    @property
+    def latest_detections(self) -> List[Detection]:
+        """Latest detections as Detection objects (built on access)."""
+        return self.latest_batch.to_detections()
+
+    @latest_detections.setter
+    def latest_detections(self, detections: List[Detection]):
+        self.latest_batch = DetectionBatch.from_detections(detections)
+
+    def _analyze_detections(self) -> Tuple[List[Detection], List[str], List[int]]:
+        """
+        Derive all detection-based navigation outputs in one pass.
 
-    def _check_critical_conditions(self) -> List[str]:
-        """Check for critical navigation conditions."""
-        alerts = []
-
-        # Check for critical obstacles
-        for det in self.latest_detections:
-            if det.priority == DetectionClass.CRITICAL:
-                alerts.append(f"CRITICAL: {det.label} detected at confidence {det.confidence:.2f}")
-
-        # Check for cliff/edge
-        if self.latest_depth_map is not None:
-            # Check for sudden depth drop (cliff detection)
-            depth_center = self.latest_depth_map[self.latest_depth_map.shape[0]//2, :]
-            if np.std(depth_center) > 50:  # Threshold for cliff detection
-                alerts.append("CRITICAL: Possible edge/cliff detected")
-
-        return alerts
-
-    def _get_person_tracks(self) -> List[int]:
-        """Get list of currently tracked person IDs."""
-        tracks = []
-        for det in self.latest_detections:
-            if det.label == "person" and det.track_id is not None:
-                tracks.append(det.track_id)
-        return tracks
-
-    def _classify_detection(self, label: str) -> DetectionClass:
-        """Classify detection by navigation priority."""
-        if label in self.CRITICAL_CLASSES:
-            return DetectionClass.CRITICAL
-        elif label in self.WARNING_CLASSES:
-            return DetectionClass.WARNING
-        elif label in self.TRACKABLE_CLASSES:
-            return DetectionClass.TRACKABLE
+        Returns:
+            Tuple of (obstacles, critical alerts, tracked person IDs)
+        """
+        batch = self.latest_batch
+        critical = batch.priority == _CRITICAL
+
+        # Navigation-relevant obstacles: critical or warning
+        if kernels.NUMBA_AVAILABLE:
+            obstacle_mask = kernels.filter_obstacles(batch.priority, batch.confidence, _CRITICAL, _WARNING, 0.0)
         else:
-            return DetectionClass.NEUTRAL
+            obstacle_mask = critical | (batch.priority == _WARNING)
+        obstacles = batch[obstacle_mask].to_detections()
 
-    def _update_fps(self):
-        """Update FPS counter."""
-        self.frame_count += 1
-        current_time = time.time()
-        elapsed = current_time - self.last_fps_time
+        alerts = [
+            f"CRITICAL: {batch.labels[i]} detected at confidence {batch.confidence[i]:.2f}"
+            for i in np.flatnonzero(critical)
+        ]
 
-        if elapsed >= 1.0:
-            self.fps = self.frame_count / elapsed
-            self.frame_count = 0
-            self.last_fps_time = current_time
+        tracks = batch.track_id[(batch.label_id == PERSON_ID) & (batch.track_id >= 0)].tolist()
+
+        return obstacles, alerts, tracks
+
+    def _analyze_depth_zones(self) -> np.ndarray:
+        """
+        Analyze depth map to find safe movement directions.
+
+        Returns:
+            float32 array of zone distances in cm, in ZONE_DIRECTIONS order
+        """
+        depth_map = self.latest_depth_bins
+        if depth_map is None:
+            return np.zeros(len(ZONE_DIRECTIONS), dtype=np.float32)
+
+        # Depth maps keep one resolution for the life of the pipeline, so the
+        # analyzer is specialized once per shape
+        if depth_map.shape != self._zone_analyzer_shape:
+            self._zone_analyzer = self._make_analyzer(depth_map.shape)
+            self._zone_analyzer_shape = depth_map.shape
+        return self._zone_analyzer(depth_map)
+
+    @staticmethod
+    def _make_analyzer(shape: Tuple[int, int]) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Build a zone analyzer specialized for one depth map shape.
+
+        The averaging matrix has column k holding 1/(zone pixels) for the
+        columns of zone k (left, center, right thirds) and 0 elsewhere, so
+        zone means are column sums times the matrix.
+
+        Args:
+            shape: Depth map (h, w)
+
+        Returns:
+            Function mapping a uint8 depth map to zone distances in cm
+        """
+        h, w = shape
+        bounds = (0, w//3, 2*w//3, w)
+        mask = np.zeros((w, 3), dtype=np.float32)
+        for k in range(3):
+            lo, hi = bounds[k], bounds[k + 1]
+            mask[lo:hi, k] = 1.0 / ((hi - lo) * h)
+
+        # Note: depth values are relative, need calibration for real distances
+        def analyze(depth_map: np.ndarray) -> np.ndarray:
+            if kernels.NUMBA_AVAILABLE:
+                zones = kernels.analyze_zones(depth_map)
+            else:
+                zones = depth_map.sum(axis=0) @ mask
+            zones = np.asarray(zones, dtype=np.float32)
+            return DEPTH_MIN_CM + zones * np.float32(DEPTH_BIN_CM)
+
+        return analyze
+
+    def _check_cliff(self) -> bool:
+        """Check the depth map for a possible edge/cliff."""
+        if self.latest_depth_bins is None:
+            return False
+
+        # Check for sudden depth drop (cliff detection): largest step
+        # between neighbouring pixels, in int16 so uint8 diffs don't wrap
+        depth_center = self.latest_depth_bins[self.latest_depth_bins.shape[0]//2, :]
+        if kernels.NUMBA_AVAILABLE:
+            step = kernels.cliff_score(depth_center)
+        else:
+            step = np.abs(np.diff(depth_center.astype(np.int16))).max()
+        return step > _CLIFF_DELTA_BINS
 
     def get_stats(self) -> Dict[str, Any]:
         """Get processing statistics."""
         return {
             "fps": self.fps,
-            "detection_count": len(self.latest_detections),
+            "detection_count": self.latest_batch.n,
             "depth_enabled": self.enable_depth,
             "tracking_enabled": self.enable_tracking,
             "running": self.running
@@ -343,43 +708,52 @@ class HailoVision:
 
 
 # Simulation mode for testing without Hailo hardware
+# Simulator randomness: one generator, labels the fake detector can emit
+_rng = np.random.default_rng()
+_SIM_LABEL_IDS = np.array([LABEL_IDS[label] for label in ("person", "chair", "cup", "book")], dtype=np.int8)
+
+
 class HailoVisionSimulator(HailoVision):
     """Simulator for testing without Hailo hardware."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Fake depth map is constant: simple gradient (50-200 cm), already in
+        # uint8 bins. Built once and shared read-only.
+        lo = (50 - DEPTH_MIN_CM) / DEPTH_BIN_CM
+        hi = (200 - DEPTH_MIN_CM) / DEPTH_BIN_CM
+        self._depth_cache = np.linspace(lo, hi, 320*256).reshape(256, 320).astype(np.uint8)
+        self._depth_cache.flags.writeable = False
+
+        # Compile the tracker now rather than on the first frame
+        if kernels.NUMBA_AVAILABLE:
+            empty = DetectionBatch.empty().bbox
+            kernels.match_iou(empty, empty, TRACK_IOU_THRESHOLD)
+
     def _init_hailo(self):
         """Skip Hailo initialization in simulator."""
         print("[Hailo Simulator] Running in simulation mode")
 
     def detect_objects(self, frame: np.ndarray) -> List[Detection]:
         """Generate fake detections for testing."""
-        import random
-
-        detections = []
-
-        # Simulate 0-3 random detections
-        for i in range(random.randint(0, 3)):
-            detections.append(Detection(
-                label=random.choice(["person", "chair", "cup", "book"]),
-                confidence=random.uniform(0.6, 0.95),
-                bbox=(
-                    random.randint(0, 300),
-                    random.randint(0, 200),
-                    random.randint(300, 600),
-                    random.randint(200, 400)
-                ),
-                track_id=random.randint(1, 10),
-                priority=DetectionClass.NEUTRAL
-            ))
-
-        self.latest_detections = detections
-        return detections
+        # Simulate 0-3 random detections, drawn as whole columns
+        n = int(_rng.integers(0, 3, endpoint=True))
+        batch = DetectionBatch.empty(n)
+        batch.label_id[:] = _rng.choice(_SIM_LABEL_IDS, n)
+        batch.labels[:] = _LABEL_ARR[batch.label_id]
+        batch.confidence[:] = _rng.uniform(0.6, 0.95, n)
+        batch.bbox[:] = _rng.integers((0, 0, 300, 200), (300, 200, 600, 400), (n, 4), endpoint=True)
+        if self.enable_tracking:
+            self._assign_tracks(batch)
+
+        self.latest_batch = batch
+        return batch.to_detections()
 
     def estimate_depth(self, frame: np.ndarray) -> Optional[np.ndarray]:
         """Generate fake depth map."""
         if not self.enable_depth:
             return None
 
-        # Create simple gradient depth map
-        depth_map = np.linspace(50, 200, 320*256).reshape(256, 320).astype(np.float32)
-        self.latest_depth_map = depth_map
-        return depth_map
+        self.latest_depth_bins = self._depth_cache
+        return self.latest_depth_map
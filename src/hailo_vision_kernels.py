@@ -0,0 +1,140 @@
+"""Numeric kernels for Hailo vision post-processing.
+
+Compiled with Numba when it is installed (NUMBA_AVAILABLE); HailoVision
+keeps its NumPy code paths otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels still import without Numba."""
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def analyze_zones(depth_u8):
+    """
+    Mean depth bin of the left, center and right thirds of a depth map.
+
+    Args:
+        depth_u8: (h, w) uint8 depth bins
+
+    Returns:
+        (left, center, right) means, in bins
+    """
+    h, w = depth_u8.shape
+    b1 = w // 3
+    b2 = 2 * w // 3
+    left = np.int64(0)
+    center = np.int64(0)
+    right = np.int64(0)
+    for i in range(h):
+        for j in range(b1):
+            left += depth_u8[i, j]
+        for j in range(b1, b2):
+            center += depth_u8[i, j]
+        for j in range(b2, w):
+            right += depth_u8[i, j]
+    return (left / (b1 * h), center / ((b2 - b1) * h), right / ((w - b2) * h))
+
+
+@njit(cache=True, fastmath=True)
+def cliff_score(row_u8):
+    """
+    Largest step between neighbouring pixels of a depth row.
+
+    Args:
+        row_u8: uint8 depth bins
+
+    Returns:
+        Max absolute adjacent difference, in bins
+    """
+    best = 0
+    for j in range(1, row_u8.shape[0]):
+        d = int(row_u8[j]) - int(row_u8[j - 1])
+        if d < 0:
+            d = -d
+        if d > best:
+            best = d
+    return best
+
+
+@njit(cache=True, fastmath=True)
+def filter_obstacles(priorities, confidences, critical, warning, min_confidence):
+    """
+    Mask of detections that matter for navigation.
+
+    Args:
+        priorities: int8 priority code per detection
+        confidences: float32 confidence per detection
+        critical: Code for CRITICAL priority
+        warning: Code for WARNING priority
+        min_confidence: Confidence floor
+
+    Returns:
+        Boolean mask over detections
+    """
+    n = priorities.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        p = priorities[i]
+        mask[i] = (p == critical or p == warning) and confidences[i] >= min_confidence
+    return mask
+
+
+@njit(cache=True, fastmath=True)
+def match_iou(prev_bboxes, curr_bboxes, thresh):
+    """
+    Greedily match current boxes to previous-frame boxes by IoU.
+
+    Each current box (in order) takes the unclaimed previous box with the
+    highest IoU above thresh.
+
+    Args:
+        prev_bboxes: (m, 4) previous boxes, x1, y1, x2, y2
+        curr_bboxes: (n, 4) current boxes, x1, y1, x2, y2
+        thresh: Minimum IoU for a match
+
+    Returns:
+        (n,) int64 index into prev_bboxes per current box, -1 if unmatched
+    """
+    n = curr_bboxes.shape[0]
+    m = prev_bboxes.shape[0]
+    assign = np.full(n, -1, dtype=np.int64)
+    used = np.zeros(m, dtype=np.bool_)
+    for i in range(n):
+        cx1 = float(curr_bboxes[i, 0])
+        cy1 = float(curr_bboxes[i, 1])
+        cx2 = float(curr_bboxes[i, 2])
+        cy2 = float(curr_bboxes[i, 3])
+        area_c = (cx2 - cx1) * (cy2 - cy1)
+        best = thresh
+        best_j = -1
+        for j in range(m):
+            if used[j]:
+                continue
+            px1 = float(prev_bboxes[j, 0])
+            py1 = float(prev_bboxes[j, 1])
+            px2 = float(prev_bboxes[j, 2])
+            py2 = float(prev_bboxes[j, 3])
+            iw = min(cx2, px2) - max(cx1, px1)
+            ih = min(cy2, py2) - max(cy1, py1)
+            if iw <= 0.0 or ih <= 0.0:
+                continue
+            inter = iw * ih
+            iou = inter / (area_c + (px2 - px1) * (py2 - py1) - inter)
+            if iou > best:
+                best = iou
+                best_j = j
+        if best_j >= 0:
+            assign[i] = best_j
+            used[best_j] = True
+    return assign
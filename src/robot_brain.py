@@ -7,8 +7,10 @@ The complete sensory AI system integrating:
 - Movement (hexapod control)
 """
 
+import re
 import time
 import threading
+from random import choice
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -21,6 +23,29 @@ from audio_system import AudioSystem, AudioSystemSimulator, VoiceCommand
 from vlm_client import VLMClient
 
 
+# Acknowledgment phrases per personality (one is picked per command)
+_ACK_TABLE = {
+    "friendly": (
+        "Sure thing!",
+        "On it!",
+        "Right away!",
+        "You got it!",
+        "Moving now!"
+    ),
+    "professional": ("Acknowledged. Executing.",),
+    "sarcastic": (
+        "Oh, forward. How exciting.",
+        "Sure, because I have nothing better to do.",
+        "Your wish is my command... I guess.",
+        "Fine, fine. Moving."
+    ),
+}
+_DEFAULT_ACK = ("OK",)
+
+# Object name after "find ..." / "where is ...", minus a leading article
+_OBJ_RE = re.compile(r'\b(?:find|where\s+is)\s+(?:the\s+|a\s+|an\s+)?(.+?)\s*$', re.IGNORECASE)
+
+
 class RobotState(Enum):
     """Overall robot operational states."""
     IDLE = "idle"
@@ -87,6 +112,8 @@ class RobotBrain:
 
         # Threading
         self.lock = threading.Lock()
+        # Guards self.state; notified on every transition (see wait_for_state)
+        self._state_cond = threading.Condition(threading.Lock())
 
         # Initialize subsystems
         self._init_subsystems()
@@ -146,7 +173,7 @@ class RobotBrain:
         if self.audio:
             self.audio.start()
 
-        self.state = RobotState.IDLE
+        self._set_state(RobotState.IDLE)
         self.speak("Systems online. Ready for commands.")
 
         print("[Brain] All systems operational")
@@ -189,7 +216,7 @@ class RobotBrain:
         """
         print(f"[Brain] 👂 Voice command: '{command.text}' (intent: {command.intent})")
 
-        self.state = RobotState.THINKING
+        self._set_state(RobotState.THINKING)
 
         try:
             response = self._process_command(command)
@@ -198,11 +225,10 @@ class RobotBrain:
         except Exception as e:
             print(f"[Brain] Command processing error: {e}")
             self.speak("Sorry, I encountered an error processing that command.")
-            self.state = RobotState.ERROR
+            self._set_state(RobotState.ERROR)
 
         finally:
-            if self.state != RobotState.MOVING:
-                self.state = RobotState.IDLE
+            self._set_state(RobotState.IDLE, unless=RobotState.MOVING)
 
     def _handle_vision_command(self, command: Dict[str, Any]):
         """
@@ -227,100 +253,119 @@ class RobotBrain:
         Returns:
             Robot response with speech/movement/analysis
         """
-        intent = command.intent
-        text = command.text.lower()
-
-        # Movement commands
-        if intent == 'move_forward':
+        handler = self._INTENT_HANDLERS.get(command.intent, RobotBrain._cmd_unknown)
+        return handler(self, command)
+
+    # Movement commands
+
+    def _cmd_move_forward(self, command: VoiceCommand) -> RobotResponse:
+        return RobotResponse(
+            speech=self._get_acknowledgment(),
+            movement={'action': 'FORWARD', 'duration': 2.0}
+        )
+
+    def _cmd_move_backward(self, command: VoiceCommand) -> RobotResponse:
+        return RobotResponse(
+            speech="Moving backward",
+            movement={'action': 'BACKWARD', 'duration': 2.0}
+        )
+
+    def _cmd_turn_left(self, command: VoiceCommand) -> RobotResponse:
+        return RobotResponse(
+            speech="Turning left",
+            movement={'action': 'LEFT', 'angle': 45}
+        )
+
+    def _cmd_turn_right(self, command: VoiceCommand) -> RobotResponse:
+        return RobotResponse(
+            speech="Turning right",
+            movement={'action': 'RIGHT', 'angle': 45}
+        )
+
+    def _cmd_stop(self, command: VoiceCommand) -> RobotResponse:
+        return RobotResponse(
+            speech="Stopping",
+            movement={'action': 'STOP'}
+        )
+
+    # Vision commands
+
+    def _cmd_describe_scene(self, command: VoiceCommand) -> RobotResponse:
+        if self.vision and self.current_frame is not None:
+            analysis = self.vision.manual_vlm_query("Describe what you see in detail.")
             return RobotResponse(
-                speech=self._get_acknowledgment(),
-                movement={'action': 'FORWARD', 'duration': 2.0}
+                speech=f"I see: {analysis}",
+                vision_analysis=analysis
             )
-
-        elif intent == 'move_backward':
+        else:
+            return RobotResponse(speech="Vision system not available")
+
+    def _cmd_find_object(self, command: VoiceCommand) -> RobotResponse:
+        # Extract object from text
+        obj = self._extract_object(command.text.lower())
+        if self.vision and obj:
+            query = f"Can you see a {obj} in this image? Where is it located?"
+            result = self.vision.manual_vlm_query(query)
             return RobotResponse(
-                speech="Moving backward",
-                movement={'action': 'BACKWARD', 'duration': 2.0}
+                speech=result,
+                vision_analysis=result
             )
+        else:
+            return RobotResponse(speech=f"Looking for {obj if obj else 'object'}...")
 
-        elif intent == 'turn_left':
-            return RobotResponse(
-                speech="Turning left",
-                movement={'action': 'LEFT', 'angle': 45}
-            )
+    # Mode changes
 
-        elif intent == 'turn_right':
+    def _cmd_follow_person(self, command: VoiceCommand) -> RobotResponse:
+        if self.vision:
+            self.vision.set_mode(VisionMode.AUTONOMOUS)
             return RobotResponse(
-                speech="Turning right",
-                movement={'action': 'RIGHT', 'angle': 45}
+                speech="Following mode activated. I'll track the nearest person.",
+                state_change=RobotState.MOVING
             )
+        else:
+            return RobotResponse(speech="Vision system required for following mode")
+
+    # Status commands
+
+    def _cmd_check_battery(self, command: VoiceCommand) -> RobotResponse:
+        # TODO: Get actual battery status
+        return RobotResponse(speech="Battery at 85 percent")
+
+    def _cmd_report_status(self, command: VoiceCommand) -> RobotResponse:
+        status = self.get_status()
+        speech = f"Status report: Vision {status['vision_enabled']}, " \
+                 f"Audio {status['audio_enabled']}, " \
+                 f"Mode: {status['state']}"
+        return RobotResponse(speech=speech)
 
-        elif intent == 'stop':
+    # Unknown
+
+    def _cmd_unknown(self, command: VoiceCommand) -> RobotResponse:
+        if self.vlm and self.current_frame is not None:
+            # Ask VLM for help with unknown command
+            response = self.vision.manual_vlm_query(
+                f"A robot heard this command: '{command.text}'. "
+                f"Based on what you see, what should the robot do?"
+            )
+            return RobotResponse(speech=response)
+        else:
             return RobotResponse(
-                speech="Stopping",
-                movement={'action': 'STOP'}
+                speech="I didn't understand that command. Try: forward, left, right, or describe scene."
             )
 
-        # Vision commands
-        elif intent == 'describe_scene':
-            if self.vision and self.current_frame is not None:
-                analysis = self.vision.manual_vlm_query("Describe what you see in detail.")
-                return RobotResponse(
-                    speech=f"I see: {analysis}",
-                    vision_analysis=analysis
-                )
-            else:
-                return RobotResponse(speech="Vision system not available")
-
-        elif intent == 'find_object':
-            # Extract object from text
-            obj = self._extract_object(text)
-            if self.vision and obj:
-                query = f"Can you see a {obj} in this image? Where is it located?"
-                result = self.vision.manual_vlm_query(query)
-                return RobotResponse(
-                    speech=result,
-                    vision_analysis=result
-                )
-            else:
-                return RobotResponse(speech=f"Looking for {obj if obj else 'object'}...")
-
-        # Mode changes
-        elif intent == 'follow_person':
-            if self.vision:
-                self.vision.set_mode(VisionMode.AUTONOMOUS)
-                return RobotResponse(
-                    speech="Following mode activated. I'll track the nearest person.",
-                    state_change=RobotState.MOVING
-                )
-            else:
-                return RobotResponse(speech="Vision system required for following mode")
-
-        # Status commands
-        elif intent == 'check_battery':
-            # TODO: Get actual battery status
-            return RobotResponse(speech="Battery at 85 percent")
-
-        elif intent == 'report_status':
-            status = self.get_status()
-            speech = f"Status report: Vision {status['vision_enabled']}, " \
-                     f"Audio {status['audio_enabled']}, " \
-                     f"Mode: {status['state']}"
-            return RobotResponse(speech=speech)
-
-        # Unknown
-        else:
-            if self.vlm and self.current_frame is not None:
-                # Ask VLM for help with unknown command
-                response = self.vision.manual_vlm_query(
-                    f"A robot heard this command: '{command.text}'. "
-                    f"Based on what you see, what should the robot do?"
-                )
-                return RobotResponse(speech=response)
-            else:
-                return RobotResponse(
-                    speech="I didn't understand that command. Try: forward, left, right, or describe scene."
-                )
+    # Intent -> handler (plain functions, called with self)
+    _INTENT_HANDLERS = {
+        'move_forward': _cmd_move_forward,
+        'move_backward': _cmd_move_backward,
+        'turn_left': _cmd_turn_left,
+        'turn_right': _cmd_turn_right,
+        'stop': _cmd_stop,
+        'describe_scene': _cmd_describe_scene,
+        'find_object': _cmd_find_object,
+        'follow_person': _cmd_follow_person,
+        'check_battery': _cmd_check_battery,
+        'report_status': _cmd_report_status,
+    }
 
     def _execute_response(self, response: RobotResponse):
         """
@@ -335,51 +380,23 @@ class RobotBrain:
 
         # State change
         if response.state_change:
-            self.state = response.state_change
+            self._set_state(response.state_change)
 
         # Movement
         if response.movement:
-            self.state = RobotState.MOVING
+            self._set_state(RobotState.MOVING)
             if self.movement_callback:
                 self.movement_callback(response.movement)
             self.commands_executed += 1
 
     def _extract_object(self, text: str) -> Optional[str]:
         """Extract object name from text like 'find the cup'."""
-        words = text.split()
-        # Simple extraction - look after "find" or "where is"
-        if 'find' in words:
-            idx = words.index('find') + 1
-            if idx < len(words):
-                return ' '.join(words[idx:]).replace('the', '').replace('a', '').strip()
-        elif 'where' in text:
-            # Extract after "where is"
-            return text.split('where is')[-1].strip()
-        return None
+        m = _OBJ_RE.search(text)
+        return m.group(1) if m else None
 
     def _get_acknowledgment(self) -> str:
         """Get personality-appropriate acknowledgment."""
-        if self.personality == "friendly":
-            import random
-            return random.choice([
-                "Sure thing!",
-                "On it!",
-                "Right away!",
-                "You got it!",
-                "Moving now!"
-            ])
-        elif self.personality == "professional":
-            return "Acknowledged. Executing."
-        elif self.personality == "sarcastic":
-            import random
-            return random.choice([
-                "Oh, forward. How exciting.",
-                "Sure, because I have nothing better to do.",
-                "Your wish is my command... I guess.",
-                "Fine, fine. Moving."
-            ])
-        else:
-            return "OK"
+        return choice(_ACK_TABLE.get(self.personality, _DEFAULT_ACK))
 
     def speak(self, text: str, wait: bool = False):
         """
@@ -390,14 +407,40 @@ class RobotBrain:
             wait: Wait for speech to complete
         """
         if self.audio:
-            self.state = RobotState.SPEAKING
+            self._set_state(RobotState.SPEAKING)
             self.audio.speak(text, wait=wait)
-            if not wait:
-                time.sleep(0.1)  # Brief pause
-            self.state = RobotState.IDLE
+            self._set_state(RobotState.IDLE)
         else:
             print(f"[Brain] 🗣️  {text}")
 
+    def _set_state(self, new_state: RobotState, unless: Optional[RobotState] = None):
+        """
+        Transition state under the state lock.
+
+        Args:
+            new_state: State to switch to
+            unless: Leave the state alone if it currently equals this
+        """
+        with self._state_cond:
+            if self.state == new_state or self.state == unless:
+                return
+            self.state = new_state
+            self._state_cond.notify_all()
+
+    def wait_for_state(self, state: RobotState, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the robot reaches a state.
+
+        Args:
+            state: State to wait for
+            timeout: Max seconds to wait (None = forever)
+
+        Returns:
+            True if the state was reached, False on timeout
+        """
+        with self._state_cond:
+            return self._state_cond.wait_for(lambda: self.state == state, timeout)
+
     def set_movement_callback(self, callback):
         """Set callback for movement commands."""
         self.movement_callback = callback
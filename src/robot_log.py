@@ -0,0 +1,24 @@
+"""Non-blocking logging for the vision and speech threads."""
+
+import sys
+import atexit
+import queue
+import logging
+import logging.handlers
+
+# Records are handed to a background listener through this queue, so the
+# logging call in a hot loop never takes the stream lock or writes
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+logger = logging.getLogger("robot")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+
+_stream = logging.StreamHandler(sys.stdout)
+_stream.setFormatter(logging.Formatter("%(message)s"))
+_listener = logging.handlers.QueueListener(_LOG_QUEUE, _stream)
+_listener.start()
+
+# Drain whatever is still queued before the interpreter exits
+atexit.register(_listener.stop)
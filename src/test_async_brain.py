@@ -4,6 +4,7 @@
 import sys
 import time
 import os
+import argparse
 from pathlib import Path
 import asyncio
 
@@ -15,31 +16,141 @@ from dotenv import load_dotenv
 
 from async_brain import AsyncRobotBrain, SceneUnderstanding, PersonalityResponse
 
+# Banners are written in one call each rather than line-by-line print()s
+_RULE = "=" * 70
+_HEADER = f"{_RULE}\n ASYNC ROBOT BRAIN TEST\n{_RULE}\n"
+_COMPLETE = f"\n{_RULE}\n TEST COMPLETE ✓\n{_RULE}\n"
+_PARSE_HEADER = f"{_RULE}\n JSON PARSING TEST\n{_RULE}\n"
+_PARSE_COMPLETE = f"\n{_RULE}\n JSON PARSING TEST COMPLETE ✓\n{_RULE}\n"
 
-def create_test_scene():
-    """Create synthetic test scene."""
-    img = Image.new('RGB', (640, 480), color='lightblue')
-    draw = ImageDraw.Draw(img)
+_ARCHITECTURE = """
+╔═══════════════════════════════════════════════════════════╗
+║          ASYNC ROBOT BRAIN ARCHITECTURE                  ║
+╚═══════════════════════════════════════════════════════════╝
+
+┌─────────────────────────────────────────────────────────┐
+│                   CAMERA INPUT                          │
+│                  (30 FPS stream)                        │
+└──────────────┬──────────────────────────────────────────┘
+               │
+               ├────────────────────┬─────────────────────┐
+               │                    │                     │
+               ▼                    ▼                     ▼
+        ┌──────────┐         ┌──────────┐        ┌──────────┐
+        │  HAILO   │         │   VLM    │        │ DISPLAY  │
+        │Real-time │         │  Async   │        │ (Client) │
+        │30 FPS    │         │ 3-5 sec  │        │          │
+        │Detection │         │intervals │        │          │
+        └────┬─────┘         └────┬─────┘        └──────────┘
+             │                    │
+             │  Immediate         │  Structured JSON
+             │  Obstacles         │  Scene Understanding
+             │                    │
+             ▼                    ▼
+        ┌────────────────────────────────┐
+        │    DECISION FUSION             │
+        │  - VLM scene context           │
+        │  - Hailo real-time obstacles   │
+        │  - User voice commands         │
+        └───────────────┬────────────────┘
+                        │
+                        ▼
+        ┌───────────────────────────────┐
+        │   PERSONALITY LLM (Async)     │
+        │  - Natural language response  │
+        │  - Emotion                    │
+        │  - Action suggestion          │
+        └───────────────┬───────────────┘
+                        │
+            ┌───────────┼──────────┐
+            │           │          │
+            ▼           ▼          ▼
+      ┌─────────┐  ┌────────┐  ┌─────────┐
+      │ SPEAKER │  │ MOTORS │  │ DISPLAY │
+      │   TTS   │  │ Servos │  │  Debug  │
+      └─────────┘  └────────┘  └─────────┘
+
+KEY FEATURES:
+✓ Non-blocking async API calls
+✓ Structured JSON responses (easy parsing)
+✓ Separate VLM (vision) and LLM (personality)
+✓ Real-time Hailo for safety
+✓ Periodic VLM for context (not every frame)
+
+"""
+
+
+# Pixel grids for shape masks (all test frames are 640x480)
+_FRAME_H, _FRAME_W = 480, 640
+_Y, _X = np.ogrid[:_FRAME_H, :_FRAME_W]
+
+
+def _rect(img, box, fill, width=0):
+    """Filled rectangle with a black outline (PIL-style inclusive box)."""
+    x0, y0, x1, y1 = box
+    img[y0:y1 + 1, x0:x1 + 1] = 0
+    img[y0 + width:y1 + 1 - width, x0 + width:x1 + 1 - width] = fill
+
+
+def _ellipse_mask(box, inset=0):
+    x0, y0, x1, y1 = box
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    rx, ry = (x1 - x0) / 2 - inset, (y1 - y0) / 2 - inset
+    return ((_X - cx) / rx) ** 2 + ((_Y - cy) / ry) ** 2 <= 1
+
+
+def _ellipse(img, box, fill, width=0):
+    """Filled ellipse with a black outline."""
+    img[_ellipse_mask(box)] = 0
+    img[_ellipse_mask(box, width)] = fill
+
+
+def _text_mask(text):
+    """Rasterize text once with PIL's default font, as a bool mask."""
+    _, _, w, h = ImageDraw.Draw(Image.new('L', (1, 1))).textbbox((0, 0), text)
+    glyphs = Image.new('L', (w, h))
+    ImageDraw.Draw(glyphs).text((0, 0), text, fill=255)
+    return np.asarray(glyphs) > 127
+
+
+def _blit_text(img, mask, x, y):
+    h, w = mask.shape
+    img[y:y + h, x:x + w][mask] = 0
+
+
+_SCENE_TITLE = _text_mask("Robot Test Scene")
+
+
+def create_test_scene(out=None):
+    """
+    Create synthetic test scene.
+
+    Args:
+        out: Optional (480, 640, 3) uint8 buffer to draw into
+
+    Returns:
+        RGB frame (out, if given)
+    """
+    img = out if out is not None else np.empty((_FRAME_H, _FRAME_W, 3), dtype=np.uint8)
+    img[:] = (173, 216, 230)  # lightblue
 
     # Draw environment
-    draw.rectangle([0, 400, 640, 480], fill='gray')  # Floor
-    draw.rectangle([100, 250, 200, 400], fill='brown', outline='black', width=3)  # Chair
-    draw.ellipse([400, 300, 500, 400], fill='red', outline='black', width=3)  # Ball
+    _rect(img, (0, 400, 639, 479), (128, 128, 128))                # Floor
+    _rect(img, (100, 250, 200, 400), (165, 42, 42), width=3)       # Chair
+    _ellipse(img, (400, 300, 500, 400), (255, 0, 0), width=3)      # Ball
 
     # Draw person
-    draw.ellipse([500, 180, 580, 250], fill='peachpuff', outline='black', width=2)  # Head
-    draw.rectangle([515, 250, 565, 350], fill='blue', outline='black', width=2)     # Body
+    _ellipse(img, (500, 180, 580, 250), (255, 218, 185), width=2)  # Head
+    _rect(img, (515, 250, 565, 350), (0, 0, 255), width=2)         # Body
 
-    draw.text((10, 10), "Robot Test Scene", fill='black')
+    _blit_text(img, _SCENE_TITLE, 10, 10)
 
-    return np.array(img)
+    return img
 
 
 def test_async_brain():
     """Test async brain with real API calls."""
-    print("=" * 70)
-    print(" ASYNC ROBOT BRAIN TEST")
-    print("=" * 70)
+    sys.stdout.write(_HEADER)
 
     # Load credentials
     load_dotenv()
@@ -78,19 +189,16 @@ def test_async_brain():
 
         # Wait for first VLM analysis
         print("[2/4] Waiting for VLM scene analysis...")
-        for i in range(10):
-            time.sleep(1)
+        if brain.wait_for_scene(timeout=10):
             scene = brain.get_latest_scene()
-            if scene:
-                print(f"\n✓ Scene analyzed!")
-                print(f"  Scene type: {scene.scene_type}")
-                print(f"  Objects: {[obj['name'] for obj in scene.objects]}")
-                print(f"  People: {scene.people_count}")
-                print(f"  Obstacles: {scene.obstacles}")
-                print(f"  Safe directions: {scene.safe_directions}")
-                print(f"  Description: {scene.description}")
-                print(f"  Confidence: {scene.confidence:.2f}")
-                break
+            print(f"\n✓ Scene analyzed!")
+            print(f"  Scene type: {scene.scene_type}")
+            print(f"  Objects: {[obj['name'] for obj in scene.objects]}")
+            print(f"  People: {scene.people_count}")
+            print(f"  Obstacles: {scene.obstacles}")
+            print(f"  Safe directions: {scene.safe_directions}")
+            print(f"  Description: {scene.description}")
+            print(f"  Confidence: {scene.confidence:.2f}")
         else:
             print("⚠️  No scene data received (timeout)")
             scene = None
@@ -104,30 +212,23 @@ def test_async_brain():
             "Is it safe here?"
         ]
 
-        for user_input in test_inputs:
-            print(f"\n👤 User: \"{user_input}\"")
-
-            response = brain.get_personality_response(
-                user_input,
-                scene_context=scene
-            )
+        # All prompts go out together
+        responses = brain.get_personality_responses_batch(test_inputs, scene_context=scene)
 
+        for user_input, response in zip(test_inputs, responses):
+            print(f"\n👤 User: \"{user_input}\"")
             print(f"🤖 Robot: \"{response.text}\"")
             print(f"   Emotion: {response.emotion}")
             if response.action_suggested:
                 print(f"   Suggested action: {response.action_suggested}")
 
-            time.sleep(1)
-
         # Stats
         print("\n[4/4] System statistics:")
         stats = brain.get_stats()
         for key, value in stats.items():
             print(f"  {key}: {value}")
 
-        print("\n" + "=" * 70)
-        print(" TEST COMPLETE ✓")
-        print("=" * 70)
+        sys.stdout.write(_COMPLETE)
 
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
@@ -141,9 +242,7 @@ def test_async_brain():
 
 def test_json_parsing():
     """Test JSON parsing from VLM responses."""
-    print("=" * 70)
-    print(" JSON PARSING TEST")
-    print("=" * 70)
+    sys.stdout.write(_PARSE_HEADER)
 
     from async_brain import AsyncRobotBrain
 
@@ -181,70 +280,22 @@ def test_json_parsing():
         print(f"  Description: {result.description[:50]}...")
         print(f"  Confidence: {result.confidence}")
 
-    print("\n" + "=" * 70)
-    print(" JSON PARSING TEST COMPLETE ✓")
-    print("=" * 70)
+    sys.stdout.write(_PARSE_COMPLETE)
 
 
 def demo_architecture():
-    """Show the async architecture diagram."""
-    print("""
-╔═══════════════════════════════════════════════════════════╗
-║          ASYNC ROBOT BRAIN ARCHITECTURE                  ║
-╚═══════════════════════════════════════════════════════════╝
-
-┌─────────────────────────────────────────────────────────┐
-│                   CAMERA INPUT                          │
-│                  (30 FPS stream)                        │
-└──────────────┬──────────────────────────────────────────┘
-               │
-               ├────────────────────┬─────────────────────┐
-               │                    │                     │
-               ▼                    ▼                     ▼
-        ┌──────────┐         ┌──────────┐        ┌──────────┐
-        │  HAILO   │         │   VLM    │        │ DISPLAY  │
-        │Real-time │         │  Async   │        │ (Client) │
-        │30 FPS    │         │ 3-5 sec  │        │          │
-        │Detection │         │intervals │        │          │
-        └────┬─────┘         └────┬─────┘        └──────────┘
-             │                    │
-             │  Immediate         │  Structured JSON
-             │  Obstacles         │  Scene Understanding
-             │                    │
-             ▼                    ▼
-        ┌────────────────────────────────┐
-        │    DECISION FUSION             │
-        │  - VLM scene context           │
-        │  - Hailo real-time obstacles   │
-        │  - User voice commands         │
-        └───────────────┬────────────────┘
-                        │
-                        ▼
-        ┌───────────────────────────────┐
-        │   PERSONALITY LLM (Async)     │
-        │  - Natural language response  │
-        │  - Emotion                    │
-        │  - Action suggestion          │
-        └───────────────┬───────────────┘
-                        │
-            ┌───────────┼──────────┐
-            │           │          │
-            ▼           ▼          ▼
-      ┌─────────┐  ┌────────┐  ┌─────────┐
-      │ SPEAKER │  │ MOTORS │  │ DISPLAY │
-      │   TTS   │  │ Servos │  │  Debug  │
-      └─────────┘  └────────┘  └─────────┘
-
-KEY FEATURES:
-✓ Non-blocking async API calls
-✓ Structured JSON responses (easy parsing)
-✓ Separate VLM (vision) and LLM (personality)
-✓ Real-time Hailo for safety
-✓ Periodic VLM for context (not every frame)
-""")
+    """Show the async architecture diagram (interactive terminals only)."""
+    if not sys.stdout.isatty():
+        return
+    sys.stdout.write(_ARCHITECTURE)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--live", action="store_true",
+                        help="Also run the live test against the LiteLLM gateway")
+    args = parser.parse_args()
+
     print("\n")
 
     # Show architecture
@@ -253,11 +304,7 @@ if __name__ == "__main__":
     # Test JSON parsing
     test_json_parsing()
 
-    print("\n\nReady to test with real API?")
-    print("This will make actual calls to your LiteLLM gateway.")
-
-    user_input = input("\nRun live test? (y/n): ").strip().lower()
-    if user_input == 'y':
+    if args.live:
         test_async_brain()
     else:
-        print("\nSkipping live test. Use 'python src/test_async_brain.py' to run later.")
+        print("\nSkipping live test. Use 'python src/test_async_brain.py --live' to make real API calls.")
@@ -28,7 +28,7 @@ def test_basic_tts():
     tts.speak("And play in sequence.")
 
     # Wait for queue to finish
-    time.sleep(5)
+    tts.wait_idle()
 
     print("\n✓ Basic TTS test passed\n")
 
@@ -41,25 +41,24 @@ def test_narrator():
 
     tts = PiperTTS()
     narrator = VoiceNarrator(tts)
+    # Queue everything back to back; flush() waits for playback
+    narrator.min_narration_interval = 0.0
 
     print("\nTest 2.1: Greeting")
     narrator.greet()
-    time.sleep(3)
 
     print("\nTest 2.2: Scene narration")
     narrator.narrate_scene("I can see a room with a chair, table, and a person standing near the door.")
-    time.sleep(4)
 
     print("\nTest 2.3: Obstacle warning")
     narrator.narrate_obstacle("chair", "ahead", "2 meters")
-    time.sleep(3)
 
     print("\nTest 2.4: Action narration")
     narrator.set_verbosity(actions=True)
     narrator.narrate_action("LEFT")
-    time.sleep(2)
     narrator.narrate_action("FORWARD")
-    time.sleep(2)
+
+    narrator.flush(timeout=15)
 
     print("\n✓ Narrator test passed\n")
 
@@ -71,15 +70,10 @@ def test_vision_integration():
     print("=" * 70)
 
     from vision_manager import VisionManager, VisionMode
-    from PIL import Image, ImageDraw
-    import numpy as np
+    from test_vision_integration import cached_test_frame
 
-    # Create test image
-    img = Image.new('RGB', (640, 480), color='lightblue')
-    draw = ImageDraw.Draw(img)
-    draw.rectangle([100, 200, 300, 400], fill='brown', outline='black', width=3)
-    draw.ellipse([400, 200, 550, 350], fill='red', outline='black', width=3)
-    frame = np.array(img)
+    # Shared synthetic test frame
+    frame = cached_test_frame()
 
     # Create vision manager with TTS
     manager = VisionManager(
@@ -158,9 +152,7 @@ def test_interactive():
                 narrator.say(text)
 
             # Wait for speech to complete
-            time.sleep(0.5)
-            while tts.is_speaking():
-                time.sleep(0.1)
+            tts.wait_idle()
 
         except KeyboardInterrupt:
             print("\n\nExiting...")
@@ -3,6 +3,8 @@
 
 import sys
 import time
+import argparse
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from PIL import Image, ImageDraw
@@ -14,28 +16,96 @@ from vision_manager import VisionManager, VisionMode
 from hailo_vision import HailoVisionSimulator
 
 
-def create_test_frame():
-    """Create synthetic test frame."""
+# Pixel grids for shape masks (all test frames are 640x480)
+_FRAME_H, _FRAME_W = 480, 640
+_Y, _X = np.ogrid[:_FRAME_H, :_FRAME_W]
+
+
+def _rect(img, box, fill, width=0):
+    """Filled rectangle with a black outline (PIL-style inclusive box)."""
+    x0, y0, x1, y1 = box
+    img[y0:y1 + 1, x0:x1 + 1] = 0
+    img[y0 + width:y1 + 1 - width, x0 + width:x1 + 1 - width] = fill
+
+
+def _ellipse_mask(box, inset=0):
+    x0, y0, x1, y1 = box
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    rx, ry = (x1 - x0) / 2 - inset, (y1 - y0) / 2 - inset
+    return ((_X - cx) / rx) ** 2 + ((_Y - cy) / ry) ** 2 <= 1
+
+
+def _ellipse(img, box, fill, width=0):
+    """Filled ellipse with a black outline."""
+    img[_ellipse_mask(box)] = 0
+    img[_ellipse_mask(box, width)] = fill
+
+
+def _text_mask(text):
+    """Rasterize text once with PIL's default font, as a bool mask."""
+    _, _, w, h = ImageDraw.Draw(Image.new('L', (1, 1))).textbbox((0, 0), text)
+    glyphs = Image.new('L', (w, h))
+    ImageDraw.Draw(glyphs).text((0, 0), text, fill=255)
+    return np.asarray(glyphs) > 127
+
+
+def _blit_text(img, mask, x, y):
+    h, w = mask.shape
+    img[y:y + h, x:x + w][mask] = 0
+
+
+def _triangle(img, pts, fill):
+    """Filled triangle (no outline)."""
+    (ax, ay), (bx, by), (cx, cy) = pts
+    d1 = (_X - bx) * (ay - by) - (ax - bx) * (_Y - by)
+    d2 = (_X - cx) * (by - cy) - (bx - cx) * (_Y - cy)
+    d3 = (_X - ax) * (cy - ay) - (cx - ax) * (_Y - ay)
+    neg = (d1 < 0) | (d2 < 0) | (d3 < 0)
+    pos = (d1 > 0) | (d2 > 0) | (d3 > 0)
+    img[~(neg & pos)] = fill
+
+
+_FRAME_TITLE = _text_mask("Robot Vision Test Frame")
+
+
+def create_test_frame(out=None):
+    """
+    Create synthetic test frame.
+
+    Args:
+        out: Optional (480, 640, 3) uint8 buffer to draw into
+
+    Returns:
+        RGB frame (out, if given)
+    """
     # Create 640x480 image
-    img = Image.new('RGB', (640, 480), color='lightblue')
-    draw = ImageDraw.Draw(img)
+    img = out if out is not None else np.empty((_FRAME_H, _FRAME_W, 3), dtype=np.uint8)
+    img[:] = (173, 216, 230)  # lightblue
 
     # Draw floor
-    draw.rectangle([0, 400, 640, 480], fill='gray')
+    _rect(img, (0, 400, 639, 479), (128, 128, 128))
 
     # Draw obstacles
-    draw.rectangle([100, 250, 200, 400], fill='brown', outline='black', width=3)  # Box
-    draw.ellipse([400, 200, 500, 300], fill='red', outline='black', width=3)      # Ball
-    draw.polygon([(300, 350), (350, 400), (250, 400)], fill='green', outline='black', width=3)  # Pyramid
+    _rect(img, (100, 250, 200, 400), (165, 42, 42), width=3)                  # Box
+    _ellipse(img, (400, 200, 500, 300), (255, 0, 0), width=3)                 # Ball
+    _triangle(img, ((300, 350), (350, 400), (250, 400)), (0, 128, 0))         # Pyramid
 
     # Draw person
-    draw.ellipse([500, 180, 580, 250], fill='peachpuff', outline='black', width=2)  # Head
-    draw.rectangle([515, 250, 565, 350], fill='blue', outline='black', width=2)     # Body
+    _ellipse(img, (500, 180, 580, 250), (255, 218, 185), width=2)  # Head
+    _rect(img, (515, 250, 565, 350), (0, 0, 255), width=2)         # Body
 
     # Add text
-    draw.text((10, 10), "Robot Vision Test Frame", fill='black')
+    _blit_text(img, _FRAME_TITLE, 10, 10)
+
+    return img
+
 
-    return np.array(img)
+@lru_cache(maxsize=1)
+def cached_test_frame():
+    """Shared test frame, drawn once per run (read-only)."""
+    frame = create_test_frame()
+    frame.flags.writeable = False
+    return frame
 
 
 def test_hailo_only():
@@ -49,7 +119,7 @@ def test_hailo_only():
 
     try:
         # Create test frame
-        frame = create_test_frame()
+        frame = cached_test_frame()
 
         # Process frame
         print("\nProcessing frame...")
@@ -109,7 +179,7 @@ def test_vision_manager():
         # Test manual mode
         print("\n--- Testing MANUAL mode ---")
         manager.set_mode(VisionMode.MANUAL)
-        frame = create_test_frame()
+        frame = cached_test_frame()
         manager.update_frame(frame)
         time.sleep(1)
 
@@ -155,7 +225,7 @@ def test_manual_vlm_query():
     try:
         manager.start()
 
-        frame = create_test_frame()
+        frame = cached_test_frame()
         manager.update_frame(frame)
 
         print("\nQuerying VLM: 'What objects do you see?'")
@@ -176,8 +246,13 @@ def test_manual_vlm_query():
     print("\n✓ Manual VLM query test completed\n")
 
 
-def main():
-    """Run all tests."""
+def main(live: bool = False):
+    """
+    Run all tests.
+
+    Args:
+        live: Also run the VLM test (real API calls, needs .env credentials)
+    """
     print("\n" + "=" * 70)
     print(" Hailo + VLM Vision Integration Test Suite")
     print("=" * 70 + "\n")
@@ -190,14 +265,10 @@ def main():
         test_vision_manager()
 
         # Test 3: Manual VLM query (requires .env credentials)
-        print("Would you like to test VLM integration? (requires .env credentials)")
-        print("This will make actual API calls to your LiteLLM gateway.")
-
-        user_input = input("Run VLM test? (y/n): ").strip().lower()
-        if user_input == 'y':
+        if live:
             test_manual_vlm_query()
         else:
-            print("\nSkipping VLM test")
+            print("\nSkipping VLM test (pass --live to make real API calls)")
 
     except KeyboardInterrupt:
         print("\n\nTests interrupted by user")
@@ -212,4 +283,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--live", action="store_true",
+                        help="Also run the VLM test against the LiteLLM gateway")
+    main(live=parser.parse_args().live)
@@ -3,9 +3,13 @@
 
 from vlm_client import VLMClient
 from PIL import Image, ImageDraw
+from functools import lru_cache
+from pathlib import Path
+import io
 import sys
 
 
+@lru_cache(maxsize=1)
 def create_test_image():
     """Create a simple test image."""
     img = Image.new('RGB', (640, 480), color='skyblue')
@@ -24,6 +28,14 @@ def create_test_image():
     return img
 
 
+@lru_cache(maxsize=1)
+def create_test_jpeg():
+    """JPEG bytes of the test image, encoded once per run."""
+    buffer = io.BytesIO()
+    create_test_image().save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
 def main():
     """Run quick VLM test."""
     print("=" * 70)
@@ -31,13 +43,13 @@ def main():
     print("=" * 70)
 
     # Create test image
-    print("\n[1/4] Creating test image...")
+    print("\n[1/3] Creating test image...")
     img = create_test_image()
-    img.save("/tmp/vlm_test.jpg")
+    Path("/tmp/vlm_test.jpg").write_bytes(create_test_jpeg())
     print("      Saved to /tmp/vlm_test.jpg")
 
     # Initialize client
-    print("\n[2/4] Connecting to VLM API...")
+    print("\n[2/3] Connecting to VLM API...")
     try:
         client = VLMClient()
         print(f"      Connected to: {client.base_url}")
@@ -50,22 +62,14 @@ def main():
         print("      - VISION_MODEL")
         sys.exit(1)
 
-    # Test object detection
-    print("\n[3/4] Testing object detection...")
+    # Test object detection + navigation assistance (one request)
+    print("\n[3/3] Testing object detection and navigation assistance...")
     try:
-        objects = client.detect_objects(img)
+        result = client.analyze(img, tasks=("detect", "navigate"))
         print(f"\n      Objects detected:")
-        print(f"      {objects}")
-    except Exception as e:
-        print(f"      ERROR: {e}")
-        sys.exit(1)
-
-    # Test navigation assistance
-    print("\n[4/4] Testing navigation assistance...")
-    try:
-        nav = client.navigate_assistance(img)
+        print(f"      {result['objects']}")
         print(f"\n      Navigation guidance:")
-        print(f"      {nav}")
+        print(f"      {result['navigation']}")
     except Exception as e:
         print(f"      ERROR: {e}")
         sys.exit(1)
@@ -2,11 +2,196 @@
 
 import subprocess
 import os
+import re
+import json
+import wave
+import fcntl
+import shutil
+import tempfile
+import functools
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
+from random import choice
 import threading
 import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from robot_log import logger
+
+# In-process synthesis/playback; without these PiperTTS drives the piper
+# and aplay binaries instead
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+try:
+    from piper_phonemize import phonemize_espeak
+except ImportError:
+    phonemize_espeak = None
+try:
+    import sounddevice as sd
+except ImportError:
+    sd = None
+
+# Sentences waiting to be spoken before speak() starts dropping new ones
+SPEECH_QUEUE_SIZE = 10
+
+# Piper processes rendering ahead of playback
+SYNTH_WORKERS = 2
+
+# ONNX Runtime threads per synthesis worker: the workers run concurrently,
+# so each gets an equal share of the cores instead of all of them
+SYNTH_THREADS = max(1, (os.cpu_count() or 1) // SYNTH_WORKERS)
+
+# Helpers are started via subprocess's posix_spawn path (no fork of this
+# large process), which needs an absolute executable and close_fds=False;
+# Python's own fds are non-inheritable, so nothing extra leaks to children
+_APLAY = shutil.which("aplay") or "/usr/bin/aplay"
+
+# Distinct scene descriptions whose spoken summaries are kept
+SUMMARY_CACHE_SIZE = 256
+
+# Sentence splitter for narration text (drops the terminal punctuation)
+_SPLIT_RE = re.compile(r"[.!?]+\s*")
+
+# Action phrases _extract_key_guidance looks for, highest priority first
+_GUIDANCE_PHRASES = (
+    "move forward", "turn left", "turn right", "stop",
+    "go straight", "back up", "safe to proceed", "avoid"
+)
+_GUIDANCE_RANK = {phrase: i for i, phrase in enumerate(_GUIDANCE_PHRASES)}
+_GUIDANCE_RE = re.compile("|".join(map(re.escape, _GUIDANCE_PHRASES)), re.IGNORECASE)
+
+# aplay stdin pipe size: ~24 s of 22.05 kHz S16 audio instead of the
+# default 64 KiB (~1.5 s), so playback writes rarely block part-way
+PIPE_SIZE = 1 << 20
+
+# Sentence boundaries: whitespace after terminal punctuation
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Piper writes each utterance's WAV here (tmpfs when available)
+_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+# Environment for piper processes: cap the OpenMP pool of its embedded
+# ONNX Runtime at this worker's share of the cores (unless set already)
+_PIPER_ENV = {"OMP_NUM_THREADS": str(SYNTH_THREADS), **os.environ}
+
+# Fallback when the voice has no .onnx.json sidecar
+DEFAULT_SAMPLE_RATE = 22050
+
+
+@functools.lru_cache(maxsize=1)
+def _load_voice(model_path: str) -> dict:
+    """
+    Load a Piper voice's config once and share it across PiperTTS instances.
+
+    Args:
+        model_path: Path to voice model (.onnx file)
+
+    Returns:
+        Parsed <model>.onnx.json config (empty if missing/unreadable)
+    """
+    config_path = Path(model_path + ".json")
+    try:
+        with open(config_path, "rb") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("[TTS] Voice config unavailable (%s): %s", config_path, e)
+        return {}
+
+
+def quantized_model_path(model_path: str) -> Path:
+    """INT8 sibling of a voice model (voice.onnx -> voice.int8.onnx)."""
+    path = Path(model_path)
+    return path.with_name(path.stem + ".int8.onnx")
+
+
+def quantize_voice(model_path: str) -> Path:
+    """
+    Write a dynamically quantized (INT8 weights) copy of a voice model.
+
+    Run once offline; PiperTTS picks the copy up automatically and keeps
+    reading the config from the original model's .onnx.json.
+
+    Args:
+        model_path: Path to FP32 voice model (.onnx file)
+
+    Returns:
+        Path of the quantized model
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    out_path = quantized_model_path(model_path)
+    quantize_dynamic(model_path, str(out_path), weight_type=QuantType.QInt8)
+    return out_path
+
+
+def _session_options() -> "ort.SessionOptions":
+    """ONNX Runtime options for voice sessions: full graph fusion, SYNTH_THREADS."""
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = SYNTH_THREADS
+    return options
+
+
+def ort_model_path(model_path: str) -> Path:
+    """Pre-optimized ORT-format sibling of a voice model (voice.onnx -> voice.ort)."""
+    return Path(model_path).with_suffix(".ort")
+
+
+def convert_voice_to_ort(model_path: str) -> Path:
+    """
+    Save a voice in ORT format with graph optimizations already applied.
+
+    Run once offline, on the Pi itself (the fused graph is tuned for the CPU
+    that produced it); PiperTTS then loads it without redoing optimization
+    at startup. Converts the INT8 copy when there is one. Equivalent to
+    python -m onnxruntime.tools.convert_onnx_models_to_ort.
+
+    Args:
+        model_path: Path to FP32 voice model (.onnx file)
+
+    Returns:
+        Path of the ORT-format model
+    """
+    source = quantized_model_path(model_path)
+    if not source.exists():
+        source = Path(model_path)
+
+    out_path = ort_model_path(model_path)
+    options = _session_options()
+    options.optimized_model_filepath = str(out_path)
+    options.add_session_config_entry("session.save_model_format", "ORT")
+    ort.InferenceSession(str(source), sess_options=options, providers=["CPUExecutionProvider"])
+    return out_path
+
+
+@functools.lru_cache(maxsize=1)
+def _load_session(model_path: str) -> "ort.InferenceSession":
+    """
+    Create the ONNX Runtime session for a voice once per process.
+
+    Prefers the ORT-format copy from convert_voice_to_ort(), then the INT8
+    copy from quantize_voice(), falling back to the FP32 model if they are
+    missing or fail to load.
+
+    Args:
+        model_path: Path to voice model (.onnx file)
+
+    Returns:
+        InferenceSession shared by every PiperTTS using this voice
+    """
+    options = _session_options()
+    for path in (ort_model_path(model_path), quantized_model_path(model_path)):
+        if path.exists():
+            try:
+                return ort.InferenceSession(str(path), sess_options=options, providers=["CPUExecutionProvider"])
+            except Exception as e:
+                logger.warning("[TTS] %s failed to load (%s), trying next model", path.name, e)
+    return ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
 
 
 class PiperTTS:
@@ -16,7 +201,7 @@ class PiperTTS:
         self,
         piper_path: str = "/home/administrator/piper/piper",
         model_path: str = "/home/administrator/piper/en_US-lessac-medium.onnx",
-        sample_rate: int = 22050
+        sample_rate: Optional[int] = None
     ):
         """
         Initialize Piper TTS.
@@ -24,140 +209,380 @@ class PiperTTS:
         Args:
             piper_path: Path to piper executable
             model_path: Path to voice model (.onnx file)
-            sample_rate: Audio sample rate (Hz)
+            sample_rate: Audio sample rate (Hz); None reads it from the
+                voice config on first speak
         """
         self.piper_path = Path(piper_path)
         self.model_path = Path(model_path)
         self.sample_rate = sample_rate
 
-        # Check if Piper is installed
-        if not self.piper_path.exists():
-            print(f"[TTS] WARNING: Piper not found at {self.piper_path}")
-            print("[TTS] Running in simulation mode (no audio output)")
+        # Synthesize in-process when ONNX Runtime and piper-phonemize are
+        # installed; otherwise drive the piper binary, if there is one
+        self.in_process = (
+            ort is not None and phonemize_espeak is not None and self.model_path.exists()
+        )
+        if not self.in_process and not self.piper_path.exists():
+            logger.warning("[TTS] Piper not found at %s", self.piper_path)
+            logger.info("[TTS] Running in simulation mode (no audio output)")
             self.simulation = True
         else:
             self.simulation = False
 
-        # Speech queue for async processing
-        self.speech_queue = queue.Queue()
+        # Async pipeline: synthesis runs on a small pool so phrase N+1 is
+        # rendered while phrase N plays; playback stays on one thread (FIFO
+        # of (text, future)) so utterances come out in order.
+        self._synth_pool = ThreadPoolExecutor(
+            max_workers=SYNTH_WORKERS, thread_name_prefix="tts-synth"
+        )
+        # Long-lived helpers so the voice model loads and the audio device
+        # opens once: one piper per synth worker (thread-local), one aplay
+        self._local = threading.local()
+        self._procs_lock = threading.Lock()
+        self._piper_procs = []  # (process, scratch WAV path)
+        self._aplay_proc: Optional[subprocess.Popen] = None
+        self._stream = None  # sounddevice output, replaces aplay when present
+        self._audio_lock = threading.Lock()
+        self._play_until = 0.0  # monotonic time the queued audio ends
+
+        self.speech_queue = queue.Queue(maxsize=SPEECH_QUEUE_SIZE)
+        # Audio for fixed phrases (speak(cache=True)): sentence -> PCM
+        self._pcm_cache: Dict[str, Optional[bytes]] = {}
         self.speaking = False
+        # Queued + in-progress utterances; notified when it drops to zero
+        self._pending = 0
+        self._idle = threading.Condition()
         self.enabled = True
         self.running = True
 
-        # Background thread
+        # Background playback thread
         self.tts_thread = threading.Thread(target=self._speech_loop, daemon=True)
         self.tts_thread.start()
 
-    def speak(self, text: str, blocking: bool = False):
+        # Load the voice and run it once in the background, so the first
+        # real utterance doesn't pay for session/process startup
+        if not self.simulation:
+            self._synth_pool.submit(self._warmup)
+
+    def speak(self, text: str, blocking: bool = False, cache: bool = False):
         """
         Speak text using Piper TTS.
 
         Args:
             text: Text to speak
             blocking: Wait for speech to complete
+            cache: Keep the synthesized audio and reuse it next time (for
+                fixed phrases only; the cache is never trimmed)
         """
         if not self.enabled or not text.strip():
             return
 
+        # Each sentence is synthesized separately so the first one can play
+        # while the rest are still being rendered
+        sentences = [s for s in _SENTENCE_RE.split(text.strip()) if s]
+        synthesize = self._synthesize_cached if cache else self._synthesize
+
         if blocking:
-            self._speak_blocking(text)
+            self._speak_blocking(sentences, synthesize)
         else:
-            # Add to queue
-            if self.speech_queue.qsize() < 10:  # Limit queue size
-                self.speech_queue.put(text)
+            # Add to queue; once it is full, further sentences are dropped
+            for sentence in sentences:
+                with self._idle:
+                    self._pending += 1
+                future = self._synth_pool.submit(synthesize, sentence)
+                try:
+                    self.speech_queue.put_nowait((sentence, future))
+                except queue.Full:
+                    future.cancel()
+                    self._done_speaking(1)
+                    break
+
+    def _speak_blocking(self, sentences: List[str], synthesize: Callable[[str], Optional[bytes]]):
+        """Speak sentences synchronously, synthesizing ahead of playback."""
+        try:
+            futures = [self._synth_pool.submit(synthesize, s) for s in sentences]
+            for sentence, future in zip(sentences, futures):
+                self._play(sentence, future.result())
+        except Exception as e:
+            logger.error("[TTS] Error: %s", e)
 
-    def _speak_blocking(self, text: str):
-        """Speak text synchronously."""
+    def _warmup(self):
+        """Synthesize and discard a short phrase."""
+        try:
+            self._synthesize("Ready.")
+        except Exception as e:
+            logger.warning("[TTS] Warmup failed (non-fatal): %s", e)
+
+    def _synthesize_cached(self, text: str) -> Optional[bytes]:
+        """_synthesize() through the fixed-phrase PCM cache."""
+        if text not in self._pcm_cache:
+            self._pcm_cache[text] = self._synthesize(text)
+        return self._pcm_cache[text]
+
+    def _synthesize(self, text: str) -> Optional[bytes]:
+        """
+        Render text to raw S16_LE PCM with this thread's Piper process.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            PCM bytes, or None in simulation mode
+        """
         if self.simulation:
-            print(f"[TTS Simulation] 🔊 '{text}'")
-            time.sleep(len(text) * 0.05)  # Simulate speech duration
-            return
+            return None
+        if self.in_process:
+            return self._synthesize_onnx(text)
 
-        try:
-            # Generate speech with Piper
+        for _ in range(2):
+            proc, wav_path = self._piper_process()
+            line = json.dumps({"text": text, "output_file": wav_path})
+            try:
+                proc.stdin.write(line.encode("utf-8") + b"\n")
+                proc.stdin.flush()
+                # Piper prints the output path once the file is written
+                if proc.stdout.readline():
+                    break
+            except OSError:
+                pass
+            logger.warning("[TTS] Piper exited, restarting")
+            self._local.piper = None
+        else:
+            raise RuntimeError("Piper failed to synthesize speech")
+
+        with wave.open(wav_path, "rb") as wav:
+            return wav.readframes(wav.getnframes())
+
+    def _synthesize_onnx(self, text: str) -> bytes:
+        """
+        Render text with the shared ONNX Runtime session (Piper's own
+        phoneme-id encoding and int16 normalization).
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            PCM bytes (S16_LE mono)
+        """
+        voice = _load_voice(str(self.model_path))
+        id_map = voice["phoneme_id_map"]
+        inference = voice.get("inference", {})
+        scales = np.array([
+            inference.get("noise_scale", 0.667),
+            inference.get("length_scale", 1.0),
+            inference.get("noise_w", 0.8)
+        ], dtype=np.float32)
+        session = _load_session(str(self.model_path))
+
+        chunks = []
+        for sentence in phonemize_espeak(text, voice["espeak"]["voice"]):
+            # ^ _ p1 _ p2 _ ... $  (BOS, pad-separated phonemes, EOS)
+            ids = [*id_map["^"], *id_map["_"]]
+            for phoneme in sentence:
+                if phoneme in id_map:
+                    ids.extend(id_map[phoneme])
+                    ids.extend(id_map["_"])
+            ids.extend(id_map["$"])
+
+            audio = session.run(None, {
+                "input": np.array([ids], dtype=np.int64),
+                "input_lengths": np.array([len(ids)], dtype=np.int64),
+                "scales": scales
+            })[0].squeeze()
+            peak = max(0.01, float(np.abs(audio).max()))
+            chunks.append(np.clip(audio * (32767.0 / peak), -32767, 32767).astype(np.int16))
+
+        return np.concatenate(chunks).tobytes() if chunks else b""
+
+    def _piper_process(self) -> Tuple[subprocess.Popen, str]:
+        """
+        Get (starting if needed) the calling thread's Piper process.
+
+        Returns:
+            Tuple of (process, scratch WAV path it writes to)
+        """
+        proc = getattr(self._local, "piper", None)
+        if proc is None or proc.poll() is not None:
             cmd = [
                 str(self.piper_path),
                 "--model", str(self.model_path),
-                "--output-raw"
+                "--json-input"
             ]
-
-            piper_proc = subprocess.Popen(
+            proc = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stderr=subprocess.DEVNULL,
+                close_fds=False,  # see _APLAY
+                env=_PIPER_ENV
             )
-
-            # Pipe to aplay
-            aplay_cmd = [
-                "aplay",
-                "-r", str(self.sample_rate),
-                "-f", "S16_LE",
-                "-t", "raw",
-                "-"
-            ]
-
-            aplay_proc = subprocess.Popen(
-                aplay_cmd,
-                stdin=piper_proc.stdout,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+            self._local.piper = proc
+            self._local.wav_path = os.path.join(
+                _SCRATCH_DIR, f"piper-{os.getpid()}-{threading.get_ident()}.wav"
             )
+            with self._procs_lock:
+                self._piper_procs.append((proc, self._local.wav_path))
+        return proc, self._local.wav_path
 
-            # Send text
-            piper_proc.stdin.write(text.encode('utf-8'))
-            piper_proc.stdin.close()
+    def _play(self, text: str, pcm: Optional[bytes]):
+        """
+        Play synthesized PCM (sounddevice stream, else the shared aplay).
+
+        Args:
+            text: Source text (for logging / simulated duration)
+            pcm: Raw audio from _synthesize()
+        """
+        if pcm is None:
+            logger.info("[TTS Simulation] 🔊 '%s'", text)
+            time.sleep(len(text) * 0.05)  # Simulate speech duration
+            return
 
-            # Wait for completion
-            piper_proc.wait()
-            aplay_proc.wait()
+        rate = self._voice_sample_rate()
+        if sd is not None:
+            with self._audio_lock:
+                if self._stream is None:
+                    self._stream = sd.RawOutputStream(samplerate=rate, channels=1, dtype="int16")
+                    self._stream.start()
+                # Blocks until the device has taken the audio
+                self._stream.write(pcm)
+            logger.info("[TTS] Spoke: '%s'", text)
+            return
 
-            print(f"[TTS] Spoke: '{text}'")
+        with self._audio_lock:
+            for _ in range(2):
+                if self._aplay_proc is None or self._aplay_proc.poll() is not None:
+                    aplay_cmd = [
+                        _APLAY,
+                        "-r", str(rate),
+                        "-f", "S16_LE",
+                        "-t", "raw",
+                        "-"
+                    ]
+                    self._aplay_proc = subprocess.Popen(
+                        aplay_cmd,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        close_fds=False
+                    )
+                    self._grow_pipe(self._aplay_proc.stdin)
+                try:
+                    self._aplay_proc.stdin.write(pcm)
+                    self._aplay_proc.stdin.flush()
+                    break
+                except OSError:
+                    logger.warning("[TTS] aplay exited, restarting")
+                    self._aplay_proc = None
+
+            # The write returns once the pipe has taken the data, not when
+            # it has been heard; track when the queued audio runs out
+            now = time.monotonic()
+            self._play_until = max(now, self._play_until) + len(pcm) / (2 * rate)
+            remaining = self._play_until - now
+
+        time.sleep(remaining)
+        logger.info("[TTS] Spoke: '%s'", text)
+
+    @staticmethod
+    def _grow_pipe(pipe):
+        """Enlarge a pipe so a whole sentence of PCM fits in one write."""
+        try:
+            fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_SIZE)
+        except (AttributeError, OSError):
+            pass  # not Linux, or above /proc/sys/fs/pipe-max-size
 
-        except Exception as e:
-            print(f"[TTS] Error: {e}")
+    def _voice_sample_rate(self) -> int:
+        """Output rate for aplay, resolved lazily from the shared voice config."""
+        if self.sample_rate is None:
+            audio = _load_voice(str(self.model_path)).get("audio", {})
+            self.sample_rate = audio.get("sample_rate", DEFAULT_SAMPLE_RATE)
+        return self.sample_rate
 
     def _speech_loop(self):
         """Background thread for async speech."""
         while self.running:
             try:
-                text = self.speech_queue.get(timeout=1.0)
-                self.speaking = True
-                self._speak_blocking(text)
-                self.speaking = False
+                text, future = self.speech_queue.get(timeout=1.0)
             except queue.Empty:
                 continue
+
+            try:
+                self.speaking = True
+                self._play(text, future.result())
             except Exception as e:
-                print(f"[TTS] Speech loop error: {e}")
+                logger.error("[TTS] Speech loop error: %s", e)
+            finally:
                 self.speaking = False
+                self._done_speaking(1)
+
+    def _done_speaking(self, count: int):
+        """Retire finished/dropped utterances and wake idle waiters."""
+        with self._idle:
+            self._pending -= count
+            if self._pending <= 0:
+                self._pending = 0
+                self._idle.notify_all()
 
     def is_speaking(self) -> bool:
         """Check if currently speaking."""
         return self.speaking
 
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until queued speech has finished.
+
+        Args:
+            timeout: Max seconds to wait (None = forever)
+
+        Returns:
+            True if idle, False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
     def clear_queue(self):
         """Clear pending speech."""
+        dropped = 0
         while not self.speech_queue.empty():
             try:
-                self.speech_queue.get_nowait()
+                _, future = self.speech_queue.get_nowait()
+                future.cancel()
+                dropped += 1
             except queue.Empty:
                 break
+        if dropped:
+            self._done_speaking(dropped)
 
     def enable(self):
         """Enable TTS."""
         self.enabled = True
-        print("[TTS] Enabled")
+        logger.info("[TTS] Enabled")
 
     def disable(self):
         """Disable TTS."""
         self.enabled = False
         self.clear_queue()
-        print("[TTS] Disabled")
+        logger.info("[TTS] Disabled")
 
     def stop(self):
         """Stop TTS system."""
         self.running = False
         self.clear_queue()
+        self._synth_pool.shutdown(wait=False, cancel_futures=True)
+
+        with self._procs_lock:
+            procs, self._piper_procs = self._piper_procs, []
+        if self._aplay_proc is not None:
+            procs.append((self._aplay_proc, None))
+            self._aplay_proc = None
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        for proc, wav_path in procs:
+            if proc.poll() is None:
+                proc.stdin.close()
+                proc.terminate()
+            if wav_path and os.path.exists(wav_path):
+                os.remove(wav_path)
 
     def __enter__(self):
         """Context manager entry."""
@@ -171,6 +596,21 @@ class PiperTTS:
 class VoiceNarrator:
     """Narrates robot vision and actions with intelligent speech."""
 
+    # Fixed phrases; spoken with cache=True so each is synthesized once
+    GREETINGS = (
+        "Hello! I am your hexapod robot. My vision system is online.",
+        "Systems initialized. Ready for autonomous operation.",
+        "Good to see you! Vision and navigation systems are active."
+    )
+    ACTION_SPEECH = {
+        "FORWARD": "moving forward",
+        "BACKWARD": "moving backward",
+        "LEFT": "turning left",
+        "RIGHT": "turning right",
+        "STOP": "stopping",
+        "ASSESS": "analyzing situation"
+    }
+
     def __init__(
         self,
         tts: PiperTTS,
@@ -193,7 +633,7 @@ class VoiceNarrator:
         self.narrate_obstacles = True
 
         # Rate limiting
-        self.last_narration_time = 0.0
+        self.last_narration_time = float("-inf")  # time.monotonic()
         self.min_narration_interval = 3.0  # Minimum seconds between narrations
 
         # Context tracking
@@ -207,7 +647,8 @@ class VoiceNarrator:
         Args:
             scene_description: VLM scene description
         """
-        if not self._should_narrate() or not self.narrate_detections:
+        now = time.monotonic()
+        if not self._should_narrate(now) or not self.narrate_detections:
             return
 
         # Avoid repeating same scene
@@ -220,7 +661,7 @@ class VoiceNarrator:
         if summary:
             self.tts.speak(f"I see {summary}")
             self.last_scene = scene_description
-            self.last_narration_time = time.time()
+            self.last_narration_time = now
 
     def narrate_obstacle(self, obstacle_type: str, direction: str = "ahead", distance: str = ""):
         """
@@ -231,12 +672,13 @@ class VoiceNarrator:
             direction: Direction (left, right, center, ahead)
             distance: Optional distance description
         """
-        if not self._should_narrate() or not self.narrate_obstacles:
+        now = time.monotonic()
+        if not self._should_narrate(now) or not self.narrate_obstacles:
             return
 
         distance_str = f"{distance} " if distance else ""
         self.tts.speak(f"Warning: {obstacle_type} detected {distance_str}{direction}")
-        self.last_narration_time = time.time()
+        self.last_narration_time = now
 
     def narrate_action(self, action: str):
         """
@@ -252,17 +694,11 @@ class VoiceNarrator:
         if action == self.last_action:
             return
 
-        action_map = {
-            "FORWARD": "moving forward",
-            "BACKWARD": "moving backward",
-            "LEFT": "turning left",
-            "RIGHT": "turning right",
-            "STOP": "stopping",
-            "ASSESS": "analyzing situation"
-        }
-
-        speech = action_map.get(action, action.lower())
-        self.tts.speak(speech)
+        speech = self.ACTION_SPEECH.get(action)
+        if speech is None:
+            self.tts.speak(action.lower())
+        else:
+            self.tts.speak(speech, cache=True)
         self.last_action = action
 
     def narrate_navigation_guidance(self, guidance: str):
@@ -272,7 +708,8 @@ class VoiceNarrator:
         Args:
             guidance: Navigation text from VLM
         """
-        if not self._should_narrate() or not self.narrate_navigation:
+        now = time.monotonic()
+        if not self._should_narrate(now) or not self.narrate_navigation:
             return
 
         # Extract actionable advice
@@ -280,18 +717,11 @@ class VoiceNarrator:
 
         if summary:
             self.tts.speak(summary)
-            self.last_narration_time = time.time()
+            self.last_narration_time = now
 
     def greet(self):
         """Robot startup greeting."""
-        greetings = [
-            "Hello! I am your hexapod robot. My vision system is online.",
-            "Systems initialized. Ready for autonomous operation.",
-            "Good to see you! Vision and navigation systems are active."
-        ]
-
-        import random
-        self.tts.speak(random.choice(greetings))
+        self.tts.speak(choice(self.GREETINGS), cache=True)
 
     def acknowledge_command(self, command: str):
         """
@@ -321,14 +751,16 @@ class VoiceNarrator:
         """
         self.tts.speak(text)
 
-    def _should_narrate(self) -> bool:
-        """Check if enough time has passed since last narration."""
-        elapsed = time.time() - self.last_narration_time
+    def _should_narrate(self, now: float) -> bool:
+        """Check if enough time has passed since last narration (now: time.monotonic())."""
+        elapsed = now - self.last_narration_time
         return elapsed >= self.min_narration_interval
 
-    def _summarize_scene(self, description: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=SUMMARY_CACHE_SIZE)
+    def _summarize_scene(description: str) -> str:
         """
-        Simplify VLM description for speech.
+        Simplify VLM description for speech (memoized per description).
 
         Args:
             description: Full VLM scene description
@@ -341,8 +773,7 @@ class VoiceNarrator:
             return ""
 
         # Take first sentence
-        sentences = description.split('.')
-        first_sentence = sentences[0].strip()
+        first_sentence = _SPLIT_RE.split(description, 1)[0].strip()
 
         # Limit length
         if len(first_sentence) > 80:
@@ -360,28 +791,35 @@ class VoiceNarrator:
         Returns:
             Key actionable advice
         """
-        # Simple extraction - look for action verbs
-        action_phrases = [
-            "move forward", "turn left", "turn right", "stop",
-            "go straight", "back up", "safe to proceed", "avoid"
-        ]
+        # One scan finds every action phrase; the highest-priority phrase
+        # wins, at its first occurrence
+        best = min(
+            _GUIDANCE_RE.finditer(guidance),
+            key=lambda m: _GUIDANCE_RANK[m.group().lower()],
+            default=None
+        )
+        if best is not None:
+            # Extract sentence containing this phrase
+            start = 0
+            for boundary in _SPLIT_RE.finditer(guidance, 0, best.start()):
+                start = boundary.end()
+            boundary = _SPLIT_RE.search(guidance, best.end())
+            return guidance[start:boundary.start() if boundary else None].strip()
 
-        guidance_lower = guidance.lower()
+        # Default: return first sentence
+        return _SPLIT_RE.split(guidance, 1)[0].strip()
 
-        for phrase in action_phrases:
-            if phrase in guidance_lower:
-                # Extract sentence containing this phrase
-                sentences = guidance.split('.')
-                for sentence in sentences:
-                    if phrase in sentence.lower():
-                        return sentence.strip()
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything narrated so far has been spoken.
 
-        # Default: return first sentence
-        sentences = guidance.split('.')
-        if sentences:
-            return sentences[0].strip()
+        Args:
+            timeout: Max seconds to wait (None = forever)
 
-        return ""
+        Returns:
+            True if speech finished, False on timeout
+        """
+        return self.tts.wait_idle(timeout)
 
     def set_verbosity(self, detections: bool = None, navigation: bool = None,
                      actions: bool = None, obstacles: bool = None):
@@ -403,7 +841,7 @@ class VoiceNarrator:
         if obstacles is not None:
             self.narrate_obstacles = obstacles
 
-        print(f"[Narrator] Settings: detections={self.narrate_detections}, "
-              f"navigation={self.narrate_navigation}, "
-              f"actions={self.narrate_actions}, "
-              f"obstacles={self.narrate_obstacles}")
+        logger.info("[Narrator] Settings: detections=%s, navigation=%s, "
+                    "actions=%s, obstacles=%s",
+                    self.narrate_detections, self.narrate_navigation,
+                    self.narrate_actions, self.narrate_obstacles)
@@ -1,16 +1,91 @@
 """Vision Manager - Coordinates Hailo + VLM hybrid vision system."""
 
+import re
 import time
+import functools
 import threading
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 import numpy as np
 from PIL import Image
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 from vlm_client import VLMClient
-from hailo_vision import HailoVision, NavigationData, HailoVisionSimulator
+from hailo_vision import HailoVision, NavigationData, HailoVisionSimulator, ZONE_DIRECTIONS
+from robot_log import logger
+
+# Frame ring size: a frame taken by the vision loop stays intact for the
+# next FRAME_SLOTS - 1 updates. Slower readers (VLM) check the slot's
+# sequence number after reading instead of copying every frame.
+FRAME_SLOTS = 3
+
+# Frames are downsampled to this (width, height) before the VLM: the
+# vision encoder works at ~448 px anyway, and 4:3 keeps camera aspect
+VLM_INPUT_SIZE = (448, 336)
+
+# Scene-change gate for VLM queries: minimum differing bits between the
+# 64-bit dHashes of the last queried frame and the candidate
+VLM_CHANGE_BITS = 4
+_DHASH_DEADBAND = 2.0  # gray levels
+
+# Distinct VLM replies whose parsed results are kept
+VLM_TEXT_CACHE_SIZE = 256
+
+# VLM guidance keywords per action, highest priority first. Keywords match
+# anywhere in the text ("dangerous", "backward", "halting"), as substrings.
+_ACTION_KEYWORDS = (
+    ("STOP", ("stop", "halt", "danger", "unsafe")),
+    ("LEFT", ("left",)),
+    ("RIGHT", ("right",)),
+    ("FORWARD", ("forward", "ahead", "straight")),
+    ("BACKWARD", ("back", "reverse")),
+)
+# One pass finds every keyword occurrence: alternatives sit inside a
+# zero-width lookahead so overlapping hits are all reported, and m.lastgroup
+# names the action that matched
+_ACTION_RE = re.compile("(?=" + "|".join(
+    f"(?P<{action}>{'|'.join(re.escape(w) for w in words)})"
+    for action, words in _ACTION_KEYWORDS
+) + ")")
+_ACTION_RANK = {action: i for i, (action, _) in enumerate(_ACTION_KEYWORDS)}
+
+# Indices into NavigationData.zone_distances
+_ZONE_LEFT = ZONE_DIRECTIONS.index("LEFT")
+_ZONE_CENTER = ZONE_DIRECTIONS.index("CENTER")
+_ZONE_RIGHT = ZONE_DIRECTIONS.index("RIGHT")
+
+
+def _dhash(frame) -> int:
+    """
+    64-bit difference hash of a frame (9x8 grayscale, horizontal gradients).
+
+    Args:
+        frame: RGB frame (numpy array or PIL Image)
+
+    Returns:
+        Hash as an int; similar frames differ in few bits
+    """
+    frame = np.asarray(frame)
+    if cv2 is not None:
+        small = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY), (9, 8), interpolation=cv2.INTER_AREA)
+    else:
+        # Block means over a 9x8 grid with two reduceat passes
+        h, w = frame.shape[:2]
+        rows = np.linspace(0, h, 9).astype(np.intp)
+        cols = np.linspace(0, w, 10).astype(np.intp)
+        gray = frame.sum(axis=2, dtype=np.uint32)
+        sums = np.add.reduceat(np.add.reduceat(gray, rows[:-1], axis=0), cols[:-1], axis=1)
+        small = sums / (3 * np.outer(np.diff(rows), np.diff(cols)))
+    # Brighter-to-the-right, with a dead band so sensor noise on flat
+    # areas doesn't flip bits
+    bits = small[:, 1:].astype(np.float32) - small[:, :-1] > _DHASH_DEADBAND
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
 
 
 class VisionMode(Enum):
@@ -29,7 +104,7 @@ class VisionStrategy:
     navigation_guidance: str
     recommended_action: str
     confidence: float
-    timestamp: float
+    timestamp: float  # time.monotonic()
 
 
 class VisionManager:
@@ -40,7 +115,9 @@ class VisionManager:
         use_hailo: bool = True,
         use_vlm: bool = True,
         vlm_interval: float = 5.0,
-        simulation_mode: bool = False
+        simulation_mode: bool = False,
+        vlm_input_size: Optional[Tuple[int, int]] = VLM_INPUT_SIZE,
+        vlm: Optional[VLMClient] = None
     ):
         """
         Initialize vision manager.
@@ -50,29 +127,50 @@ class VisionManager:
             use_vlm: Enable VLM high-level reasoning
             vlm_interval: Seconds between VLM queries
             simulation_mode: Run without hardware (testing)
+            vlm_input_size: (width, height) frames are downsampled to before
+                they go to the VLM; None sends full frames
+            vlm: VLM backend to use instead of a gateway VLMClient (any
+                object with VLMClient's analyze/get_text_response/close,
+                e.g. a local in-process model)
         """
         self.use_hailo = use_hailo
         self.use_vlm = use_vlm
         self.vlm_interval = vlm_interval
         self.simulation_mode = simulation_mode
+        self.vlm_input_size = vlm_input_size
 
         # Vision systems
         self.hailo: Optional[HailoVision] = None
-        self.vlm: Optional[VLMClient] = None
+        self.vlm: Optional[VLMClient] = vlm
 
         # State
         self.mode = VisionMode.MANUAL
         self.running = False
         self.current_frame = None
         self.strategy: Optional[VisionStrategy] = None
-        self.last_vlm_query_time = 0.0
+        self.last_vlm_query_time = float("-inf")  # time.monotonic()
+        self._last_vlm_hash: Optional[int] = None  # _dhash of last queried frame
 
         # Callbacks
         self.command_callback: Optional[Callable] = None
 
         # Threading
         self.vision_thread: Optional[threading.Thread] = None
-        self.lock = threading.Lock()
+        # VLM queries run on their own thread so Hailo keeps its frame rate;
+        # the worker takes the latest frame itself, _vlm_pending covers
+        # request->done
+        self.vlm_thread: Optional[threading.Thread] = None
+        self._vlm_request = threading.Event()
+        self._vlm_pending = False
+        self.strategy_lock = threading.Lock()
+        # Guards current_frame; notified by update_frame() so the vision
+        # loop wakes per new frame instead of polling
+        self.frame_cond = threading.Condition()
+        self._frame_seq = 0
+        # Preallocated ring update_frame copies into (see FRAME_SLOTS), and
+        # the sequence number each slot holds (-1 while being rewritten)
+        self._frame_slots: List[np.ndarray] = []
+        self._slot_seqs: List[int] = [-1] * FRAME_SLOTS
 
         # Initialize systems
         self._init_systems()
@@ -85,45 +183,56 @@ class VisionManager:
                     self.hailo = HailoVisionSimulator(enable_depth=True, enable_tracking=True)
                 else:
                     self.hailo = HailoVision(enable_depth=True, enable_tracking=True)
-                print("[VisionManager] Hailo initialized")
+                logger.info("[VisionManager] Hailo initialized")
             except Exception as e:
-                print(f"[VisionManager] Hailo init failed: {e}, using simulator")
+                logger.warning("[VisionManager] Hailo init failed: %s, using simulator", e)
                 self.hailo = HailoVisionSimulator(enable_depth=True, enable_tracking=True)
 
-        if self.use_vlm:
+        if self.use_vlm and self.vlm is None:
             try:
                 self.vlm = VLMClient()
-                print("[VisionManager] VLM initialized")
+                logger.info("[VisionManager] VLM initialized")
             except Exception as e:
-                print(f"[VisionManager] VLM init failed: {e}")
+                logger.warning("[VisionManager] VLM init failed: %s", e)
                 self.use_vlm = False
 
     def start(self):
         """Start vision processing."""
         if self.running:
-            print("[VisionManager] Already running")
+            logger.warning("[VisionManager] Already running")
             return
 
         self.running = True
 
         if self.hailo:
             self.hailo.start()
+            self.hailo.warmup()
 
         # Start vision processing thread
         self.vision_thread = threading.Thread(target=self._vision_loop, daemon=True)
         self.vision_thread.start()
 
-        print(f"[VisionManager] Started in {self.mode.value} mode")
+        if self.use_vlm:
+            self.vlm_thread = threading.Thread(target=self._vlm_worker, daemon=True)
+            self.vlm_thread.start()
+
+        logger.info("[VisionManager] Started in %s mode", self.mode.value)
 
     def stop(self):
         """Stop vision processing."""
         if not self.running:
             return
 
-        self.running = False
+        with self.frame_cond:
+            self.running = False
+            self.frame_cond.notify_all()
+
+        self._vlm_request.set()  # wake the worker so it sees running=False
 
         if self.vision_thread:
             self.vision_thread.join(timeout=2.0)
+        if self.vlm_thread:
+            self.vlm_thread.join(timeout=2.0)
 
         if self.hailo:
             self.hailo.stop()
@@ -131,22 +240,86 @@ class VisionManager:
         if self.vlm:
             self.vlm.close()
 
-        print("[VisionManager] Stopped")
+        self._parse_vlm_action.cache_clear()
+
+        logger.info("[VisionManager] Stopped")
 
     def set_mode(self, mode: VisionMode):
         """Set vision processing mode."""
         self.mode = mode
-        print(f"[VisionManager] Mode changed to: {mode.value}")
+        logger.info("[VisionManager] Mode changed to: %s", mode.value)
 
     def update_frame(self, frame: np.ndarray):
         """
         Update current camera frame.
 
+        numpy frames are copied into a preallocated slot ring, so the
+        caller may reuse its capture buffer; publishing is a reference
+        swap under the condition. Readers that may outlast a few updates
+        check _frame_intact() after reading. Called from a single camera
+        thread.
+
         Args:
             frame: Camera frame (numpy array or PIL Image)
         """
-        with self.lock:
+        if isinstance(frame, np.ndarray):
+            slots = self._frame_slots
+            if not slots or slots[0].shape != frame.shape or slots[0].dtype != frame.dtype:
+                slots = self._frame_slots = [np.empty_like(frame) for _ in range(FRAME_SLOTS)]
+            index = (self._frame_seq + 1) % FRAME_SLOTS
+            slot = slots[index]
+            self._slot_seqs[index] = -1  # readers of the old frame see it's gone
+            np.copyto(slot, frame)
+            frame = slot
+
+        with self.frame_cond:
             self.current_frame = frame
+            self._frame_seq += 1
+            if isinstance(frame, np.ndarray):
+                self._slot_seqs[index] = self._frame_seq
+            self.frame_cond.notify()
+
+    def _frame_intact(self, frame, seq: int) -> bool:
+        """
+        Check that a frame published as seq hasn't been overwritten since.
+
+        Args:
+            frame: Frame read from current_frame
+            seq: _frame_seq it was published with
+
+        Returns:
+            True if every read of frame so far saw that frame
+        """
+        if not isinstance(frame, np.ndarray):
+            return True  # not slotted; PIL frames aren't reused
+        return self._slot_seqs[seq % FRAME_SLOTS] == seq
+
+    def _take_vlm_frame(self) -> Optional[Tuple[Any, int]]:
+        """
+        Snapshot the latest frame for the VLM.
+
+        Downsampling is the one copy made; if the camera rewrote the slot
+        meanwhile, the read is retried on the newer frame.
+
+        Returns:
+            (VLM-sized frame, dHash of the full frame), or None if there is
+            no frame or it couldn't be read intact
+        """
+        for _ in range(FRAME_SLOTS):
+            with self.frame_cond:
+                frame, seq = self.current_frame, self._frame_seq
+            if frame is None:
+                return None
+
+            vlm_frame = self._prepare_vlm_frame(frame)
+            if vlm_frame is frame and isinstance(frame, np.ndarray):
+                vlm_frame = frame.copy()  # no downsampling configured
+            frame_hash = _dhash(frame)
+
+            if self._frame_intact(frame, seq):
+                return vlm_frame, frame_hash
+
+        return None
 
     def set_command_callback(self, callback: Callable):
         """
@@ -159,17 +332,20 @@ class VisionManager:
 
     def _vision_loop(self):
         """Main vision processing loop."""
-        print("[VisionManager] Vision loop started")
+        logger.info("[VisionManager] Vision loop started")
 
+        last_seq = 0
         while self.running:
             try:
-                # Get current frame
-                with self.lock:
+                # Wait for a frame we haven't processed yet
+                with self.frame_cond:
+                    self.frame_cond.wait_for(
+                        lambda: self._frame_seq != last_seq or not self.running
+                    )
+                    if not self.running:
+                        break
                     frame = self.current_frame
-
-                if frame is None:
-                    time.sleep(0.1)
-                    continue
+                    last_seq = self._frame_seq
 
                 # Process based on mode
                 if self.mode == VisionMode.MANUAL:
@@ -182,15 +358,13 @@ class VisionManager:
 
                 elif self.mode == VisionMode.AUTONOMOUS:
                     # Autonomous mode: Full AI control
-                    self._process_autonomous(frame)
-
-                time.sleep(0.03)  # ~30 FPS
+                    self._process_autonomous(frame, time.monotonic())
 
             except Exception as e:
-                print(f"[VisionManager] Error in vision loop: {e}")
+                logger.error("[VisionManager] Error in vision loop: %s", e)
                 time.sleep(1.0)
 
-        print("[VisionManager] Vision loop ended")
+        logger.info("[VisionManager] Vision loop ended")
 
     def _process_assisted(self, frame):
         """Process frame in assisted mode (obstacle avoidance only)."""
@@ -203,26 +377,28 @@ class VisionManager:
         # Check for critical alerts
         if nav_data.critical_alerts:
             for alert in nav_data.critical_alerts:
-                print(f"[VisionManager] {alert}")
+                logger.info("[VisionManager] %s", alert)
                 # Send emergency stop
                 self._send_command({"action": "STOP", "reason": alert})
 
         # Check for obstacles in path
         if nav_data.obstacles:
-            print(f"[VisionManager] {len(nav_data.obstacles)} obstacles detected")
+            logger.info("[VisionManager] %d obstacles detected", len(nav_data.obstacles))
             # Can send warnings but don't override user control
 
-    def _process_autonomous(self, frame):
-        """Process frame in autonomous mode (full AI control)."""
+    def _process_autonomous(self, frame, now: float):
+        """Process frame in autonomous mode (full AI control); now is time.monotonic()."""
         # Continuous Hailo processing
         nav_data = None
         if self.hailo:
             detections, depth_map = self.hailo.process_frame(frame)
             nav_data = self.hailo.get_navigation_data()
 
-        # Periodic VLM reasoning
-        if self.should_query_vlm():
-            self._query_vlm(frame)
+        # Periodic VLM reasoning, handed to the VLM worker (which snapshots
+        # the latest frame itself)
+        if not self._vlm_pending and self.should_query_vlm(frame, now):
+            self._vlm_pending = True
+            self._vlm_request.set()
 
         # Fuse decisions and generate command
         command = self._decide_action(nav_data)
@@ -230,56 +406,120 @@ class VisionManager:
         if command:
             self._send_command(command)
 
-    def should_query_vlm(self) -> bool:
-        """Check if we should query VLM."""
+    def should_query_vlm(self, frame=None, now: Optional[float] = None) -> bool:
+        """
+        Check if we should query VLM.
+
+        Args:
+            frame: Candidate frame; if it looks the same as the last frame
+                the VLM saw, the query is skipped until the next interval
+            now: Caller's time.monotonic() reading (read here if omitted)
+
+        Returns:
+            True if a query is due
+        """
         if not self.use_vlm:
             return False
 
-        current_time = time.time()
+        current_time = time.monotonic() if now is None else now
         elapsed = current_time - self.last_vlm_query_time
+        if elapsed < self.vlm_interval:
+            return False
+
+        if frame is not None and self._last_vlm_hash is not None:
+            changed_bits = bin(_dhash(frame) ^ self._last_vlm_hash).count("1")
+            if changed_bits < VLM_CHANGE_BITS:
+                self.last_vlm_query_time = current_time
+                return False
+
+        return True
+
+    def _vlm_worker(self):
+        """Background thread running VLM queries requested by the vision loop."""
+        while self.running:
+            if not self._vlm_request.wait(timeout=1.0):
+                continue
+            self._vlm_request.clear()
 
-        return elapsed >= self.vlm_interval
+            try:
+                snapshot = self._take_vlm_frame()
+                if snapshot is not None:
+                    self._query_vlm(*snapshot)
+            finally:
+                self._vlm_pending = False
+
+    def _query_vlm(self, vlm_frame, frame_hash: int):
+        """
+        Query VLM for high-level reasoning.
 
-    def _query_vlm(self, frame):
-        """Query VLM for high-level reasoning."""
+        Args:
+            vlm_frame: Frame from _take_vlm_frame() (already VLM-sized)
+            frame_hash: dHash of the full frame
+        """
         if not self.vlm:
             return
 
         try:
-            print("[VisionManager] Querying VLM...")
-            start_time = time.time()
-
-            # Convert frame to PIL Image if needed
-            if isinstance(frame, np.ndarray):
-                pil_image = Image.fromarray(frame)
-            else:
-                pil_image = frame
+            logger.info("[VisionManager] Querying VLM...")
+            start_time = time.monotonic()
 
-            # Get navigation guidance
-            guidance = self.vlm.navigate_assistance(pil_image)
-            scene = self.vlm.describe_scene(pil_image)
+            # Scene description and navigation guidance in one request, so
+            # the vision encoder runs once per query cycle
+            answers = self.vlm.analyze(vlm_frame, tasks=("describe", "navigate"))
+            scene = answers["scene"]
+            guidance = answers["navigation"]
+            done_time = time.monotonic()
 
             # Update strategy
-            self.strategy = VisionStrategy(
+            strategy = VisionStrategy(
                 scene_description=scene,
                 navigation_guidance=guidance,
                 recommended_action=self._parse_vlm_action(guidance),
                 confidence=0.8,  # TODO: Extract from VLM response
-                timestamp=time.time()
+                timestamp=done_time
             )
+            with self.strategy_lock:
+                self.strategy = strategy
 
-            query_time = time.time() - start_time
-            print(f"[VisionManager] VLM query completed in {query_time:.2f}s")
-            print(f"[VisionManager] Guidance: {guidance[:100]}...")
+            self._last_vlm_hash = frame_hash
 
-            self.last_vlm_query_time = time.time()
+            query_time = done_time - start_time
+            logger.info("[VisionManager] VLM query completed in %.2fs", query_time)
+            logger.info("[VisionManager] Guidance: %s...", guidance[:100])
+
+            self.last_vlm_query_time = done_time
 
         except Exception as e:
-            print(f"[VisionManager] VLM query failed: {e}")
+            logger.warning("[VisionManager] VLM query failed: %s", e)
 
-    def _parse_vlm_action(self, guidance: str) -> str:
+    def _prepare_vlm_frame(self, frame):
         """
-        Parse VLM guidance into action recommendation.
+        Downsample a frame to the VLM input size (if configured).
+
+        Only the VLM copy is resized; Hailo keeps the full-resolution frame.
+
+        Args:
+            frame: Camera frame (numpy array or PIL Image)
+
+        Returns:
+            Frame to hand to the VLM client
+        """
+        if self.vlm_input_size is None:
+            return frame
+
+        if isinstance(frame, np.ndarray):
+            if cv2 is not None:
+                return cv2.resize(frame, self.vlm_input_size, interpolation=cv2.INTER_AREA)
+            frame = Image.fromarray(frame)
+
+        return frame.resize(self.vlm_input_size, Image.BOX)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=VLM_TEXT_CACHE_SIZE)
+    def _parse_vlm_action(guidance: str) -> str:
+        """
+        Parse VLM guidance into action recommendation (memoized: static
+        scenes keep producing the same guidance).
 
         Args:
             guidance: VLM navigation guidance text
@@ -287,21 +527,17 @@ class VisionManager:
         Returns:
             Action keyword (FORWARD, STOP, LEFT, RIGHT, etc.)
         """
-        guidance_lower = guidance.lower()
-
-        # Simple keyword matching
-        if any(word in guidance_lower for word in ["stop", "halt", "danger", "unsafe"]):
-            return "STOP"
-        elif any(word in guidance_lower for word in ["left", "turn left"]):
-            return "LEFT"
-        elif any(word in guidance_lower for word in ["right", "turn right"]):
-            return "RIGHT"
-        elif any(word in guidance_lower for word in ["forward", "ahead", "straight"]):
-            return "FORWARD"
-        elif any(word in guidance_lower for word in ["back", "reverse"]):
-            return "BACKWARD"
-        else:
+        best = len(_ACTION_KEYWORDS)
+        for m in _ACTION_RE.finditer(guidance.lower()):
+            rank = _ACTION_RANK[m.lastgroup]
+            if rank < best:
+                best = rank
+                if rank == 0:
+                    break
+
+        if best == len(_ACTION_KEYWORDS):
             return "ASSESS"
+        return _ACTION_KEYWORDS[best][0]
 
     def _decide_action(self, nav_data: Optional[NavigationData]) -> Optional[Dict[str, Any]]:
         """
@@ -318,22 +554,25 @@ class VisionManager:
             return {"action": "STOP", "reason": "critical_alert"}
 
         # Priority 2: VLM strategic guidance
-        if self.strategy and self.strategy.recommended_action != "ASSESS":
-            action = self.strategy.recommended_action
+        with self.strategy_lock:
+            strategy = self.strategy
+        if strategy and strategy.recommended_action != "ASSESS":
+            action = strategy.recommended_action
             return {"action": action, "source": "vlm"}
 
         # Priority 3: Hailo obstacle avoidance
-        if nav_data and nav_data.safe_directions:
-            # Find safest direction
-            safe_dirs = nav_data.safe_directions
-            safest = max(safe_dirs, key=safe_dirs.get)
+        if nav_data and nav_data.zone_distances is not None:
+            # Find safest direction (argmax keeps the first zone on ties,
+            # in LEFT, CENTER, RIGHT order)
+            zones = nav_data.zone_distances
+            safest = int(zones.argmax())
 
             # Map to movement command
-            if safest == "LEFT":
+            if safest == _ZONE_LEFT:
                 return {"action": "LEFT", "source": "hailo"}
-            elif safest == "RIGHT":
+            elif safest == _ZONE_RIGHT:
                 return {"action": "RIGHT", "source": "hailo"}
-            elif safest == "CENTER" and safe_dirs["CENTER"] > 100:
+            elif zones[_ZONE_CENTER] > 100:
                 return {"action": "FORWARD", "source": "hailo"}
             else:
                 return {"action": "STOP", "reason": "no_safe_path"}
@@ -352,9 +591,9 @@ class VisionManager:
             try:
                 self.command_callback(command)
             except Exception as e:
-                print(f"[VisionManager] Command callback error: {e}")
+                logger.error("[VisionManager] Command callback error: %s", e)
         else:
-            print(f"[VisionManager] Command: {command}")
+            logger.info("[VisionManager] Command: %s", command)
 
     def get_status(self) -> Dict[str, Any]:
         """Get current vision system status."""
@@ -369,11 +608,13 @@ class VisionManager:
         if self.hailo:
             status["hailo_stats"] = self.hailo.get_stats()
 
-        if self.strategy:
+        with self.strategy_lock:
+            strategy = self.strategy
+        if strategy:
             status["strategy"] = {
-                "action": self.strategy.recommended_action,
-                "confidence": self.strategy.confidence,
-                "age": time.time() - self.strategy.timestamp
+                "action": strategy.recommended_action,
+                "confidence": strategy.confidence,
+                "age": time.monotonic() - strategy.timestamp
             }
 
         return status
@@ -392,13 +633,11 @@ class VisionManager:
             return "VLM not available"
 
         try:
-            with self.lock:
-                frame = self.current_frame
-
-            if isinstance(frame, np.ndarray):
-                frame = Image.fromarray(frame)
+            snapshot = self._take_vlm_frame()
+            if snapshot is None:
+                return "VLM not available"
 
-            response = self.vlm.get_text_response(frame, prompt)
+            response = self.vlm.get_text_response(snapshot[0], prompt)
             return response
 
         except Exception as e:
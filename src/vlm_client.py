@@ -1,15 +1,323 @@
 """VLM Client for LiteLLM Gateway integration."""
 
 import os
-import base64
-from typing import Optional, Union, Dict, Any
+import re
+import mmap
+import asyncio
+import hashlib
+import sqlite3
+import functools
+import time
+import threading
+from collections import OrderedDict, deque
+from typing import Optional, Union, Dict, Any, Hashable, Iterator, List, Set, Tuple
 from pathlib import Path
 
+import numpy as np
+import orjson
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util import Retry
 from dotenv import load_dotenv
 from PIL import Image
 import io
 
+# SIMD (SSSE3/AVX2/NEON) base64 with the same API as the stdlib module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# HTTP/2 transport: concurrent requests multiplex over one connection to the
+# gateway. Needs httpx with the h2 package (pip install "httpx[http2]"), and
+# an https:// gateway, since h2 is only negotiated over TLS (ALPN).
+try:
+    import httpx
+    import h2  # noqa: F401
+except ImportError:
+    httpx = None
+
+# OpenCV's libjpeg-turbo encoder is ~2x faster than Pillow's on the Pi
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+JPEG_QUALITY = 85
+
+# Longest image side sent to the model. Vision towers tile/resize inputs to
+# well under this, so larger images only cost upload bytes and encode time.
+MAX_IMAGE_EDGE = 1024
+
+ImageSource = Union[str, Path, bytes, Image.Image, np.ndarray]
+
+# Tasks analyze() can answer in one request: task -> (JSON key, instruction)
+ANALYSIS_TASKS = {
+    "detect": ("objects", "all objects you can see, specific and detailed"),
+    "describe": ("scene", "the scene in detail, including objects, colors, layout and notable features"),
+    "navigate": ("navigation", "robot navigation guidance: obstacles and their positions "
+                               "(left, center, right), estimated distances, safe movement "
+                               "directions, and hazards (stairs, edges, fragile objects)"),
+}
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
+# Prompts behind detect_objects(), describe_scene() and navigate_assistance()
+DETECT_PROMPT = "List all objects you can see in this image. Be specific and detailed."
+DESCRIBE_PROMPT = "Describe this scene in detail, including objects, colors, layout, and any notable features."
+NAVIGATE_PROMPT = """Analyze this image for robot navigation:
+1. Identify obstacles and their positions (left, center, right)
+2. Estimate distances if possible
+3. Suggest safe movement directions
+4. Warn about hazards (stairs, edges, fragile objects)
+Be concise and actionable."""
+
+# Placeholder for the base64 image in a serialized request body; the body is
+# split on it once per prompt and the image is spliced in between per call
+_IMAGE_SENTINEL = "\x00image\x00"
+_IMAGE_SENTINEL_JSON = orjson.dumps(_IMAGE_SENTINEL)[1:-1]
+
+# Content-Type for serialized bodies; the async session only carries auth
+# since multipart uploads need their own boundary header
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Distinct (model, prompt, max_tokens, temperature) request bodies kept
+# pre-serialized
+BODY_TEMPLATE_CACHE_SIZE = 64
+
+# Keep-alive connections to the gateway, shared by every VLMClient in the
+# process so TCP/TLS setup is paid once rather than per client. Gateway
+# errors (model still loading, upstream restart) are retried on the warm
+# pool with a short backoff instead of surfacing to the caller. Read timeouts
+# are not retried: a hung model would otherwise cost several timeouts.
+HTTP_POOL_SIZE = 8
+HTTP_RETRY = Retry(
+    total=3,
+    read=False,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False  # last response goes to raise_for_status()
+)
+_SHARED_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+_SHARED_SESSION.mount("http://", _ADAPTER)
+_SHARED_SESSION.mount("https://", _ADAPTER)
+
+# Seconds to establish a connection, and default seconds to wait for a
+# response (a hung model shouldn't hold a pool slot forever)
+HTTP_CONNECT_TIMEOUT = 5.0
+REQUEST_TIMEOUT = 60.0
+
+# Circuit breaker: once more than CIRCUIT_FAILURE_RATE of the last
+# CIRCUIT_WINDOW requests (at least CIRCUIT_MIN_CALLS) failed, calls fail
+# fast with CircuitOpen for CIRCUIT_COOLDOWN seconds instead of queueing
+# behind an unhealthy gateway
+CIRCUIT_WINDOW = 20
+CIRCUIT_MIN_CALLS = 5
+CIRCUIT_FAILURE_RATE = 0.5
+CIRCUIT_COOLDOWN = 5.0  # seconds
+
+# HTTP/2 connections kept by the shared client (each carries many streams)
+HTTP2_MAX_CONNECTIONS = 16
+
+
+@functools.lru_cache(maxsize=1)
+def _http2_client() -> "httpx.Client":
+    """Process-wide HTTP/2 client, created on first use (like _SHARED_SESSION)."""
+    return httpx.Client(
+        http2=True,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=HTTP2_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP2_MAX_CONNECTIONS
+        )
+    )
+
+
+# AsyncVLMClient: requests in flight at once, and the micro-batching window
+# in which submit() calls are collected and sent together
+ASYNC_MAX_CONCURRENCY = 8
+ASYNC_BATCH_MAX = 8
+ASYNC_BATCH_WINDOW = 0.02  # seconds
+
+# Client-side response cache for temperature 0 requests (sampled answers
+# are never replayed): "exact" reuses a response for byte-identical images,
+# "phash" also for images within CACHE_DHASH_DISTANCE dHash bits (a still
+# camera's sensor noise), "off" always asks the model
+CACHE_MODES = ("exact", "phash", "off")
+RESPONSE_CACHE_SIZE = 256
+CACHE_DHASH_DISTANCE = 4
+CACHE_DHASH_RING = 32  # recent image hashes checked for near-duplicates
+
+# Optional second cache tier on disk (pass disk_cache_dir=DISK_CACHE_DIR),
+# so warm answers survive restarts. Stores raw response bodies by content
+# key; exact matches of deterministic (temperature 0) requests only, so
+# sampled answers aren't replayed across runs.
+DISK_CACHE_DIR = os.path.expanduser("~/.cache/vlm_client")
+DISK_CACHE_MAX_BYTES = 2 ** 30
+
+
+# .env is read into the environment once per process, not per client
+_ENV_LOADED = False
+
+
+def _ensure_env():
+    """Load .env the first time a client is created."""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
+
+
+def _dhash(image: Union[Image.Image, np.ndarray]) -> int:
+    """
+    64-bit difference hash of an image (9x8 grayscale, horizontal gradients).
+
+    Args:
+        image: PIL Image or RGB numpy array
+
+    Returns:
+        Hash as an int; similar images differ in few bits
+    """
+    if isinstance(image, np.ndarray) and (image.shape[0] < 8 or image.shape[1] < 9):
+        image = Image.fromarray(image)  # smaller than the grid
+
+    if isinstance(image, np.ndarray):
+        if cv2 is not None:
+            small = cv2.resize(cv2.cvtColor(image, cv2.COLOR_RGB2GRAY), (9, 8), interpolation=cv2.INTER_AREA)
+        else:
+            # Block means over a 9x8 grid with two reduceat passes, on a
+            # strided view (~64 rows) since only the block averages matter
+            step = max(1, image.shape[0] // 64)
+            image = image[::step, ::step]
+            h, w = image.shape[:2]
+            rows = np.linspace(0, h, 9).astype(np.intp)
+            cols = np.linspace(0, w, 10).astype(np.intp)
+            gray = image.sum(axis=2, dtype=np.uint32)
+            sums = np.add.reduceat(np.add.reduceat(gray, rows[:-1], axis=0), cols[:-1], axis=1)
+            small = sums / (3 * np.outer(np.diff(rows), np.diff(cols)))
+    else:
+        small = np.asarray(image.convert("L").resize((9, 8), Image.BILINEAR), dtype=np.int16)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def _popcount64(values: np.ndarray) -> np.ndarray:
+    """Set bits in each element of a uint64 array."""
+    return np.unpackbits(values.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+
+
+class CircuitOpen(RuntimeError):
+    """Raised instead of calling a gateway that has been failing."""
+
+
+class _CircuitBreaker:
+    """Failure-rate circuit breaker over a sliding window of request outcomes."""
+
+    def __init__(self):
+        self._outcomes = deque(maxlen=CIRCUIT_WINDOW)  # True = failed
+        self._open_until = 0.0  # monotonic
+        self._lock = threading.Lock()
+
+    def check(self):
+        """
+        Fail fast while the circuit is open.
+
+        Raises:
+            CircuitOpen: If the cooldown hasn't elapsed
+        """
+        with self._lock:
+            remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpen(f"VLM gateway failing, retry in {remaining:.1f}s")
+
+    def record(self, failed: bool, count: int = 1):
+        """Record count request attempts' outcome, opening the circuit if needed."""
+        with self._lock:
+            self._outcomes.extend([failed] * count)
+            n = len(self._outcomes)
+            if n >= CIRCUIT_MIN_CALLS and sum(self._outcomes) > CIRCUIT_FAILURE_RATE * n:
+                self._open_until = time.monotonic() + CIRCUIT_COOLDOWN
+                # Start the next window fresh so the first calls after the
+                # cooldown decide whether the gateway has recovered
+                self._outcomes.clear()
+
+
+class _DiskCache:
+    """
+    Size-bounded sqlite store of raw response bodies, least recently used
+    evicted first.
+
+    Best effort: a disk that is full, locked or read-only only costs misses.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DISK_CACHE_MAX_BYTES):
+        os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(directory, "responses.sqlite3"),
+            check_same_thread=False,
+            isolation_level=None  # autocommit
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key BLOB PRIMARY KEY, body BLOB NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._size = self._db.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Stored body for key, or None."""
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error:
+            return None
+        return row[0]
+
+    def put(self, key: bytes, body: bytes):
+        """Store body under key, evicting old entries past max_bytes."""
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, body, time.time())
+                )
+                self._size += len(body)
+                if self._size > self.max_bytes:
+                    self._evict()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self):
+        """Delete least recently used rows until under max_bytes (lock held)."""
+        # Other processes share the file, so recount rather than trust _size
+        size_query = "SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+        self._size = self._db.execute(size_query).fetchone()[0]
+        while self._size > self.max_bytes:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed LIMIT 64)"
+            )
+            self._size = self._db.execute(size_query).fetchone()[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _disk_cache(directory: str) -> Optional[_DiskCache]:
+    """Process-wide disk cache for a directory (None if it can't be opened)."""
+    try:
+        return _DiskCache(directory)
+    except (OSError, sqlite3.Error):
+        return None
+
 
 class VLMClient:
     """Client for interacting with VLM via LiteLLM Gateway."""
@@ -18,7 +326,15 @@ class VLMClient:
         self,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        encode_quality: int = JPEG_QUALITY,
+        use_multipart: bool = False,
+        multipart_url: Optional[str] = None,
+        cache_mode: str = "exact",
+        max_image_edge: Optional[int] = MAX_IMAGE_EDGE,
+        http2: bool = False,
+        request_timeout: float = REQUEST_TIMEOUT,
+        disk_cache_dir: Optional[str] = None
     ):
         """
         Initialize VLM client.
@@ -27,55 +343,276 @@ class VLMClient:
             base_url: LiteLLM gateway base URL
             api_key: API key for authentication
             model: Vision model to use
+            encode_quality: JPEG quality (1-100) for PIL images and arrays
+            use_multipart: Upload the raw image as multipart/form-data
+                instead of base64 inside the JSON body (the gateway must
+                accept it)
+            multipart_url: Multipart endpoint (default: the chat completions URL)
+            cache_mode: Response cache mode, one of CACHE_MODES
+            max_image_edge: Longest image side sent; larger images are
+                downscaled first (None sends them at full size)
+            http2: Send requests over HTTP/2 when httpx[http2] is installed
+                and the gateway is https:// (otherwise the pooled requests
+                session, with its HTTP_RETRY policy, is used). The HTTP/2
+                path does not retry gateway errors
+            request_timeout: Seconds to wait for a response
+            disk_cache_dir: Directory of the persistent response cache,
+                e.g. DISK_CACHE_DIR (None: memory only). Only temperature 0
+                responses are persisted
         """
-        load_dotenv()
+        _ensure_env()
 
         self.base_url = base_url or os.getenv("LITELLM_BASE_URL")
         self.api_key = api_key or os.getenv("LITELLM_API_KEY")
         self.model = model or os.getenv("VISION_MODEL", "llama3.2-vision:90b-instruct-q4_K_M")
+        self.encode_quality = encode_quality
+        self.max_image_edge = max_image_edge
 
         if not self.base_url:
             raise ValueError("LITELLM_BASE_URL must be set in .env or provided")
         if not self.api_key:
             raise ValueError("LITELLM_API_KEY must be set in .env or provided")
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        })
+        self.endpoint = f"{self.base_url.rstrip('/')}/chat/completions"
+        self.use_multipart = use_multipart
+        self.multipart_url = multipart_url or self.endpoint
+
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(f"cache_mode must be one of {CACHE_MODES}, got {cache_mode!r}")
+        self.cache_mode = cache_mode
+        # (request params, image digest) -> response, LRU order
+        self._response_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # dHashes of the last CACHE_DHASH_RING cached images ("phash" mode)
+        # and the cache key each was stored under, compared in one pass
+        self._hash_ring = np.zeros(CACHE_DHASH_RING, dtype=np.uint64)
+        self._hash_ring_keys: List[Optional[Tuple]] = [None] * CACHE_DHASH_RING
+        self._hash_ring_pos = 0
+        # Persistent second tier, consulted on a memory miss
+        self._disk = _disk_cache(disk_cache_dir) if disk_cache_dir and cache_mode != "off" else None
+
+        # Last encoded ndarray frame: content digest, JPEG, and its base64
+        # (filled in when first needed)
+        # per-thread reusable BytesIO and last-frame (key, jpeg, b64) memo
+        self._jpeg_local = threading.local()
 
-    def encode_image(self, image_source: Union[str, Path, bytes, Image.Image]) -> str:
+        # Auth is per client, so headers go on each request rather than on
+        # the shared session
+        self.session = _SHARED_SESSION
+        self.http2 = http2 and httpx is not None
+        self.request_timeout = request_timeout
+        self._breaker = _CircuitBreaker()
+        self.auth_headers = {"Authorization": f"Bearer {self.api_key}"}
+        self.headers = {**self.auth_headers, **_JSON_HEADERS}
+
+    def encode_image(self, image_source: ImageSource) -> str:
         """
         Encode image to base64 string.
 
         Args:
-            image_source: Image file path, bytes, or PIL Image
+            image_source: Image file path, bytes, PIL Image, or RGB numpy array
 
         Returns:
             Base64 encoded image string
         """
+        return self._image_b64(image_source).decode("ascii")
+
+    def _image_b64(self, image_source: ImageSource) -> bytes:
+        """
+        Base64 encode an image, as bytes.
+
+        Request bodies are assembled from this directly, so the base64 never
+        becomes a str (which would be another full-size copy).
+        """
+        if isinstance(image_source, (str, Path, bytes)):
+            # Oversized files are decoded, downscaled and re-encoded
+            image = self._open_oversized(image_source)
+            if image is not None:
+                image_source = image
+
         if isinstance(image_source, (str, Path)):
-            # Load from file path
+            # Encode straight from a file mapping instead of reading the
+            # file into a bytes object first
             with open(image_source, "rb") as img_file:
-                return base64.b64encode(img_file.read()).decode("utf-8")
+                if os.fstat(img_file.fileno()).st_size == 0:
+                    return b""
+                with mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    return base64.b64encode(view)
+
+        elif isinstance(image_source, np.ndarray):
+            return self._encode_frame(image_source)
+
+        elif isinstance(image_source, Image.Image) and cv2 is None and not self._is_source_jpeg(image_source):
+            # Base64 straight from the reused buffer: no getvalue() copy
+            with self._save_jpeg(self._fit_image(image_source)).getbuffer() as view:
+                return base64.b64encode(view)
+
+        return base64.b64encode(self.image_bytes(image_source))
+
+    def image_bytes(self, image_source: ImageSource) -> bytes:
+        """
+        Get the raw bytes to upload for an image (file contents or JPEG).
+
+        Args:
+            image_source: Image file path, bytes, PIL Image, or RGB numpy array
+
+        Returns:
+            Image bytes
+        """
+        if isinstance(image_source, (str, Path, bytes)):
+            image = self._open_oversized(image_source)
+            if image is not None:
+                image_source = image
+
+        if isinstance(image_source, (str, Path)):
+            # Load from file path
+            return Path(image_source).read_bytes()
 
         elif isinstance(image_source, bytes):
             # Already bytes
-            return base64.b64encode(image_source).decode("utf-8")
+            return image_source
 
         elif isinstance(image_source, Image.Image):
             # PIL Image
-            buffer = io.BytesIO()
-            image_source.save(buffer, format="JPEG")
-            return base64.b64encode(buffer.getvalue()).decode("utf-8")
+            if self._is_source_jpeg(image_source):
+                # Opened from a JPEG and never decoded: send the file as-is
+                # instead of a decode + re-encode round trip
+                fp = image_source.fp
+                pos = fp.tell()
+                fp.seek(0)
+                data = fp.read()
+                fp.seek(pos)
+                return data
+            image_source = self._fit_image(image_source)
+            if cv2 is not None:
+                return self._encode_jpeg(np.asarray(image_source.convert("RGB")))
+            return self._save_jpeg(image_source).getvalue()
+
+        elif isinstance(image_source, np.ndarray):
+            return self._frame_jpeg(image_source)
 
         else:
             raise TypeError(f"Unsupported image source type: {type(image_source)}")
 
+    def _frame_jpeg(self, frame: np.ndarray) -> bytes:
+        """
+        JPEG encode an RGB frame, reusing the calling thread's last result
+        for an identical frame.
+        """
+        return self._frame_memo(frame)[1]
+
+    def _frame_memo(self, frame: np.ndarray) -> list:
+        """Return the calling thread's [key, jpeg, b64] memo for a frame."""
+        key = hashlib.blake2b(np.ascontiguousarray(frame), digest_size=16).digest()
+        memo = getattr(self._jpeg_local, "frame", None)
+        if memo is not None and memo[0] == key:
+            return memo
+
+        size = self._fit_size(frame.shape[1], frame.shape[0])
+        if cv2 is not None:
+            if size is not None:
+                frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            data = self._encode_jpeg(frame)
+        else:
+            image = Image.fromarray(frame)
+            if size is not None:
+                image = image.resize(size, Image.Resampling.LANCZOS)
+            data = self._save_jpeg(image).getvalue()
+
+        memo = self._jpeg_local.frame = [key, data, None]
+        return memo
+
+    def _encode_frame(self, frame: np.ndarray) -> bytes:
+        """JPEG+base64 encode an RGB frame (cached like _frame_jpeg)."""
+        memo = self._frame_memo(frame)
+        b64 = memo[2]
+        if b64 is None:
+            b64 = memo[2] = base64.b64encode(memo[1])
+        return b64
+
+    def _is_source_jpeg(self, image: Image.Image) -> bool:
+        """
+        Check whether a PIL image is still exactly its source JPEG file.
+
+        Image.open() only parses the header; until the pixels are loaded
+        (which any edit does) the open file holds the image as-is. A draft()
+        changes the decoded size, so drafted images don't qualify.
+        """
+        return (
+            image.format == "JPEG"
+            and image.fp is not None
+            and bool(image.tile)
+            and not image.decoderconfig
+            and self._fit_size(*image.size) is None
+        )
+
+    def _fit_size(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """Size to downscale a width x height image to, or None if it fits max_image_edge."""
+        edge = self.max_image_edge
+        longest = max(width, height)
+        if edge is None or longest <= edge:
+            return None
+        scale = edge / longest
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def _fit_image(self, image: Image.Image) -> Image.Image:
+        """Downscaled copy of an oversized PIL image (the image itself if it fits)."""
+        size = self._fit_size(*image.size)
+        if size is None:
+            return image
+        return image.resize(size, Image.Resampling.LANCZOS)
+
+    def _open_oversized(self, image_source: Union[str, Path, bytes]) -> Optional[Image.Image]:
+        """
+        Decode an image file/bytes that exceeds max_image_edge, downscaled.
+
+        Only the header is read for images that fit (returns None, and the
+        original bytes are sent as-is). For JPEGs, thumbnail() has libjpeg
+        decode at 1/2, 1/4 or 1/8 scale directly, so the full-size image is
+        never decompressed.
+        """
+        if self.max_image_edge is None:
+            return None
+        try:
+            image = Image.open(io.BytesIO(image_source) if isinstance(image_source, bytes) else image_source)
+        except Image.UnidentifiedImageError:
+            return None
+        if self._fit_size(*image.size) is None:
+            image.close()
+            return None
+        image.thumbnail((self.max_image_edge, self.max_image_edge), Image.Resampling.LANCZOS)
+        return image
+
+    def _save_jpeg(self, image: Image.Image) -> io.BytesIO:
+        """
+        JPEG encode with Pillow into this thread's reusable buffer.
+
+        The buffer is overwritten by the next call on the same thread, so
+        callers copy or consume it (and release any getbuffer() view) first.
+        """
+        buffer = getattr(self._jpeg_local, "buf", None)
+        if buffer is None:
+            buffer = self._jpeg_local.buf = io.BytesIO()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+        # optimize=True would add a second Huffman pass for a few % of size
+        image.save(buffer, format="JPEG", quality=self.encode_quality, optimize=False)
+        return buffer
+
+    def _encode_jpeg(self, rgb: np.ndarray) -> bytes:
+        """JPEG encode an RGB array with OpenCV (libjpeg directly, no BytesIO)."""
+        ok, jpeg = cv2.imencode(
+            ".jpg", cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR),
+            [cv2.IMWRITE_JPEG_QUALITY, self.encode_quality]
+        )
+        if not ok:
+            raise ValueError("JPEG encoding failed")
+        return jpeg.tobytes()
+
     def analyze_image(
         self,
-        image_source: Union[str, Path, bytes, Image.Image],
+        image_source: ImageSource,
         prompt: str,
         max_tokens: int = 1000,
         temperature: float = 0.7
@@ -84,7 +621,7 @@ class VLMClient:
         Analyze an image with a text prompt.
 
         Args:
-            image_source: Image to analyze (file path, bytes, or PIL Image)
+            image_source: Image to analyze (file path, bytes, PIL Image, or RGB array)
             prompt: Text prompt describing what to analyze
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature (0.0-1.0)
@@ -92,12 +629,235 @@ class VLMClient:
         Returns:
             API response dictionary with analysis results
         """
-        # Encode image
-        image_b64 = self.encode_image(image_source)
+        entry, image_source, cached = self._cached_response(image_source, prompt, max_tokens, temperature)
+        if cached is not None:
+            return cached
 
-        # Prepare request payload (OpenAI-compatible format)
-        payload = {
+        if self.use_multipart:
+            # Raw image part: no base64 inflation or JSON escaping
+            response = self._post(
+                self.multipart_url,
+                self.auth_headers,
+                files={"image": ("frame.jpg", self.image_bytes(image_source), "image/jpeg")},
+                data=self._multipart_fields(prompt, max_tokens, temperature)
+            )
+        else:
+            body = self._build_body(image_source, prompt, max_tokens, temperature)
+
+            # Make API request
+            response = self._post(self.endpoint, self.headers, data=body)
+        response.raise_for_status()
+
+        result = orjson.loads(response.content)
+        self._cache_response(entry, result, response.content)
+        return result
+
+    def _post(self, url: str, headers: Dict[str, str], **kwargs):
+        """
+        POST over HTTP/2 when enabled, else the pooled requests session.
+
+        Args:
+            url: Request URL
+            headers: Request headers
+            **kwargs: requests-style body arguments (data=, files=)
+
+        Returns:
+            Response (requests or httpx; both have raise_for_status() and .content)
+
+        Raises:
+            CircuitOpen: If recent requests have mostly failed
+        """
+        self._breaker.check()
+        try:
+            if not self.http2:
+                response = self.session.post(
+                    url, headers=headers, timeout=(HTTP_CONNECT_TIMEOUT, self.request_timeout), **kwargs
+                )
+            else:
+                if "files" not in kwargs:
+                    kwargs["content"] = kwargs.pop("data")  # httpx takes raw bodies as content=
+                response = _http2_client().post(
+                    url, headers=headers,
+                    timeout=httpx.Timeout(self.request_timeout, connect=HTTP_CONNECT_TIMEOUT), **kwargs
+                )
+        except Exception as e:
+            self._record_error(e)
+            raise
+        self._record_response(response)
+        return response
+
+    def _record_response(self, response):
+        """Record a response, and the retried attempts behind it, with the breaker."""
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        if retries is not None and retries.history:
+            # Each retried attempt was a connect error or a 502/503/504
+            self._breaker.record(True, len(retries.history))
+        # Server errors count against the gateway; 4xx are the caller's
+        self._breaker.record(response.status_code >= 500)
+
+    def _record_error(self, error: Exception):
+        """Record a failed request with the breaker."""
+        # requests wraps urllib3's MaxRetryError: every attempt failed
+        exhausted = (
+            isinstance(error, requests.RequestException)
+            and bool(error.args) and isinstance(error.args[0], MaxRetryError)
+        )
+        self._breaker.record(True, HTTP_RETRY.total + 1 if exhausted else 1)
+
+    def _cached_response(
+        self,
+        image_source: ImageSource,
+        prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> Tuple[Optional[Tuple], ImageSource, Optional[Dict[str, Any]]]:
+        """
+        Look a request up in the response cache.
+
+        Only temperature 0 requests are cached; sampled ones always go to
+        the model.
+
+        Args:
+            image_source: Image to analyze
+            prompt: Analysis prompt
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+
+        Returns:
+            Tuple of (cache entry to pass to _cache_response(), the image to
+            upload, cached response or None). With caching on, the image is
+            returned as the bytes that were hashed, so it isn't encoded twice.
+        """
+        if self.cache_mode == "off" or temperature != 0:
+            return None, image_source, None
+
+        image_hash = _dhash(self._hash_image(image_source)) if self.cache_mode == "phash" else None
+        data = self.image_bytes(image_source)
+        params = (self.model, prompt, max_tokens, temperature)
+        key = (params, hashlib.sha256(data).digest())
+
+        with self._cache_lock:
+            response = self._response_cache.get(key)
+            if response is not None:
+                self._response_cache.move_to_end(key)
+                return None, data, response
+
+            if image_hash is not None:
+                # Near-duplicates: closest recent hash first
+                distances = _popcount64(self._hash_ring ^ np.uint64(image_hash))
+                close = np.flatnonzero(distances <= CACHE_DHASH_DISTANCE)
+                for i in close[np.argsort(distances[close], kind="stable")]:
+                    ring_key = self._hash_ring_keys[i]
+                    if ring_key is not None and ring_key[0] == params:
+                        response = self._response_cache.get(ring_key)
+                        if response is not None:
+                            return None, data, response
+
+        if self._disk is not None:
+            body = self._disk.get(self._disk_key(key))
+            if body is not None:
+                response = orjson.loads(body)
+                self._remember(key, image_hash, response)
+                return None, data, response
+
+        return (key, image_hash), data, None
+
+    def _cache_response(
+        self,
+        entry: Optional[Tuple],
+        response: Dict[str, Any],
+        raw: Optional[bytes] = None
+    ):
+        """
+        Store a response under the entry from _cached_response().
+
+        Args:
+            entry: Cache entry (None: not cached)
+            response: Parsed response
+            raw: Response body as received (default: response re-serialized)
+        """
+        if entry is None:
+            return
+        key, image_hash = entry
+        self._remember(key, image_hash, response)
+        if self._disk is not None:
+            self._disk.put(self._disk_key(key), raw if raw is not None else orjson.dumps(response))
+
+    @staticmethod
+    def _disk_key(key: Tuple) -> bytes:
+        """Content digest of a memory cache key, for the disk tier."""
+        params, image_digest = key
+        return hashlib.sha256(orjson.dumps(params) + image_digest).digest()
+
+    def _remember(self, key: Tuple, image_hash: Optional[int], response: Dict[str, Any]):
+        """Store a response in the memory tier (and its dHash in the ring)."""
+        with self._cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+            if image_hash is not None:
+                pos = self._hash_ring_pos
+                self._hash_ring[pos] = image_hash
+                self._hash_ring_keys[pos] = key
+                self._hash_ring_pos = (pos + 1) % CACHE_DHASH_RING
+
+    @staticmethod
+    def _hash_image(image_source: ImageSource) -> Union[Image.Image, np.ndarray]:
+        """Decoded image for dHashing (files and bytes are opened lazily)."""
+        if not isinstance(image_source, (str, Path, bytes)):
+            return image_source
+        image = Image.open(io.BytesIO(image_source) if isinstance(image_source, bytes) else image_source)
+        # Let libjpeg decode at reduced scale; only 9x8 pixels survive
+        image.draft("L", (64, 64))
+        return image
+
+    def _multipart_fields(self, prompt: str, max_tokens: int, temperature: float) -> Dict[str, str]:
+        """Form fields sent alongside the image part of a multipart request."""
+        return {
             "model": self.model,
+            "prompt": prompt,
+            "max_tokens": str(max_tokens),
+            "temperature": str(temperature)
+        }
+
+    def _build_body(
+        self,
+        image_source: ImageSource,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        stream: bool = False
+    ) -> bytes:
+        """Encode the image and build a serialized OpenAI-compatible chat request."""
+        prefix, suffix = self._body_template(self.model, prompt, max_tokens, temperature, stream)
+        return b"".join((prefix, self._image_b64(image_source), suffix))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=BODY_TEMPLATE_CACHE_SIZE)
+    def _body_template(
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        stream: bool = False
+    ) -> Tuple[bytes, bytes]:
+        """
+        Serialize a chat request once, split around the image.
+
+        Args:
+            model: Vision model
+            prompt: Text prompt
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            stream: Ask for an SSE stream of deltas
+
+        Returns:
+            (prefix, suffix) bytes; the base64 image goes between them
+        """
+        payload = {
+            "model": model,
             "messages": [
                 {
                     "role": "user",
@@ -109,7 +869,7 @@ class VLMClient:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{image_b64}"
+                                "url": f"data:image/jpeg;base64,{_IMAGE_SENTINEL}"
                             }
                         }
                     ]
@@ -118,18 +878,16 @@ class VLMClient:
             "max_tokens": max_tokens,
             "temperature": temperature
         }
-
-        # Make API request
-        endpoint = f"{self.base_url.rstrip('/')}/chat/completions"
-        response = self.session.post(endpoint, json=payload)
-        response.raise_for_status()
-
-        return response.json()
+        if stream:
+            payload["stream"] = True
+        prefix, suffix = orjson.dumps(payload).split(_IMAGE_SENTINEL_JSON)
+        return prefix, suffix
 
     def get_text_response(
         self,
-        image_source: Union[str, Path, bytes, Image.Image],
+        image_source: ImageSource,
         prompt: str,
+        stream: bool = False,
         **kwargs
     ) -> str:
         """
@@ -138,14 +896,20 @@ class VLMClient:
         Args:
             image_source: Image to analyze
             prompt: Analysis prompt
+            stream: Receive the answer as an SSE stream (see stream_text())
             **kwargs: Additional arguments for analyze_image()
 
         Returns:
             Text response from VLM
         """
-        result = self.analyze_image(image_source, prompt, **kwargs)
+        if stream:
+            return "".join(self.stream_text(image_source, prompt, **kwargs))
+
+        return self._response_text(self.analyze_image(image_source, prompt, **kwargs))
 
-        # Extract text from OpenAI-compatible response format
+    @staticmethod
+    def _response_text(result: Dict[str, Any]) -> str:
+        """Extract text from OpenAI-compatible response format."""
         if "choices" in result and len(result["choices"]) > 0:
             choice = result["choices"][0]
             if "message" in choice and "content" in choice["message"]:
@@ -153,9 +917,114 @@ class VLMClient:
 
         raise ValueError(f"Unexpected response format: {result}")
 
+    def stream_text(
+        self,
+        image_source: ImageSource,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> Iterator[str]:
+        """
+        Stream the text response as the model generates it.
+
+        Uses OpenAI-style server-sent events, so callers can act on the
+        first tokens while the model is still generating. Always sends a
+        JSON body (use_multipart is ignored). The full answer is added to
+        the response cache once the stream ends.
+
+        Args:
+            image_source: Image to analyze
+            prompt: Analysis prompt
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature (0.0-1.0)
+
+        Yields:
+            Text deltas, in order
+        """
+        entry, image_source, cached = self._cached_response(image_source, prompt, max_tokens, temperature)
+        if cached is not None:
+            yield self._response_text(cached)
+            return
+
+        body = self._build_body(image_source, prompt, max_tokens, temperature, stream=True)
+        parts = []
+        self._breaker.check()
+        try:
+            response = self.session.post(
+                self.endpoint, data=body, headers=self.headers, stream=True,
+                timeout=(HTTP_CONNECT_TIMEOUT, self.request_timeout)
+            )
+        except Exception as e:
+            self._record_error(e)
+            raise
+        self._record_response(response)
+
+        with response:
+            response.raise_for_status()
+            # Read to the end of the stream (past [DONE]) so the connection
+            # goes back to the pool
+            for line in response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    continue
+                choices = orjson.loads(data).get("choices")
+                delta = choices[0].get("delta", {}).get("content") if choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+        self._cache_response(entry, {"choices": [{"message": {"role": "assistant", "content": "".join(parts)}}]})
+
+    def analyze(
+        self,
+        image_source: ImageSource,
+        tasks: Tuple[str, ...] = ("detect", "navigate"),
+        max_tokens: int = 1000
+    ) -> Dict[str, str]:
+        """
+        Answer several analysis tasks about one image in a single request.
+
+        The image is encoded and run through the vision encoder once instead
+        of once per task.
+
+        Args:
+            image_source: Image to analyze
+            tasks: Keys of ANALYSIS_TASKS to answer
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Dict mapping each task's JSON key (e.g. "objects", "navigation")
+            to its text answer
+        """
+        fields = [ANALYSIS_TASKS[task] for task in tasks]
+        prompt = (
+            "Analyze this image and respond with a JSON object with these string fields:\n"
+            + "\n".join(f'- "{key}": {instruction}' for key, instruction in fields)
+            + "\nBe concise and actionable."
+        )
+
+        content = self.get_text_response(image_source, prompt, max_tokens=max_tokens)
+
+        try:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            match = _FENCE_RE.search(content)
+            try:
+                data = orjson.loads(match.group(1)) if match else None
+            except orjson.JSONDecodeError:
+                data = None
+
+        if not isinstance(data, dict):
+            # Model ignored the format; every task gets the raw answer
+            return {key: content for key, _ in fields}
+
+        return {key: str(data.get(key, "")) for key, _ in fields}
+
     def detect_objects(
         self,
-        image_source: Union[str, Path, bytes, Image.Image]
+        image_source: ImageSource
     ) -> str:
         """
         Detect and describe objects in an image.
@@ -166,12 +1035,11 @@ class VLMClient:
         Returns:
             Description of detected objects
         """
-        prompt = "List all objects you can see in this image. Be specific and detailed."
-        return self.get_text_response(image_source, prompt)
+        return self.get_text_response(image_source, DETECT_PROMPT)
 
     def describe_scene(
         self,
-        image_source: Union[str, Path, bytes, Image.Image]
+        image_source: ImageSource
     ) -> str:
         """
         Get a detailed description of the scene.
@@ -182,12 +1050,11 @@ class VLMClient:
         Returns:
             Scene description
         """
-        prompt = "Describe this scene in detail, including objects, colors, layout, and any notable features."
-        return self.get_text_response(image_source, prompt)
+        return self.get_text_response(image_source, DESCRIBE_PROMPT)
 
     def navigate_assistance(
         self,
-        image_source: Union[str, Path, bytes, Image.Image]
+        image_source: ImageSource
     ) -> str:
         """
         Get navigation assistance from image (for robot movement).
@@ -198,17 +1065,10 @@ class VLMClient:
         Returns:
             Navigation guidance
         """
-        prompt = """Analyze this image for robot navigation:
-1. Identify obstacles and their positions (left, center, right)
-2. Estimate distances if possible
-3. Suggest safe movement directions
-4. Warn about hazards (stairs, edges, fragile objects)
-Be concise and actionable."""
-        return self.get_text_response(image_source, prompt, max_tokens=500)
+        return self.get_text_response(image_source, NAVIGATE_PROMPT, max_tokens=500)
 
     def close(self):
-        """Close the HTTP session."""
-        self.session.close()
+        """Release the client; the pooled session is shared and stays open."""
 
     def __enter__(self):
         """Context manager entry."""
@@ -217,3 +1077,349 @@ Be concise and actionable."""
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+class AsyncVLMClient:
+    """
+    Async client for sending many VLM requests concurrently.
+
+    Shares configuration and image encoding with VLMClient; requests go out
+    over one pooled aiohttp session (or one HTTP/2 httpx client), at most
+    max_concurrency at a time.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        encode_quality: int = JPEG_QUALITY,
+        use_multipart: bool = False,
+        multipart_url: Optional[str] = None,
+        cache_mode: str = "exact",
+        max_image_edge: Optional[int] = MAX_IMAGE_EDGE,
+        http2: bool = False,
+        request_timeout: float = REQUEST_TIMEOUT,
+        disk_cache_dir: Optional[str] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        batch_max: int = ASYNC_BATCH_MAX,
+        batch_window: float = ASYNC_BATCH_WINDOW
+    ):
+        """
+        Initialize async VLM client.
+
+        Args:
+            base_url: LiteLLM gateway base URL
+            api_key: API key for authentication
+            model: Vision model to use
+            encode_quality: JPEG quality (1-100) for PIL images and arrays
+            use_multipart: Upload raw images as multipart/form-data
+            multipart_url: Multipart endpoint (default: the chat completions URL)
+            cache_mode: Response cache mode, one of CACHE_MODES
+            max_image_edge: Longest image side sent (None: full size)
+            http2: Multiplex requests over HTTP/2 when httpx[http2] is installed
+                (https:// gateways only; not retried)
+            request_timeout: Seconds to wait for a response
+            disk_cache_dir: Directory of the persistent response cache,
+                e.g. DISK_CACHE_DIR (None: memory only). Only temperature 0
+                responses are persisted
+            max_concurrency: Maximum requests in flight
+            batch_max: Most submit() requests dispatched together
+            batch_window: Seconds submit() waits for more requests to batch
+        """
+        self.client = VLMClient(
+            base_url, api_key, model, encode_quality, use_multipart, multipart_url,
+            cache_mode, max_image_edge, http2, request_timeout, disk_cache_dir
+        )
+        self.max_concurrency = max_concurrency
+        self.batch_max = batch_max
+        self.batch_window = batch_window
+
+        # Created on first use, on the caller's event loop
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._http2: Optional["httpx.AsyncClient"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Cache key -> task of the request currently fetching it
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batch_runs: Set[asyncio.Task] = set()  # dispatched, not yet resolved
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled HTTP session on first use (must run on the loop)."""
+        if self.session is None:
+            if self.client.http2:
+                self._http2 = httpx.AsyncClient(
+                    http2=True,
+                    headers=self.client.auth_headers,
+                    timeout=httpx.Timeout(self.client.request_timeout, connect=HTTP_CONNECT_TIMEOUT),
+                    limits=httpx.Limits(max_connections=HTTP2_MAX_CONNECTIONS)
+                )
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.client.auth_headers,
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    connect=HTTP_CONNECT_TIMEOUT,
+                    sock_read=self.client.request_timeout
+                )
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def analyze_image(
+        self,
+        image_source: ImageSource,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7
+    ) -> Dict[str, Any]:
+        """
+        Analyze an image with a text prompt.
+
+        Concurrent calls for the same cacheable request share one HTTP
+        request; with cache_mode="off" or temperature > 0 every call is sent.
+
+        Args:
+            image_source: Image to analyze (file path, bytes, PIL Image, or RGB array)
+            prompt: Text prompt describing what to analyze
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature (0.0-1.0)
+
+        Returns:
+            API response dictionary with analysis results
+
+        Raises:
+            CircuitOpen: If recent requests have mostly failed
+        """
+        self._get_session()
+        client = self.client
+        # Encoding, hashing and the disk lookup are blocking work; keep
+        # them off the loop
+        entry, image_source, cached = await asyncio.to_thread(
+            client._cached_response, image_source, prompt, max_tokens, temperature
+        )
+        if cached is not None:
+            return cached
+        if entry is None:
+            return orjson.loads(await self._send(image_source, prompt, max_tokens, temperature))
+
+        # Share an identical request already in flight. The request runs in
+        # its own task, so one caller cancelling (e.g. a timeout) doesn't
+        # cancel it for the others.
+        key = entry[0]
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(entry, image_source, prompt, max_tokens, temperature))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._fetch_done, key))
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        entry: Tuple,
+        image_source: ImageSource,
+        prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """Send a cacheable request, then cache and return the parsed response."""
+        raw = await self._send(image_source, prompt, max_tokens, temperature)
+        result = orjson.loads(raw)
+        # Cached before the in-flight entry goes, so later callers hit it
+        await asyncio.to_thread(self.client._cache_response, entry, result, raw)
+        return result
+
+    def _fetch_done(self, key: Tuple, task: asyncio.Task):
+        """Drop a finished request from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved; every caller may have gone
+
+    async def _send(
+        self,
+        image_source: ImageSource,
+        prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> bytes:
+        """Send one analysis request and return the response body."""
+        session = self.session
+        client = self.client
+        if client.use_multipart:
+            image = await asyncio.to_thread(client.image_bytes, image_source)
+            fields = client._multipart_fields(prompt, max_tokens, temperature)
+            url, headers = client.multipart_url, None
+        else:
+            body = await asyncio.to_thread(client._build_body, image_source, prompt, max_tokens, temperature)
+            url, headers = client.endpoint, _JSON_HEADERS
+
+        async with self._semaphore:
+            client._breaker.check()
+            try:
+                if self._http2 is not None:
+                    if client.use_multipart:
+                        files = {"image": ("frame.jpg", image, "image/jpeg")}
+                        response = await self._http2.post(url, files=files, data=fields)
+                    else:
+                        response = await self._http2.post(url, content=body, headers=headers)
+                    status, content = response.status_code, response.content
+                else:
+                    if client.use_multipart:
+                        data = aiohttp.FormData(fields)
+                        data.add_field("image", image, content_type="image/jpeg", filename="frame.jpg")
+                    else:
+                        data = body
+                    async with session.post(url, data=data, headers=headers) as response:
+                        status, content = response.status, await response.read()
+            except Exception:
+                client._breaker.record(True)
+                raise
+            client._breaker.record(status >= 500)
+            response.raise_for_status()
+            return content
+
+    async def analyze_many(
+        self,
+        items: Dict[Hashable, Tuple[ImageSource, str]],
+        **kwargs
+    ) -> Dict[Hashable, Union[Dict[str, Any], BaseException]]:
+        """
+        Analyze several (image, prompt) pairs concurrently.
+
+        Args:
+            items: Caller-chosen ID -> (image, prompt)
+            **kwargs: Additional arguments for analyze_image()
+
+        Returns:
+            Dict mapping each ID to its API response, or to the exception
+            its request raised (one failure doesn't discard the rest)
+        """
+        ids = list(items)
+        results = await asyncio.gather(
+            *[self.analyze_image(*items[item_id], **kwargs) for item_id in ids],
+            return_exceptions=True
+        )
+        return dict(zip(ids, results))
+
+    async def submit(
+        self,
+        image_source: ImageSource,
+        prompt: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Analyze an image, batched with other submit() calls.
+
+        Requests arriving within batch_window of each other (up to
+        batch_max) are dispatched together, so independent callers' requests
+        reach the server at the same time.
+
+        Args:
+            image_source: Image to analyze
+            prompt: Analysis prompt
+            **kwargs: Additional arguments for analyze_image()
+
+        Returns:
+            API response dictionary with analysis results
+        """
+        if self._batch_task is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_worker())
+
+        future = asyncio.get_running_loop().create_future()
+        self._batch_queue.put_nowait((image_source, prompt, kwargs, future))
+        return await future
+
+    async def _batch_worker(self):
+        """Collect bursts of submit() requests and send them concurrently."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.batch_window
+
+            try:
+                while len(batch) < self.batch_max:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._batch_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                self._fail_pending(batch)
+                raise
+
+            # Don't block collection of the next batch on this one; keep a
+            # reference so the task isn't garbage-collected mid-flight
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_runs.add(task)
+            task.add_done_callback(self._batch_runs.discard)
+
+    async def _run_batch(self, batch: List[Tuple]):
+        """Issue a batch of submit() requests and resolve their futures."""
+        results = await asyncio.gather(
+            *[self.analyze_image(image_source, prompt, **kwargs)
+              for image_source, prompt, kwargs, _ in batch],
+            return_exceptions=True
+        )
+
+        for (_, _, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _fail_pending(batch: List[Tuple]):
+        """Fail submit() requests that will never be sent."""
+        for _, _, _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("AsyncVLMClient closed before the request was sent"))
+
+    async def close(self):
+        """Stop the batcher, finish dispatched batches, and close the HTTP session."""
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            try:
+                await self._batch_task
+            except asyncio.CancelledError:
+                pass
+            self._batch_task = None
+
+            # Requests still queued were never collected into a batch
+            queued = []
+            while not self._batch_queue.empty():
+                queued.append(self._batch_queue.get_nowait())
+            self._fail_pending(queued)
+
+        # Batches and shared requests already dispatched still need the sessions
+        pending = [*self._batch_runs, *self._inflight.values()]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self._http2 is not None:
+            await self._http2.aclose()
+            self._http2 = None
+        self.client.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,81 @@
+"""Tests for voice command intent parsing."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from audio_system import AudioSystemSimulator
+
+
+@pytest.fixture(scope="module")
+def audio():
+    """Create audio system without hardware."""
+    return AudioSystemSimulator()
+
+
+def reference_intent(text: str) -> str:
+    """The original if/elif classifier _parse_intent must agree with."""
+    text_lower = text.lower()
+
+    if any(word in text_lower for word in ['forward', 'ahead', 'go']):
+        return 'move_forward'
+    elif any(word in text_lower for word in ['back', 'backward', 'reverse']):
+        return 'move_backward'
+    elif 'left' in text_lower:
+        return 'turn_left'
+    elif 'right' in text_lower:
+        return 'turn_right'
+    elif any(word in text_lower for word in ['stop', 'halt', 'freeze']):
+        return 'stop'
+    elif any(word in text_lower for word in ['what do you see', 'describe', 'look']):
+        return 'describe_scene'
+    elif 'find' in text_lower or 'where is' in text_lower:
+        return 'find_object'
+    elif 'follow' in text_lower:
+        return 'follow_person'
+    elif 'navigate' in text_lower or 'go to' in text_lower:
+        return 'navigate_to'
+    elif 'battery' in text_lower or 'power' in text_lower:
+        return 'check_battery'
+    elif 'status' in text_lower:
+        return 'report_status'
+    return 'unknown'
+
+
+@pytest.mark.parametrize("text", [
+    "move forward",
+    "go ahead",
+    "move backwards to the left",
+    "stop going left",
+    "back up",
+    "reverse",
+    "turn left",
+    "turn right",
+    "right now, stop",
+    "stop",
+    "halt",
+    "Freeze!",
+    "what do you see",
+    "describe the room",
+    "look around",
+    "find my keys",
+    "where is the cup",
+    "follow me",
+    "navigate to the kitchen",
+    "take me to the door",
+    "battery level",
+    "how much power is left",
+    "status report",
+    "lookout on the left",
+    "stopwatch",
+    "undescribed",
+    "hello there",
+    "",
+])
+def test_parse_intent_matches_reference(audio, text):
+    """_parse_intent picks the same intent as the original classifier."""
+    assert audio._parse_intent(text) == reference_intent(text)
@@ -0,0 +1,49 @@
+"""Tests for VLM guidance action parsing."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vision_manager import VisionManager
+
+
+def reference_action(guidance: str) -> str:
+    """The original if/elif parser _parse_vlm_action must agree with."""
+    guidance_lower = guidance.lower()
+
+    if any(word in guidance_lower for word in ["stop", "halt", "danger", "unsafe"]):
+        return "STOP"
+    elif any(word in guidance_lower for word in ["left", "turn left"]):
+        return "LEFT"
+    elif any(word in guidance_lower for word in ["right", "turn right"]):
+        return "RIGHT"
+    elif any(word in guidance_lower for word in ["forward", "ahead", "straight"]):
+        return "FORWARD"
+    elif any(word in guidance_lower for word in ["back", "reverse"]):
+        return "BACKWARD"
+    return "ASSESS"
+
+
+@pytest.mark.parametrize("guidance, expected", [
+    ("Dangerous stairs ahead", "STOP"),
+    ("Halting is advised", "STOP"),
+    ("Unsafe to proceed", "STOP"),
+    ("Move backward", "BACKWARD"),
+    ("Back up slowly", "BACKWARD"),
+    ("Keep moving forwards", "FORWARD"),
+    ("Go straight ahead", "FORWARD"),
+    ("Turn left at the door", "LEFT"),
+    ("The path on the right is clear", "RIGHT"),
+    ("Stop, then turn right", "STOP"),
+    ("Clear path to the left, obstacle ahead", "LEFT"),
+    ("Nothing notable", "ASSESS"),
+    ("", "ASSESS"),
+])
+def test_parse_vlm_action(guidance, expected):
+    """Guidance maps to the action the original parser chose."""
+    assert VisionManager._parse_vlm_action(guidance) == expected
+    assert reference_action(guidance) == expected
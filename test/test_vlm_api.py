@@ -6,6 +6,7 @@ from pathlib import Path
 import base64
 import io
 
+import numpy as np
 import pytest
 from PIL import Image, ImageDraw, ImageFont
 
@@ -23,15 +24,20 @@ def vlm_client():
     client.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image():
-    """Create a simple test image."""
+    """Create a simple test image (once per session; don't modify it)."""
     # Create a 400x300 image with some shapes
-    img = Image.new('RGB', (400, 300), color='white')
+    arr = np.full((300, 400, 3), 255, np.uint8)
+
+    # Rectangle: black 2px outline around a red fill
+    arr[50:151, 50:151] = (0, 0, 0)
+    arr[52:149, 52:149] = (255, 0, 0)
+
+    img = Image.fromarray(arr)
     draw = ImageDraw.Draw(img)
 
-    # Draw some shapes
-    draw.rectangle([50, 50, 150, 150], fill='red', outline='black', width=2)
+    # Draw the remaining shapes
     draw.ellipse([200, 50, 300, 150], fill='blue', outline='black', width=2)
     draw.polygon([(100, 200), (150, 250), (50, 250)], fill='green', outline='black', width=2)
 
@@ -41,11 +47,11 @@ def sample_image():
     return img
 
 
-@pytest.fixture
-def sample_image_path(tmp_path, sample_image):
+@pytest.fixture(scope="session")
+def sample_image_path(tmp_path_factory, sample_image):
     """Save sample image to temporary file."""
-    img_path = tmp_path / "test_image.jpg"
-    sample_image.save(img_path)
+    img_path = tmp_path_factory.mktemp("images") / "test_image.jpg"
+    sample_image.save(img_path, quality=85, optimize=False)
     return img_path
 
 